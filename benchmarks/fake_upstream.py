@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INCIDENTS_PATH = re.compile(r'^/v1/pages/([^/]+)/incidents/unresolved$')
+GROUPS_PATH = re.compile(r'^/v1/pages/([^/]+)/component-groups$')
+PUSH_PATH = re.compile(r'^/v1/send/([^/]+)$')
+STAMP = '__UPDATED_AT__'
+
+
+def build_groups(count: int) -> list:
+    return [
+        {
+            'id': f'g{index:011d}',
+            'name': f'Platform {index}',
+            'description': None,
+            'position': index
+        }
+        for index in range(count)
+    ]
+
+
+def build_incidents(
+        count: int,
+        groups: int,
+        body_bytes: int,
+        maintenance_rate: float,
+        seed: int) -> list:
+    rng = random.Random(seed)
+    body = ('x' * body_bytes) if body_bytes > 0 else ''
+    incidents = []
+    for index in range(count):
+        group = rng.randrange(groups) if groups else None
+        impact = 'maintenance' if rng.random() < maintenance_rate else 'major'
+        incidents.append({
+            'id': f'i{index:011d}',
+            'name': f'Incident {index}',
+            'status': 'investigating',
+            'impact': impact,
+            'created_at': '2024-06-19T09:10:02Z',
+            'updated_at': STAMP if index == 0 else '2024-06-19T09:12:44Z',
+            'components': [{
+                'id': f'c{index:011d}',
+                'group_id': f'g{group:011d}' if group is not None else None,
+                'name': f'Product {index}',
+                'status': 'major_outage'
+            }],
+            'incident_updates': [{
+                'id': f'u{index:011d}',
+                'incident_id': f'i{index:011d}',
+                'body': body,
+                'status': 'investigating'
+            }]
+        })
+    return incidents
+
+
+class FakeUpstreamHandler(BaseHTTPRequestHandler):
+    server: 'FakeUpstream'
+    protocol_version = 'HTTP/1.1'
+
+    def _send(
+            self,
+            code: int,
+            body: bytes = b'',
+            headers: dict | None = None) -> None:
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _fail(self) -> bool:
+        code = self.server.next_error()
+        if not code:
+            return False
+        headers = {'Content-Type': 'text/html'}
+        if code == 429:
+            headers['Retry-After'] = '0'
+        self._send(code, b'<html>upstream error</html>', headers)
+        return True
+
+    def do_GET(self) -> None:
+        self.server.delay()
+        if INCIDENTS_PATH.match(self.path):
+            self.server.count('incidents')
+            if self._fail():
+                return
+            self._send(
+                200,
+                self.server.incidents_body(),
+                {'Content-Type': 'application/json'})
+        elif GROUPS_PATH.match(self.path):
+            self.server.count('groups')
+            if self._fail():
+                return
+            etag = self.server.groups_etag
+            if self.headers.get('If-None-Match') == etag:
+                self._send(304, headers={'ETag': etag})
+                return
+            self._send(
+                200,
+                self.server.groups_body,
+                {'Content-Type': 'application/json', 'ETag': etag})
+        else:
+            self._send(404)
+
+    def do_POST(self) -> None:
+        self.server.delay()
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length) if length > 0 else b''
+        if not PUSH_PATH.match(self.path):
+            self._send(404)
+            return
+        self.server.count('pushes', len(body))
+        if self._fail():
+            return
+        self._send(
+            200, b'{"success": true}', {'Content-Type': 'application/json'})
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class FakeUpstream(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            incidents: int = 50,
+            groups: int = 20,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            body_bytes: int = 200,
+            maintenance_rate: float = 0.1,
+            churn: bool = True,
+            seed: int = 0) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.churn = churn
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._version = 0
+        self.stats = {'incidents': 0, 'groups': 0, 'pushes': 0, 'bytes': 0}
+
+        self.groups_body = json.dumps(build_groups(groups)).encode('utf-8')
+        self.groups_etag = '"' + hashlib.sha256(
+            self.groups_body).hexdigest()[:16] + '"'
+        rendered = json.dumps(build_incidents(
+            incidents, groups, body_bytes, maintenance_rate, seed))
+        head, stamp, tail = rendered.partition(STAMP)
+        self._incidents_parts = (
+            head.encode('utf-8'), tail.encode('utf-8'), bool(stamp))
+        self._thread = None
+        super().__init__((host, port), FakeUpstreamHandler)
+
+    @property
+    def address(self) -> str:
+        host, port = self.server_address[:2]
+        return f'{host}:{port}'
+
+    def delay(self) -> None:
+        if self.latency <= 0:
+            return
+        with self._lock:
+            delay = self.latency + self._random.uniform(
+                -self.jitter, self.jitter)
+        time.sleep(max(0.0, delay))
+
+    def next_error(self) -> int:
+        if self.error_rate <= 0:
+            return 0
+        with self._lock:
+            if self._random.random() >= self.error_rate:
+                return 0
+            return self._random.choice([429, 502, 503])
+
+    def count(self, name: str, size: int = 0) -> None:
+        with self._lock:
+            self.stats[name] += 1
+            self.stats['bytes'] += size
+
+    def incidents_body(self) -> bytes:
+        head, tail, stamped = self._incidents_parts
+        if not stamped:
+            return head
+        with self._lock:
+            if self.churn:
+                self._version += 1
+            version = self._version
+        stamp = time.strftime(
+            '%Y-%m-%dT%H:%M:%SZ', time.gmtime(1700000000 + version))
+        return head + stamp.encode('utf-8') + tail
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='fake-upstream', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+        self._thread = None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Serve a local stand-in for the StatusPage and '
+                    'Geckoboard APIs.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--incidents', type=int, default=50)
+    parser.add_argument('--groups', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--body-bytes', type=int, default=200)
+    parser.add_argument('--no-churn', action='store_true')
+    args = parser.parse_args()
+
+    server = FakeUpstream(
+        host=args.host,
+        port=args.port,
+        incidents=args.incidents,
+        groups=args.groups,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        body_bytes=args.body_bytes,
+        churn=not args.no_churn)
+    print(f'Serving fake StatusPage and Geckoboard on {server.address}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.classes.file_checker import FileChecker  # noqa: E402
+
+
+def pop_and_append(file: str) -> list:
+    with open(file, 'r') as f:
+        data = [line.strip() for line in f]
+
+    i = 0
+    while i < len(data):
+        if ',' in data[i]:
+            parts = data[i].split(',')
+            for part in parts:
+                data.append(part)
+            data.pop(i)
+        i += 1
+
+    return data
+
+
+def count(file: str) -> int:
+    return sum(1 for _ in FileChecker(file).iter_text())
+
+
+def write_entries(file: str, entries: int, per_line: int) -> None:
+    with open(file, 'w') as f:
+        for start in range(0, entries, per_line):
+            end = min(entries, start + per_line)
+            f.write(','.join(
+                f'user{index}@example.com' for index in range(start, end)))
+            f.write('\n')
+
+
+def measure(parse, file: str) -> tuple:
+    start = time.perf_counter()
+    parse(file)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    parse(file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (seconds * 1000, peak / 1024 / 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Compare FileChecker.is_text with the old list parser.')
+    parser.add_argument('-n', '--entries', type=int, default=100000)
+    parser.add_argument(
+        '--per-line',
+        type=int,
+        default=10,
+        help='comma separated entries on each line')
+    parser.add_argument(
+        '--skip-old',
+        action='store_true',
+        help='skip the old parser, which is quadratic in the entry count')
+    args = parser.parse_args()
+
+    parsers = {
+        'FileChecker.iter_text': count,
+        'FileChecker.is_text': lambda file: FileChecker(file).is_text()
+    }
+    if not args.skip_old:
+        parsers['pop and append'] = pop_and_append
+
+    with tempfile.TemporaryDirectory() as workdir:
+        file = os.path.join(workdir, 'entries.txt')
+        write_entries(file, args.entries, args.per_line)
+        print(f'{args.entries} entries, {args.per_line} per line:')
+        for name, parse in parsers.items():
+            ms, mb = measure(parse, file)
+            print(f'  {name:<22} {ms:10.1f} ms {mb:8.2f} MB peak')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
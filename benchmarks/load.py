@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from fake_upstream import FakeUpstream
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = '''
+import json
+import os
+import resource
+import sys
+import time
+
+root, workdir, cycles, warmup = sys.argv[1:5]
+os.chdir(workdir)
+sys.path[0:1] = [workdir, root]
+
+import main
+from src.classes.geckoboard import GeckboardApi
+from src.classes.statuspage_api import StatusPageApi
+
+StatusPageApi.SCHEME = 'http://'
+GeckboardApi.SCHEME = 'http://'
+argv = ['--lock', 'none', '--metrics-file', '']
+
+latencies = []
+failures = 0
+for cycle in range(int(warmup) + int(cycles)):
+    start = time.perf_counter()
+    try:
+        main.main(argv)
+        failed = False
+    except SystemExit as e:
+        failed = bool(e.code)
+    elapsed = time.perf_counter() - start
+    if cycle >= int(warmup):
+        latencies.append(elapsed * 1000)
+        failures += failed
+
+print(json.dumps({
+    'latencies': latencies,
+    'failures': failures,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+}))
+'''
+
+
+def write_workdir(workdir: str, address: str, pages: int) -> None:
+    os.makedirs(os.path.join(workdir, 'data'))
+    os.makedirs(os.path.join(workdir, 'logs'))
+    os.makedirs(os.path.join(workdir, 'src', 'configs'))
+    shutil.copy(
+        os.path.join(ROOT, 'src', 'configs', 'logging.conf'),
+        os.path.join(workdir, 'src', 'configs', 'logging.conf'))
+
+    pageids = [f'page{index:08d}' for index in range(pages)]
+    lines = [
+        'credentials:',
+        '  statuspage:',
+        '    apikey: bench-api-key',
+        f'    host: "{address}"',
+        f'    pageid: {pageids[0]}',
+        '  geckoboard:',
+        '    apikey: bench-api-key',
+        f'    host: "{address}"',
+        '    widgetkey: bench-widget'
+    ]
+    if pages > 1:
+        lines += ['routes:', '  - widgetkey: bench-widget', '    pages:']
+        lines += [f'      - {pageid}' for pageid in pageids]
+    with open(os.path.join(workdir, 'data', 'credentials.yaml'), 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def run_worker(workdir: str, cycles: int, warmup: int) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', WORKER, ROOT, workdir, str(cycles),
+         str(warmup)],
+        check=True,
+        capture_output=True,
+        text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def percentile(values: list, percent: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[
+        percent - 1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Drive main() against a local fake StatusPage and '
+                    'Geckoboard and report throughput and latency.')
+    parser.add_argument('-n', '--cycles', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--incidents', type=int, default=50)
+    parser.add_argument('--groups', type=int, default=20)
+    parser.add_argument('--pages', type=int, default=1)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--body-bytes', type=int, default=200)
+    parser.add_argument('--no-churn', action='store_true')
+    parser.add_argument(
+        '--max-p99-ms',
+        type=float,
+        default=0,
+        help='exit non-zero when the p99 cycle latency exceeds this')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    server = FakeUpstream(
+        incidents=args.incidents,
+        groups=args.groups,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        body_bytes=args.body_bytes,
+        churn=not args.no_churn)
+    server.start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            write_workdir(workdir, server.address, args.pages)
+            start = time.perf_counter()
+            result = run_worker(workdir, args.cycles, args.warmup)
+            wall = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    latencies = result['latencies']
+    report = {
+        'cycles': len(latencies),
+        'failures': result['failures'],
+        'cycles_per_sec': round(len(latencies) / (sum(latencies) / 1000), 3),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(max(latencies), 3),
+        'peak_rss_mb': round(result['maxrss_kb'] / 1024, 1),
+        'wall_s': round(wall, 3),
+        'upstream': server.stats
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        width = max(len(name) for name in report)
+        for name, value in report.items():
+            print(f'{name:<{width}}  {value}')
+
+    if args.max_p99_ms and report['p99_ms'] > args.max_p99_ms:
+        print(f'p99 exceeded {args.max_p99_ms} ms!', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import argparse
+import logging
+import os
+import socket
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.classes.logging_setup import RecordFactory  # noqa: E402
+from src.constants import constants  # noqa: E402
+
+
+def per_call_factory(*args, **kwargs) -> logging.LogRecord:
+    record = logging.LogRecord(*args, **kwargs)
+    record.event_date = datetime.now().strftime(constants.EVENT_DATE_FORMAT)
+    record.hostname = socket.gethostname()
+    record.program = constants.PROGRAM_NAME
+    record.pid = os.getpid()
+    return record
+
+
+def measure(factory, runs: int, emit: bool) -> float:
+    logger = logging.Logger('log_record_benchmark')
+    logger.propagate = False
+    if emit:
+        handler = logging.StreamHandler(open(os.devnull, 'w'))
+        handler.setFormatter(logging.Formatter(
+            '%(event_date)s %(hostname)s %(program)s[%(pid)d] %(message)s'))
+        logger.addHandler(handler)
+    else:
+        logger.setLevel(logging.INFO)
+
+    logging.setLogRecordFactory(factory)
+    try:
+        seconds = timeit.timeit(
+            lambda: logger.info('Getting unresolved incidents...'),
+            number=runs)
+    finally:
+        logging.setLogRecordFactory(logging.LogRecord)
+    return seconds / runs * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Compare the per-record cost of the log record factory.')
+    parser.add_argument('-n', '--runs', type=int, default=100000)
+    args = parser.parse_args()
+
+    factories = {
+        'per-call factory': per_call_factory,
+        'RecordFactory': RecordFactory(logging.LogRecord)
+    }
+    for emit in (False, True):
+        label = 'created and emitted' if emit else 'created only'
+        print(f'{label}:')
+        for name, factory in factories.items():
+            cost = measure(factory, args.runs, emit)
+            print(f'  {name:<18} {cost:8.3f} us/record')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import json
+import os
+import sys
+import time
+
+sys.path[0] = os.getcwd()
+timings = {}
+start = time.perf_counter()
+
+
+def phase(name):
+    global start
+    now = time.perf_counter()
+    timings[name] = (now - start) * 1000
+    start = now
+
+
+import main
+phase('import main')
+
+from src.classes.logging_setup import LoggingSetup
+LoggingSetup('./src/configs/logging.conf', sys.argv[1]).configure()
+phase('logging setup')
+
+from src.classes.config_loader import ConfigLoader
+ConfigLoader('./tests/data/credentials.yaml')
+phase('config load')
+
+from src.classes.http_transport import HttpTransport
+HttpTransport().session
+phase('http session')
+
+print(json.dumps(timings))
+'''
+
+
+def run_interpreter() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_probe(cache_file: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, cache_file],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Report interpreter, import and setup time per phase.')
+    parser.add_argument('-n', '--runs', type=int, default=10)
+    parser.add_argument(
+        '--max-ms',
+        type=float,
+        default=0,
+        help='exit non-zero when the median total exceeds this')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    samples = {'interpreter': []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for run in range(args.runs):
+            samples['interpreter'].append(run_interpreter())
+
+            cache_file = os.path.join(tmp, f'cold-{run}.json')
+            cold = run_probe(cache_file)
+            warm = run_probe(cache_file)
+            for name, value in cold.items():
+                samples.setdefault(f'{name} (cold)', []).append(value)
+            for name, value in warm.items():
+                samples.setdefault(f'{name} (cached)', []).append(value)
+
+    report = {
+        name: round(statistics.median(values), 3)
+        for name, values in samples.items()
+    }
+    report['total (cached)'] = round(report['interpreter'] + sum(
+        value for name, value in report.items()
+        if name.endswith('(cached)')), 3)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        width = max(len(name) for name in report)
+        for name, value in report.items():
+            print(f'{name:<{width}}  {value:>9.3f} ms')
+
+    if args.max_ms and report['total (cached)'] > args.max_ms:
+        print(f'Startup exceeded {args.max_ms} ms!', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,30 +1,31 @@
 #!/usr/bin/env python3
+import argparse
+import atexit
 import logging
-import logging.config
-import os
-import socket
-from datetime import datetime
-
+import time
+
+from src.classes.adaptive_scheduler import AdaptiveScheduler
+from src.classes.circuit_breaker import CircuitBreaker
+from src.classes.component_group_cache import ComponentGroupCache
+from src.classes.config_loader import ConfigLoader
+from src.classes.daemon import Daemon
+from src.classes.fan_out import FanOut
 from src.classes.file_checker import FileChecker
 from src.classes.geckoboard import GeckboardApi
+from src.classes.http_transport import HttpTransport
+from src.classes.incident_state import IncidentState
+from src.classes.instance_lock import InstanceLock
+from src.classes.logging_setup import LoggingSetup, RecordFactory
+from src.classes.metrics import Metrics
+from src.classes.payload_budget import PayloadBudget
+from src.classes.push_coalescer import PushCoalescer
+from src.classes.push_state import PushState
+from src.classes.snapshot_store import SnapshotStore
+from src.classes.status_cycle import StatusCycle
 from src.classes.statuspage_api import StatusPageApi
 from src.constants import constants
 
 
-def get_hostname() -> str:
-    hostname = socket.gethostname()
-    if not hostname:
-        return 'localhost'
-    return hostname
-
-
-def get_pid() -> int:
-    pid = os.getpid()
-    if pid > 0:
-        return pid
-    return -1
-
-
 def get_logging_config(file: str) -> str:
     try:
         fc = FileChecker(file)
@@ -40,96 +41,208 @@ def get_logging_config(file: str) -> str:
         return ''
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=constants.PROGRAM_NAME)
+    parser.add_argument(
+        '-d', '--daemon',
+        action='store_true',
+        help='keep running and poll StatusPage on an interval')
+    parser.add_argument(
+        '-i', '--interval',
+        type=float,
+        default=constants.DAEMON_DEFAULT_INTERVAL,
+        help='seconds between polls in daemon mode')
+    parser.add_argument(
+        '-a', '--adaptive',
+        action='store_true',
+        help='poll slowly while the page is green and faster during incidents')
+    parser.add_argument(
+        '--idle-interval',
+        type=float,
+        default=constants.SCHEDULER_IDLE_INTERVAL,
+        help='seconds between adaptive polls while there are no incidents')
+    parser.add_argument(
+        '--active-interval',
+        type=float,
+        default=constants.SCHEDULER_ACTIVE_INTERVAL,
+        help='seconds between polls in adaptive mode during incidents')
+    parser.add_argument(
+        '-w', '--webhook',
+        action='store_true',
+        help='listen for StatusPage webhooks instead of polling')
+    parser.add_argument(
+        '--host',
+        default=constants.WEBHOOK_DEFAULT_HOST,
+        help='address the webhook listener binds to')
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=constants.WEBHOOK_DEFAULT_PORT,
+        help='port the webhook listener binds to')
+    parser.add_argument(
+        '--token',
+        default=None,
+        help=f'secret suffix for the {constants.WEBHOOK_PATH} path')
+    parser.add_argument(
+        '--coalesce-window',
+        type=float,
+        default=constants.PUSH_COALESCE_WINDOW,
+        help='seconds to collapse webhook bursts into one push, 0 to disable')
+    parser.add_argument(
+        '--payload-limit',
+        type=int,
+        default=constants.GECKOBOARD_PAYLOAD_LIMIT,
+        help='largest Geckoboard push in bytes before outages are grouped')
+    parser.add_argument(
+        '--lock',
+        choices=constants.LOCK_MODES,
+        default=constants.LOCK_DEFAULT_MODE,
+        help='what to do when another run still holds the lock')
+    parser.add_argument(
+        '--lock-timeout',
+        type=float,
+        default=constants.LOCK_WAIT_TIMEOUT,
+        help='seconds to wait for the lock in wait and kill-stale modes')
+    parser.add_argument(
+        '--metrics-file',
+        default=constants.METRICS_TEXTFILE,
+        help='textfile the metrics are written to, empty to disable')
+    parser.add_argument(
+        '--metrics-host',
+        default=constants.METRICS_DEFAULT_HOST,
+        help='address the metrics endpoint binds to')
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help=f'serve metrics on {constants.METRICS_PATH} at this port')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     logging_conf = './src/configs/logging.conf'
     filepath = get_logging_config(logging_conf)
     if not filepath:
         exit(1)
 
-    logging.config.fileConfig(filepath)
-    old_factory = logging.getLogRecordFactory()
-
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        record.event_date = datetime.now().strftime(constants.EVENT_DATE_FORMAT)
-        record.hostname = get_hostname()
-        record.program = constants.PROGRAM_NAME
-        record.pid = get_pid()
-        return record
-
-    logging.setLogRecordFactory(record_factory)
+    LoggingSetup(filepath).configure()
+    RecordFactory().install()
     logger = logging.getLogger(constants.PROGRAM_NAME)
 
     logger.info('Starting script...')
 
-    credentials_file = './data/credentials.yaml'
-    statuspage = StatusPageApi(credentials_file)
-    geckboard = GeckboardApi(credentials_file)
-
-    logger.info('Getting unresolved incidents...')
-    result = statuspage.get_unresolved_incidents()
-    if not result:
-        exit(1)
-
-    if len(statuspage.incidents) > 0:
-        logger.info(f'There are {len(statuspage.incidents)} to parse...')
-        messages = []
-        status = 'DOWN'
-
-        logger.info('Getting all Platforms...')
-        result = statuspage.get_component_groups()
-        if not result:
+    lock = InstanceLock(mode=args.lock, timeout=args.lock_timeout)
+    if not lock.acquire():
+        if args.lock == 'wait':
             exit(1)
+        return
+    atexit.register(lock.release)
 
-        for incident in statuspage.incidents:
-            impact = incident['impact']
-            if impact == 'maintenance':
-                logger.info('This incident is a maintenace post, skipping...')
-                continue
-
-            product_name = ''
-            platform_name = ''
-            for component in incident['components']:
-                product_name = component['name']
-                platform_id = component['group_id']
-                platform_name = ''
-                for platform in statuspage.platforms:
-                    if platform_id == platform[0]:
-                        platform_name = platform[1]
-
-            logger.info('Found an outage incident!')
-            logger.info('Building message for Geckoboard...')
-            msg = geckboard.build_msg(
-                status,
-                platform_name=platform_name,
-                product_name=product_name)
-            if not msg:
-                continue
-
-            messages.append(msg)
-
-        if len(messages) > 0:
-            logger.info('Formatting all outages into a single message...')
-            msg = ''.join(messages)
-
-            logger.info('Pushing message to Geckoboard widget...')
-            result = geckboard.push_to_widget(msg)
-            if not result:
-                exit(1)
-
+    credentials_file = './data/credentials.yaml'
+    config = ConfigLoader(credentials_file)
+    metrics = Metrics(textfile=args.metrics_file)
+    if args.metrics_port is not None:
+        from src.classes.metrics_server import MetricsServer
+
+        metrics_server = MetricsServer(
+            metrics, host=args.metrics_host, port=args.metrics_port)
+        metrics_server.start()
+        logger.info(f'Serving metrics on port {args.metrics_port}...')
+    transport = HttpTransport(metrics=metrics)
+    cache = ComponentGroupCache()
+    push_state = PushState()
+    incident_state = IncidentState()
+    breaker = CircuitBreaker()
+    last_good = SnapshotStore()
+    budget = PayloadBudget(limit=args.payload_limit)
+    coalescer = None
+    if args.webhook and args.coalesce_window > 0:
+        coalescer = PushCoalescer(
+            window=args.coalesce_window,
+            max_delay=max(
+                args.coalesce_window, constants.PUSH_COALESCE_MAX_DELAY),
+            metrics=metrics)
+    if config.routes:
+        logger.info(f'Fanning out to {len(config.routes)} widgets...')
+        cycle = FanOut(
+            config,
+            transport=transport,
+            cache=cache,
+            push_state=push_state,
+            incident_state=incident_state,
+            metrics=metrics,
+            breaker=breaker,
+            last_good=last_good,
+            budget=budget)
     else:
-        logger.info('There are no active outages!')
-        status = 'OK'
-
-        logger.info('Building message for Geckoboard...')
-        msg = geckboard.build_msg(status)
-        if not msg:
+        statuspage = StatusPageApi(
+            config=config.statuspage,
+            transport=transport,
+            cache=cache)
+        geckboard = GeckboardApi(
+            config=config.geckoboard,
+            transport=transport,
+            push_state=push_state,
+            coalescer=coalescer)
+        cycle = StatusCycle(
+            statuspage,
+            geckboard,
+            incident_state=incident_state,
+            breaker=breaker,
+            last_good=last_good,
+            budget=budget)
+
+    if args.webhook:
+        if config.routes:
+            logger.info('ERROR: Webhook mode does not support routes!')
             exit(1)
-
-        logger.info('Pushing message to Geckoboard widget...')
-        result = geckboard.push_to_widget(msg)  # type: ignore
-        if not result:
+        from src.classes.webhook_server import WebhookServer
+
+        try:
+            server = WebhookServer(
+                cycle,
+                host=args.host,
+                port=args.port,
+                token=args.token,
+                config=config,
+                metrics=metrics,
+                lock=lock)
+        except ValueError as e:
+            logger.info(f'ERROR: Unable to start the webhook listener: {e}')
             exit(1)
+        server.run()
+        if coalescer and not coalescer.close():
+            logger.info('ERROR: Unable to flush queued pushes!')
+        transport.close()
+        return
+
+    if args.daemon:
+        scheduler = None
+        if args.adaptive:
+            scheduler = AdaptiveScheduler(
+                idle_interval=args.idle_interval,
+                active_interval=args.active_interval)
+        daemon = Daemon(
+            cycle,
+            interval=args.interval,
+            config=config,
+            metrics=metrics,
+            scheduler=scheduler,
+            lock=lock)
+        daemon.run()
+        transport.close()
+        return
+
+    start = time.monotonic()
+    result = cycle.run()
+    metrics.record_cycle(result, time.monotonic() - start)
+    if not metrics.flush():
+        logger.info('ERROR: Unable to write metrics textfile!')
+    transport.close()
+    if not result:
+        exit(1)
 
     logger.info('Script completed successfully!')
 
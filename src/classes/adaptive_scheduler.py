@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import random
+import time
+
+from src.constants import constants
+
+
+class AdaptiveScheduler:
+    def __init__(
+            self,
+            idle_interval: float = constants.SCHEDULER_IDLE_INTERVAL,
+            active_interval: float = constants.SCHEDULER_ACTIVE_INTERVAL,
+            cooldown: float = constants.SCHEDULER_COOLDOWN,
+            jitter: float = constants.SCHEDULER_JITTER) -> None:
+        self.idle_interval = idle_interval
+        self.active_interval = active_interval
+        self.cooldown = cooldown
+        self.jitter = jitter
+        self.last_active = None
+        self._random = random.Random()
+
+    @property
+    def idle_interval(self) -> float:
+        return self._idle_interval
+
+    @idle_interval.setter
+    def idle_interval(self, seconds: float) -> None:
+        self._idle_interval = 0.0
+        if seconds < constants.DAEMON_MIN_INTERVAL:
+            raise ValueError('Invalid idle_interval')
+        self._idle_interval = float(seconds)
+
+    @property
+    def active_interval(self) -> float:
+        return self._active_interval
+
+    @active_interval.setter
+    def active_interval(self, seconds: float) -> None:
+        self._active_interval = 0.0
+        if seconds < constants.DAEMON_MIN_INTERVAL:
+            raise ValueError('Invalid active_interval')
+        if seconds > self.idle_interval:
+            raise ValueError('active_interval is longer than idle_interval')
+        self._active_interval = float(seconds)
+
+    @property
+    def cooldown(self) -> float:
+        return self._cooldown
+
+    @cooldown.setter
+    def cooldown(self, seconds: float) -> None:
+        self._cooldown = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid cooldown')
+        self._cooldown = float(seconds)
+
+    @property
+    def jitter(self) -> float:
+        return self._jitter
+
+    @jitter.setter
+    def jitter(self, fraction: float) -> None:
+        self._jitter = 0.0
+        if fraction < 0 or fraction >= 1:
+            raise ValueError('Invalid jitter')
+        self._jitter = float(fraction)
+
+    def is_fast(self, now: float | None = None) -> bool:
+        if self.last_active is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_active < self.cooldown
+
+    def next_interval(self, active: bool, now: float | None = None) -> float:
+        if now is None:
+            now = time.monotonic()
+        if active:
+            self.last_active = now
+
+        if active or self.is_fast(now):
+            interval = self.active_interval
+        else:
+            interval = self.idle_interval
+
+        if self.jitter:
+            interval *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(constants.DAEMON_MIN_INTERVAL, interval)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import threading
+import time
+
+from src.classes.json_store import JsonStore
+from src.constants import constants
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(
+            self,
+            file: str = constants.CIRCUIT_BREAKER_FILE,
+            failure_threshold: int = constants.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout: float = constants.CIRCUIT_RESET_TIMEOUT) -> None:
+        self.store = JsonStore(file)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.entries = self.store.load()
+        self._lock = threading.Lock()
+
+    @property
+    def failure_threshold(self) -> int:
+        return self._failure_threshold
+
+    @failure_threshold.setter
+    def failure_threshold(self, failures: int) -> None:
+        self._failure_threshold = 0
+        if failures < 1:
+            raise ValueError('Invalid failure_threshold')
+        self._failure_threshold = failures
+
+    @property
+    def reset_timeout(self) -> float:
+        return self._reset_timeout
+
+    @reset_timeout.setter
+    def reset_timeout(self, seconds: float) -> None:
+        self._reset_timeout = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid reset_timeout')
+        self._reset_timeout = float(seconds)
+
+    def state(self, key: str, now: float | None = None) -> str:
+        entry = self.entries.get(key)
+        if not entry or entry.get('failures', 0) < self.failure_threshold:
+            return self.CLOSED
+        if now is None:
+            now = time.time()
+        if now - entry.get('opened_at', 0) >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self, key: str, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        with self._lock:
+            state = self.state(key, now)
+            if state == self.CLOSED:
+                return True
+            if state == self.OPEN:
+                return False
+            self.entries[key]['opened_at'] = now
+            self.store.save(self.entries)
+            return True
+
+    def record_success(self, key: str) -> bool:
+        with self._lock:
+            if key not in self.entries:
+                return True
+            del self.entries[key]
+            return self.store.save(self.entries)
+
+    def record_failure(self, key: str, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        with self._lock:
+            entry = self.entries.setdefault(key, {'failures': 0})
+            entry['failures'] = entry.get('failures', 0) + 1
+            if entry['failures'] >= self.failure_threshold:
+                entry.setdefault('opened_at', now)
+            return self.store.save(self.entries)
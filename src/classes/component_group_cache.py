@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import threading
+import time
+
+from src.classes.json_store import JsonStore
+from src.constants import constants
+
+
+class ComponentGroupCache:
+    def __init__(
+            self,
+            file: str = constants.COMPONENT_GROUP_CACHE_FILE,
+            ttl: float = constants.COMPONENT_GROUP_CACHE_TTL) -> None:
+        self.store = JsonStore(file)
+        self.ttl = ttl
+        self.entries = self.store.load()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, seconds: float) -> None:
+        self._ttl = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid ttl')
+        self._ttl = float(seconds)
+
+    def is_fresh(self, pageid: str) -> bool:
+        entry = self.entries.get(pageid)
+        if not entry:
+            return False
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+
+    def get(self, pageid: str) -> list | None:
+        entry = self.entries.get(pageid)
+        if not entry:
+            return None
+        return entry['groups']
+
+    def validators(self, pageid: str) -> dict:
+        headers = {}
+        entry = self.entries.get(pageid)
+        if not entry:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(
+            self,
+            pageid: str,
+            groups: list,
+            etag: str | None = None,
+            last_modified: str | None = None) -> bool:
+        with self._lock:
+            self.entries[pageid] = {
+                'fetched_at': time.time(),
+                'etag': etag,
+                'last_modified': last_modified,
+                'groups': groups
+            }
+            return self.store.save(self.entries)
+
+    def touch(self, pageid: str) -> bool:
+        with self._lock:
+            entry = self.entries.get(pageid)
+            if not entry:
+                return False
+            entry['fetched_at'] = time.time()
+            return self.store.save(self.entries)
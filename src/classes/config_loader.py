@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+from src.classes.file_checker import FileChecker
+from src.constants import constants
+
+
+@dataclass(frozen=True, slots=True)
+class StatusPageConfig:
+    credentials_file: str
+    apikey: str
+    host: str
+    pageid: str
+
+    def as_dict(self) -> dict:
+        return {
+            'apikey': self.apikey,
+            'host': self.host,
+            'pageid': self.pageid
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class GeckoboardConfig:
+    credentials_file: str
+    apikey: str
+    host: str
+    widgetkey: str
+
+    def as_dict(self) -> dict:
+        return {
+            'apikey': self.apikey,
+            'host': self.host,
+            'widgetkey': self.widgetkey
+        }
+
+
+class ConfigLoader:
+    def __init__(self, credentials_file: str) -> None:
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+        self.credentials_file = credentials_file
+
+    @property
+    def credentials_file(self) -> str:
+        return self._credentials_file
+
+    @credentials_file.setter
+    def credentials_file(self, filepath: str) -> None:
+        self._credentials_file = ''
+        fc = FileChecker(filepath)
+        self._load(fc)
+        self._credentials_file = fc.file
+
+    def _load(self, fc: FileChecker) -> None:
+        if not fc.is_file():
+            raise ValueError('Not a file')
+
+        if not fc.is_readable():
+            raise ValueError('Not readable')
+
+        mtime = os.stat(fc.file).st_mtime_ns
+        data = fc.is_yaml()
+        if not data:
+            raise ValueError('Not YAML')
+
+        try:
+            credentials = data['credentials']  # type: ignore
+            statuspage = self._section(
+                credentials['statuspage'],
+                constants.STATUSPAGE_CREDENTIALS_KEYS)
+            geckoboard = self._section(
+                credentials['geckoboard'],
+                constants.GECKOBOARD_CREDENTIALS_KEYS)
+        except (KeyError, TypeError):
+            raise ValueError('Invalid credentials file')
+        routes = self._routes(data.get('routes'))  # type: ignore
+
+        with self._lock:
+            self.statuspage = StatusPageConfig(fc.file, **statuspage)
+            self.geckoboard = GeckoboardConfig(fc.file, **geckoboard)
+            self.routes = routes
+            self.mtime = mtime
+
+    @staticmethod
+    def _section(data: dict, keys: list) -> dict:
+        if not isinstance(data, dict) or len(data) != len(keys):
+            raise ValueError('Invalid credentials file')
+
+        for key in keys:
+            if key not in data.keys():
+                raise ValueError(f'Missing {key}')
+
+        return {key: data[key] for key in keys}
+
+    @staticmethod
+    def _routes(data: list | None) -> dict:
+        routes = {}
+        for route in data or []:
+            try:
+                widgetkey = route['widgetkey']
+                pageids = route['pages']
+            except (KeyError, TypeError):
+                raise ValueError('Invalid routes')
+            if not isinstance(pageids, list) or len(pageids) == 0:
+                raise ValueError('Invalid routes')
+            for pageid in pageids:
+                if not pageid or not isinstance(pageid, str):
+                    raise ValueError('Invalid routes')
+            routes.setdefault(widgetkey, [])
+            for pageid in pageids:
+                if pageid not in routes[widgetkey]:
+                    routes[widgetkey].append(pageid)
+        return routes
+
+    def changed(self) -> bool:
+        try:
+            return os.stat(self.credentials_file).st_mtime_ns != self.mtime
+        except OSError:
+            return False
+
+    def reload(self) -> bool:
+        try:
+            self._load(FileChecker(self.credentials_file))
+        except ValueError as e:
+            self.logger.info(f'ERROR: Unable to reload credentials: {e}')
+            try:
+                self.mtime = os.stat(self.credentials_file).st_mtime_ns
+            except OSError:
+                pass
+            return False
+        self.logger.info('Credentials reloaded successfully!')
+        return True
+
+    def reload_if_changed(self) -> bool:
+        if not self.changed():
+            return False
+        return self.reload()
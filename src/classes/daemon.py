@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+import logging
+import signal
+import threading
+import time
+
+from src.classes.adaptive_scheduler import AdaptiveScheduler
+from src.classes.config_loader import ConfigLoader
+from src.classes.fan_out import FanOut
+from src.classes.instance_lock import InstanceLock
+from src.classes.metrics import Metrics
+from src.classes.status_cycle import StatusCycle
+from src.constants import constants
+
+
+class Daemon:
+    def __init__(
+            self,
+            cycle: StatusCycle | FanOut,
+            interval: float = constants.DAEMON_DEFAULT_INTERVAL,
+            config: ConfigLoader | None = None,
+            metrics: Metrics | None = None,
+            scheduler: AdaptiveScheduler | None = None,
+            lock: InstanceLock | None = None) -> None:
+        self.cycle = cycle
+        self.interval = interval
+        self.config = config
+        self.metrics = metrics or Metrics()
+        self.scheduler = scheduler
+        self.lock = lock
+        self._stop_event = threading.Event()
+        self._reload_requested = False
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @interval.setter
+    def interval(self, seconds: float) -> None:
+        self._interval = 0.0
+        if seconds < constants.DAEMON_MIN_INTERVAL:
+            raise ValueError('Invalid interval')
+        self._interval = float(seconds)
+
+    @property
+    def running(self) -> bool:
+        return not self._stop_event.is_set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _handle_signal(self, signum, frame) -> None:
+        name = signal.Signals(signum).name
+        self.logger.info(f'Received {name}, shutting down...')
+        self.stop()
+
+    def _handle_reload(self, signum, frame) -> None:
+        self.logger.info('Received SIGHUP, reloading credentials...')
+        self._reload_requested = True
+
+    def _install_signal_handlers(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+
+    def reload_config(self) -> bool:
+        if not self.config:
+            return False
+
+        requested = self._reload_requested
+        self._reload_requested = False
+        if requested:
+            reloaded = self.config.reload()
+        else:
+            reloaded = self.config.reload_if_changed()
+        if reloaded:
+            self.cycle.apply_config(self.config)
+        return reloaded
+
+    def heartbeat(self) -> None:
+        if self.lock:
+            self.lock.heartbeat()
+
+    def run_once(self) -> bool:
+        start = time.monotonic()
+        self.heartbeat()
+        try:
+            self.reload_config()
+            result = self.cycle.run()
+        except Exception as e:
+            self.logger.info(f'ERROR: Cycle raised an exception: {e!r}')
+            result = False
+        self.metrics.record_cycle(result, time.monotonic() - start)
+        if not self.metrics.flush():
+            self.logger.info('ERROR: Unable to write metrics textfile!')
+        return result
+
+    def next_interval(self) -> float:
+        if not self.scheduler:
+            return self.interval
+
+        fast = self.scheduler.is_fast()
+        interval = self.scheduler.next_interval(self.cycle.is_active())
+        if self.scheduler.is_fast() != fast:
+            mode = 'active' if not fast else 'idle'
+            self.logger.info(f'Switching to {mode} polling...')
+        return interval
+
+    def wait(self, seconds: float) -> None:
+        if not self.lock:
+            self._stop_event.wait(seconds)
+            return
+
+        deadline = time.monotonic() + seconds
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._stop_event.wait(
+                min(remaining, self.lock.heartbeat_every or remaining))
+            self.heartbeat()
+
+    def run(self) -> None:
+        self._install_signal_handlers()
+        if self.scheduler:
+            self.logger.info(
+                'Daemon started, polling every '
+                f'{self.scheduler.idle_interval}s when idle and '
+                f'{self.scheduler.active_interval}s during incidents...')
+        else:
+            self.logger.info(
+                f'Daemon started, polling every {self.interval}s...')
+        while self.running:
+            start = time.monotonic()
+            if self.run_once():
+                self.logger.info('Cycle completed successfully!')
+            else:
+                self.logger.info('ERROR: Cycle failed, retrying next tick...')
+            elapsed = time.monotonic() - start
+            self.wait(max(0.0, self.next_interval() - elapsed))
+        self.logger.info('Daemon stopped.')
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+import logging
+
+from src.classes.circuit_breaker import CircuitBreaker
+from src.classes.component_group_cache import ComponentGroupCache
+from src.classes.config_loader import ConfigLoader
+from src.classes.geckoboard import GeckboardApi
+from src.classes.http_transport import HttpTransport
+from src.classes.incident_state import IncidentState
+from src.classes.message_templates import MessageTemplates
+from src.classes.metrics import Metrics
+from src.classes.payload_budget import PayloadBudget
+from src.classes.push_state import PushState
+from src.classes.snapshot_store import SnapshotStore
+from src.classes.status_cycle import StatusCycle
+from src.classes.statuspage_api import StatusPageApi
+from src.constants import constants
+
+
+class FanOut:
+    def __init__(
+            self,
+            config: ConfigLoader,
+            transport: HttpTransport | None = None,
+            cache: ComponentGroupCache | None = None,
+            push_state: PushState | None = None,
+            incident_state: IncidentState | None = None,
+            max_workers: int = constants.FAN_OUT_MAX_WORKERS,
+            metrics: Metrics | None = None,
+            breaker: CircuitBreaker | None = None,
+            last_good: SnapshotStore | None = None,
+            budget: PayloadBudget | None = None) -> None:
+        self.routes = config.routes
+        self.max_workers = max_workers
+        self.transport = transport or HttpTransport()
+        self.metrics = metrics or self.transport.metrics
+        self.budget = budget or PayloadBudget()
+        templates = MessageTemplates()
+        self.geckboards = {
+            widgetkey: GeckboardApi(
+                config=config.geckoboard,
+                transport=self.transport,
+                push_state=push_state,
+                widgetkey=widgetkey,
+                metrics=self.metrics,
+                templates=templates)
+            for widgetkey in self.routes
+        }
+        renderer = next(iter(self.geckboards.values()))
+        self.cycles = {}
+        for pageid in self.pageids:
+            statuspage = StatusPageApi(
+                config=config.statuspage,
+                transport=self.transport,
+                cache=cache,
+                pageid=pageid,
+                metrics=self.metrics)
+            self.cycles[pageid] = StatusCycle(
+                statuspage,
+                renderer,
+                incident_state=incident_state,
+                breaker=breaker,
+                last_good=last_good,
+                budget=self.budget)
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    @property
+    def routes(self) -> dict:
+        return self._routes
+
+    @routes.setter
+    def routes(self, data: dict) -> None:
+        self._routes = {}
+        if not isinstance(data, dict) or len(data) == 0:
+            raise ValueError('Invalid routes')
+
+        for widgetkey, pageids in data.items():
+            if not widgetkey or not isinstance(widgetkey, str):
+                raise ValueError('Invalid widgetkey')
+            if not isinstance(pageids, list) or len(pageids) == 0:
+                raise ValueError(f'Missing pages for {widgetkey}')
+
+        self._routes = data
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, workers: int) -> None:
+        self._max_workers = 0
+        if workers < 1:
+            raise ValueError('Invalid max_workers')
+        self._max_workers = workers
+
+    @property
+    def pageids(self) -> list:
+        pageids = []
+        for widget_pageids in self.routes.values():
+            for pageid in widget_pageids:
+                if pageid not in pageids:
+                    pageids.append(pageid)
+        return pageids
+
+    def apply_config(self, config: ConfigLoader) -> None:
+        if config.routes != self.routes:
+            self.logger.info('Route changes take effect after a restart!')
+        for geckboard in self.geckboards.values():
+            geckboard.apply_config(config.geckoboard)
+        for cycle in self.cycles.values():
+            cycle.apply_config(config)
+
+    def is_active(self) -> bool:
+        return any(cycle.is_active() for cycle in self.cycles.values())
+
+    def _fetch_page(self, pageid: str) -> tuple | None:
+        self.logger.info(f'Fetching page {pageid}...')
+        cycle = self.cycles[pageid]
+        if not cycle.fetch():
+            self.logger.info(f'ERROR: Unable to fetch page {pageid}!')
+            return None
+        return (cycle.build_messages(), cycle.build_resolved_messages())
+
+    def _stale_message(self, pageids: list) -> str:
+        stale = [
+            self.cycles[pageid] for pageid in pageids
+            if self.cycles[pageid].stale_since is not None
+        ]
+        if not stale:
+            return ''
+        return min(
+            stale, key=lambda cycle: cycle.stale_since).build_stale_message()
+
+    def _push_widget(self, widgetkey: str, results: dict) -> bool:
+        pageids = self.routes[widgetkey]
+        if any(results[pageid] is None for pageid in pageids):
+            self.logger.info(f'ERROR: Skipping widget {widgetkey}!')
+            return False
+
+        geckboard = self.geckboards[widgetkey]
+        changed = any(self.cycles[pageid].has_changes() for pageid in pageids)
+        if not changed and not geckboard.refresh_due():
+            self.logger.info(f'No changes for widget {widgetkey}, skipping...')
+            return True
+
+        messages = [msg for pageid in pageids for msg in results[pageid][0]]
+        resolved = [msg for pageid in pageids for msg in results[pageid][1]]
+        outages = [
+            entry for pageid in pageids
+            for entry in self.cycles[pageid].outages()
+        ]
+        recovered = [
+            entry for pageid in pageids
+            for entry in self.cycles[pageid].recovered()
+        ]
+        stale = self._stale_message(pageids)
+        if len(messages) > 0:
+            msg = self.budget.fit(
+                geckboard, stale, messages, resolved, outages, recovered)
+        else:
+            head = stale + geckboard.build_msg('OK')  # type: ignore
+            msg = self.budget.fit(
+                geckboard, head, [], resolved, [], recovered)
+
+        self.logger.info(f'Pushing message to widget {widgetkey}...')
+        return geckboard.push_to_widget(msg)  # type: ignore
+
+    def run(self) -> bool:
+        from concurrent.futures import ThreadPoolExecutor
+
+        pageids = self.pageids
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched = executor.map(self._fetch_page, pageids)
+            results = dict(zip(pageids, fetched))
+            pushes = {
+                widgetkey: executor.submit(
+                    self._push_widget, widgetkey, results)
+                for widgetkey in self.routes
+            }
+            pushed = {
+                widgetkey: push.result() for widgetkey, push in pushes.items()
+            }
+
+        for pageid in pageids:
+            if results[pageid] is None:
+                continue
+            if all(
+                    pushed[widgetkey]
+                    for widgetkey, widget_pageids in self.routes.items()
+                    if pageid in widget_pageids):
+                self.cycles[pageid].commit()
+        return all(pushed.values())
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import os
+from collections.abc import Iterator
 
-import yaml
+from src.constants import constants
 
 
 class FileChecker:
+    SEPARATOR = constants.FILE_CHECKER_SEPARATOR
+    CHUNK_SIZE = constants.FILE_CHECKER_CHUNK_SIZE
+
     def __init__(self, file: str) -> None:
         self.file = file
 
@@ -47,6 +51,8 @@ class FileChecker:
         return True
 
     def is_yaml(self) -> dict | bool:
+        import yaml
+
         try:
             with open(self.file, 'r') as f:
                 data = yaml.safe_load(f)
@@ -56,20 +62,21 @@ class FileChecker:
         except yaml.YAMLError:
             return False
 
-    def is_text(self) -> list | bool:
-        try:
-            with open(self.file, 'r') as f:
-                data = [line.strip() for line in f]
+    def iter_text(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        with open(self.file, 'r') as f:
+            pending = ''
+            while chunk := f.read(chunk_size):
+                text = (pending + chunk).replace('\n', self.SEPARATOR)
+                parts = text.split(self.SEPARATOR)
+                pending = parts.pop()
+                yield from filter(None, map(str.strip, parts))
 
-            i = 0
-            while i < len(data):
-                if ',' in data[i]:
-                    parts = data[i].split(',')
-                    for part in parts:
-                        data.append(part)
-                    data.pop(i)
-                i += 1
+            pending = pending.strip()
+            if pending:
+                yield pending
 
-            return data
-        except BaseException:
+    def is_text(self) -> list | bool:
+        try:
+            return list(self.iter_text())
+        except (OSError, ValueError):
             return False
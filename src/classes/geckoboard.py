@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 import json
 import logging
-import logging.config
-
-import requests
 
+from src.classes.config_loader import GeckoboardConfig
 from src.classes.file_checker import FileChecker
+from src.classes.http_transport import HttpTransport, TransportError
+from src.classes.message_templates import MessageTemplates
+from src.classes.metrics import Metrics, timed
+from src.classes.push_coalescer import PushCoalescer
+from src.classes.push_state import PushState
 from src.constants import constants
 
 
@@ -13,13 +16,31 @@ class GeckboardApi:
     CREDENTIAL_KEYS = constants.GECKOBOARD_CREDENTIALS_KEYS
     SCHEME = constants.GECKOBOARD_API_SCHEME
 
-    def __init__(self, credentials_file: str) -> None:
-        self.credentials_file = credentials_file
+    def __init__(
+            self,
+            credentials_file: str = '',
+            transport: HttpTransport | None = None,
+            push_state: PushState | None = None,
+            widgetkey: str | None = None,
+            config: GeckoboardConfig | None = None,
+            metrics: Metrics | None = None,
+            coalescer: PushCoalescer | None = None,
+            templates: MessageTemplates | None = None) -> None:
+        self.widgetkey_override = widgetkey
         self.headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
-        self._auth()
+        if config:
+            self.apply_config(config)
+        else:
+            self.credentials_file = credentials_file
+            self._auth()
+        self.transport = transport or HttpTransport()
+        self.metrics = metrics or self.transport.metrics
+        self.push_state = push_state
+        self.coalescer = coalescer
+        self.templates = templates or MessageTemplates()
         self.logger = logging.getLogger(constants.PROGRAM_NAME)
 
     @property
@@ -65,32 +86,51 @@ class GeckboardApi:
 
     def _auth(self) -> None:
         self.apikey = self._credentials['apikey']
-        self.widgetkey = self._credentials['widgetkey']
+        self.widgetkey = (
+            self.widgetkey_override or self._credentials['widgetkey'])
         self.headers['Host'] = self._credentials['host']
 
+    def apply_config(self, config: GeckoboardConfig) -> None:
+        self.credentials = config.as_dict()
+        self._credentials_file = config.credentials_file
+        self._auth()
+
+    @timed('build_msg')
     def build_msg(
             self,
             status: str,
             platform_name=None,
-            product_name=None) -> str | bool:
-        if status.lower() == 'ok':
-            msg = '<center style="background-color: green;">'
-            msg += '<strong>OK</strong></center>'
-            return msg
-
-        elif status.lower() == 'down':
-            msg = '<span style="background-color: red;">'
-            msg += f'{platform_name} - {product_name} is <strong>DOWN!'
-            msg += '</strong></span>\n\n'
-            return msg
-
-        else:
+            product_name=None,
+            since=None,
+            products=None,
+            platforms=None) -> str | bool:
+        return self.templates.render(
+            status.lower(),
+            platform_name,
+            product_name,
+            since,
+            products,
+            platforms)
+
+    def refresh_due(self) -> bool:
+        if not self.push_state:
             return False
-
-    def push_to_widget(self, msg: str) -> bool:
-        endpoint = f'/v1/send/{self.widgetkey}'
-        url = self.SCHEME + self.headers['Host'] + endpoint
-        payload = {
+        return self.push_state.refresh_due(self.widgetkey)
+
+    def push_to_widget(self, msg: str, force: bool = False) -> bool:
+        if self.coalescer and self.coalescer.queued(self.widgetkey):
+            force = True
+        if self.push_state and not force:
+            if self.push_state.is_unchanged(self.widgetkey, msg):
+                self.logger.info('Widget content unchanged, skipping push!')
+                return True
+
+        if self.coalescer:
+            return self.coalescer.submit(self, msg)
+        return self.send(msg)
+
+    def build_payload(self, msg: str) -> dict:
+        return {
             'api_key': self.apikey,
             'data': {
                 'item': [{
@@ -99,14 +139,33 @@ class GeckboardApi:
                 }]
             }
         }
-        r = requests.post(
-            url=url,
-            headers=self.headers,
-            data=json.dumps(payload))
+
+    def payload_size(self, msg: str) -> int:
+        return len(json.dumps(self.build_payload(msg)))
+
+    @timed('push_to_widget')
+    def send(self, msg: str) -> bool:
+        endpoint = f'/v1/send/{self.widgetkey}'
+        url = self.SCHEME + self.headers['Host'] + endpoint
+        payload = self.build_payload(msg)
+        data = json.dumps(payload)
+        self.metrics.observe('payload_bytes', len(data))
+        try:
+            r = self.transport.post(
+                url=url,
+                headers=self.headers,
+                data=data)
+        except TransportError as e:
+            self.logger.info('ERROR: Unable to push message to Geckoboard!')
+            self.logger.info(f'Error Details: {(url, repr(e))}')
+            return False
         if r.status_code != 200:
             self.logger.info('ERROR: Unable to push message to Geckoboard!')
-            error = (payload, r.status_code, r.json())
+            error = (
+                payload, r.status_code, self.transport.error_details(r))
             self.logger.info(f'Error Details: {error}')
             return False
+        if self.push_state:
+            self.push_state.record(self.widgetkey, msg)
         self.logger.info('Successfully pushed message to Geckoboard!')
         return True
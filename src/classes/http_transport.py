@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+import threading
+import time
+from collections.abc import Iterator
+from urllib.parse import urlsplit
+
+from src.classes.metrics import Metrics
+from src.classes.rate_limiter import RateLimiter
+from src.classes.retry_policy import RetryPolicy
+from src.constants import constants
+
+
+class TransportError(Exception):
+    pass
+
+
+class HttpTransport:
+    def __init__(
+            self,
+            pool_connections: int = constants.HTTP_POOL_CONNECTIONS,
+            pool_maxsize: int = constants.HTTP_POOL_MAXSIZE,
+            connect_timeout: float = constants.HTTP_CONNECT_TIMEOUT,
+            read_timeout: float = constants.HTTP_READ_TIMEOUT,
+            metrics: Metrics | None = None,
+            retry: RetryPolicy | None = None,
+            limiter: RateLimiter | None = None) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.metrics = metrics or Metrics()
+        self.retry = retry or RetryPolicy()
+        self.limiter = limiter or RateLimiter()
+        self.sleep = time.sleep
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def pool_connections(self) -> int:
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, size: int) -> None:
+        self._pool_connections = 0
+        if size < 1:
+            raise ValueError('Invalid pool_connections')
+        self._pool_connections = size
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, size: int) -> None:
+        self._pool_maxsize = 0
+        if size < 1:
+            raise ValueError('Invalid pool_maxsize')
+        self._pool_maxsize = size
+
+    @property
+    def connect_timeout(self) -> float:
+        return self._connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, seconds: float) -> None:
+        self._connect_timeout = 0.0
+        if seconds <= 0:
+            raise ValueError('Invalid connect_timeout')
+        self._connect_timeout = float(seconds)
+
+    @property
+    def read_timeout(self) -> float:
+        return self._read_timeout
+
+    @read_timeout.setter
+    def read_timeout(self, seconds: float) -> None:
+        self._read_timeout = 0.0
+        if seconds <= 0:
+            raise ValueError('Invalid read_timeout')
+        self._read_timeout = float(seconds)
+
+    @property
+    def timeout(self) -> tuple:
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs):
+        import requests
+
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).hostname or ''
+        attempt = 0
+        while True:
+            waited = self.limiter.acquire(host)
+            if waited < 0:
+                raise TransportError(f'Rate limit wait exceeded for {host}')
+            if waited > 0:
+                self.metrics.observe(
+                    'rate_limit_wait_seconds', waited, host=host)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                self._record(host, method, 'error', start)
+                retryable = isinstance(e, requests.ConnectionError)
+                if not retryable or not self.retry.should_retry(attempt):
+                    raise TransportError(repr(e)) from e
+                delay = self.retry.delay(attempt)
+                reason = type(e).__name__
+            else:
+                self._record(host, method, response.status_code, start)
+                server_delay = self.retry.server_delay(response.headers)
+                if server_delay:
+                    self.limiter.block(host, server_delay)
+                if not self.retry.should_retry(
+                        attempt, response.status_code):
+                    break
+                delay = self.retry.delay(attempt, response.headers)
+                if delay is None:
+                    break
+                reason = str(response.status_code)
+                response.close()
+
+            attempt += 1
+            self.metrics.inc('retries_total', host=host, reason=reason)
+            self.sleep(delay)  # type: ignore
+
+        if not kwargs.get('stream'):
+            self.metrics.observe(
+                'response_bytes', len(response.content), host=host)
+        return response
+
+    def _record(self, host: str, method: str, code, start: float) -> None:
+        self.metrics.observe(
+            'request_duration_seconds',
+            time.perf_counter() - start,
+            host=host,
+            method=method)
+        self.metrics.inc(
+            'requests_total', host=host, method=method, code=str(code))
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    @staticmethod
+    def error_details(response) -> object:
+        try:
+            return response.json()
+        except ValueError:
+            return response.text[:constants.HTTP_ERROR_BODY_LIMIT]
+
+    def iter_content(self, response, chunk_size: int) -> Iterator[bytes]:
+        import requests
+
+        host = urlsplit(response.url or '').hostname or ''
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                size += len(chunk)
+                yield chunk
+        except requests.RequestException as e:
+            raise TransportError(repr(e)) from e
+        self.metrics.observe('response_bytes', size, host=host)
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
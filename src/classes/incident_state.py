@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import threading
+
+from src.classes.json_store import JsonStore
+from src.classes.records import IncidentEntry
+from src.constants import constants
+
+
+class IncidentDiff:
+    def __init__(
+            self,
+            new: dict,
+            changed: dict,
+            resolved: dict,
+            initial: bool = False) -> None:
+        self.new = new
+        self.changed = changed
+        self.resolved = resolved
+        self.initial = initial
+
+    def is_empty(self) -> bool:
+        if self.initial:
+            return False
+        return not (self.new or self.changed or self.resolved)
+
+
+class IncidentState:
+    def __init__(self, file: str = constants.INCIDENT_STATE_FILE) -> None:
+        self.store = JsonStore(file)
+        self.entries = {
+            pageid: IncidentEntry.load(snapshot)
+            for pageid, snapshot in self.store.load().items()
+        }
+        self._lock = threading.Lock()
+
+    def diff(self, pageid: str, snapshot: dict) -> IncidentDiff:
+        if pageid not in self.entries:
+            return IncidentDiff(dict(snapshot), {}, {}, initial=True)
+
+        previous = self.entries[pageid]
+        new = {}
+        changed = {}
+        for id, entry in snapshot.items():
+            if id not in previous:
+                new[id] = entry
+            elif previous[id].updated_at != entry.updated_at:
+                changed[id] = entry
+        resolved = {
+            id: entry for id, entry in previous.items() if id not in snapshot
+        }
+        return IncidentDiff(new, changed, resolved)
+
+    def save(self, pageid: str, snapshot: dict) -> bool:
+        with self._lock:
+            self.entries[pageid] = snapshot
+            return self.store.save({
+                pageid: IncidentEntry.dump(snapshot)
+                for pageid, snapshot in self.entries.items()
+            })
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+import fcntl
+import logging
+import os
+import signal
+import time
+
+from src.constants import constants
+
+
+class InstanceLock:
+    MODES = constants.LOCK_MODES
+
+    def __init__(
+            self,
+            file: str = constants.LOCK_FILE,
+            mode: str = constants.LOCK_DEFAULT_MODE,
+            timeout: float = constants.LOCK_WAIT_TIMEOUT,
+            stale_after: float = constants.LOCK_STALE_AFTER) -> None:
+        self.file = file
+        self.mode = mode
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.acquired_at = None
+        self.heartbeat_at = None
+        self.heartbeat_every = constants.LOCK_HEARTBEAT_INTERVAL
+        self.sleep = time.sleep
+        self._fd = None
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    @property
+    def file(self) -> str:
+        return self._file
+
+    @file.setter
+    def file(self, filepath: str) -> None:
+        self._file = ''
+        if not filepath:
+            raise ValueError('Invalid file')
+        filepath = os.path.abspath(os.path.expanduser(filepath))
+        if not os.path.isdir(os.path.dirname(filepath)):
+            raise ValueError('Unable to locate directory')
+        self._file = filepath
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: str) -> None:
+        self._mode = ''
+        if value not in self.MODES:
+            raise ValueError(f'Invalid mode {value}')
+        self._mode = value
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, seconds: float) -> None:
+        self._timeout = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid timeout')
+        self._timeout = float(seconds)
+
+    @property
+    def stale_after(self) -> float:
+        return self._stale_after
+
+    @stale_after.setter
+    def stale_after(self, seconds: float) -> None:
+        self._stale_after = 0.0
+        if seconds <= 0:
+            raise ValueError('Invalid stale_after')
+        self._stale_after = float(seconds)
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    @staticmethod
+    def _parse(data: str) -> tuple | None:
+        fields = data.split()
+        try:
+            pid = int(fields[0])
+            started_at = float(fields[1])
+            released_at = None
+            if len(fields) > 2 and fields[2] != '-':
+                released_at = float(fields[2])
+            heartbeat_at = float(fields[3]) if len(fields) > 3 else started_at
+        except (IndexError, ValueError):
+            return None
+        return (pid, started_at, released_at, heartbeat_at)
+
+    def holder(self) -> tuple | None:
+        try:
+            with open(self.file, 'r') as f:
+                return self._parse(f.read())
+        except OSError:
+            return None
+
+    def _held_for(self, holder: tuple | None) -> float:
+        if not holder:
+            return 0.0
+        end = holder[2] if holder[2] is not None else time.time()
+        return max(0.0, end - holder[1])
+
+    def _idle_for(self, holder: tuple | None) -> float:
+        if not holder:
+            return 0.0
+        return max(0.0, time.time() - holder[3])
+
+    def _log_previous(self, previous: tuple | None) -> None:
+        if not previous:
+            return
+        held = self._held_for(previous)
+        if previous[2] is None:
+            self.logger.info(
+                f'Previous run (pid {previous[0]}) exited without '
+                f'releasing the lock after {held:.1f}s')
+        else:
+            self.logger.info(
+                f'Previous run (pid {previous[0]}) held the lock '
+                f'for {held:.1f}s')
+
+    def _try_lock(self) -> bool:
+        if self._fd is not None:
+            return True
+        fd = os.open(self.file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        previous = self._parse(
+            os.pread(fd, 256, 0).decode('utf-8', 'replace'))
+        self.acquired_at = time.time()
+        self.heartbeat_at = self.acquired_at
+        os.ftruncate(fd, 0)
+        record = f'{os.getpid()} {self.acquired_at}\n'
+        os.pwrite(fd, record.encode('utf-8'), 0)
+        self._fd = fd
+        self._log_previous(previous)
+        return True
+
+    def heartbeat(self) -> bool:
+        if self._fd is None:
+            return False
+        now = time.time()
+        if now - self.heartbeat_at < self.heartbeat_every:  # type: ignore
+            return False
+        self.heartbeat_at = now
+        record = f'{os.getpid()} {self.acquired_at} - {now}\n'
+        try:
+            os.ftruncate(self._fd, 0)
+            os.pwrite(self._fd, record.encode('utf-8'), 0)
+        except OSError as e:
+            self.logger.info(f'ERROR: Unable to refresh the lock: {e}')
+            return False
+        return True
+
+    def _describe(self, holder: tuple | None) -> str:
+        if not holder:
+            return 'Another run'
+        return f'Previous run (pid {holder[0]})'
+
+    def acquire(self) -> bool:
+        if self.mode == 'none' or self.locked:
+            return True
+        if self._try_lock():
+            return True
+
+        holder = self.holder()
+        held = self._held_for(holder)
+        idle = self._idle_for(holder)
+        self.logger.info(
+            f'{self._describe(holder)} has held the lock for {held:.1f}s, '
+            f'last heartbeat {idle:.1f}s ago')
+
+        if self.mode == 'skip':
+            self.logger.info('Skipping this run!')
+            return False
+
+        if self.mode == 'kill-stale':
+            if idle < self.stale_after or not holder:
+                self.logger.info('Previous run is not stale, skipping...')
+                return False
+            self._terminate(holder[0])
+            if self.locked:
+                return True
+            return self._wait(self.timeout)
+
+        return self._wait(self.timeout)
+
+    def _wait(self, timeout: float) -> bool:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
+            self.sleep(constants.LOCK_POLL_INTERVAL)
+            if self._try_lock():
+                waited = time.monotonic() - start
+                self.logger.info(f'Acquired the lock after {waited:.1f}s')
+                return True
+        self.logger.info(
+            f'ERROR: Timed out after {timeout}s waiting for the lock!')
+        return False
+
+    def _terminate(self, pid: int) -> None:
+        if pid == os.getpid():
+            return
+        self.logger.info(f'Terminating stale run (pid {pid})...')
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                return
+            except PermissionError:
+                self.logger.info(f'ERROR: Not allowed to signal pid {pid}!')
+                return
+            deadline = time.monotonic() + constants.LOCK_KILL_GRACE
+            while time.monotonic() < deadline:
+                if self._try_lock():
+                    return
+                self.sleep(constants.LOCK_POLL_INTERVAL)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        released_at = time.time()
+        held = released_at - self.acquired_at  # type: ignore
+        record = f'{os.getpid()} {self.acquired_at} {released_at}\n'
+        try:
+            os.ftruncate(self._fd, 0)
+            os.pwrite(self._fd, record.encode('utf-8'), 0)
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+        self.logger.info(f'Released the lock after {held:.1f}s')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import json
+import os
+import tempfile
+
+
+class JsonStore:
+    def __init__(self, file: str) -> None:
+        self.file = file
+
+    @property
+    def file(self) -> str:
+        return self._file
+
+    @file.setter
+    def file(self, filepath: str) -> None:
+        self._file = ''
+        if not filepath:
+            raise ValueError('Invalid file')
+        filepath = os.path.abspath(os.path.expanduser(filepath))
+        if not os.path.isdir(os.path.dirname(filepath)):
+            raise ValueError('Unable to locate directory')
+        self._file = filepath
+
+    def load(self) -> dict:
+        try:
+            with open(self.file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def save(self, data: dict) -> bool:
+        dir = os.path.dirname(self.file)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=dir, suffix='.tmp')
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(json.dumps(data))
+            os.replace(tmp, self.file)
+        except (OSError, TypeError, ValueError):
+            os.unlink(tmp)
+            return False
+        return True
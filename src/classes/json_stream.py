@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+
+
+class JsonArrayStream:
+    TOKENS = re.compile(r'[\[\]{}"\\]')
+
+    def __init__(self, chunks: Iterable) -> None:
+        self.chunks = chunks
+
+    def _text(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk)
+            if chunk:
+                yield chunk
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+    def __iter__(self) -> Iterator:
+        buffer = ''
+        pos = 0
+        depth = 0
+        start = -1
+        in_string = False
+        escaped = False
+        started = False
+        finished = False
+
+        for chunk in self._text():
+            if finished:
+                break
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                if chunk[0] != '[':
+                    raise ValueError('Not a JSON array')
+                started = True
+
+            buffer += chunk
+            if escaped:
+                pos += 1
+                escaped = False
+
+            for match in self.TOKENS.finditer(buffer, pos):
+                i = match.start()
+                if i < pos:
+                    continue
+                token = match.group()
+                pos = i + 1
+                if in_string:
+                    if token == '\\':
+                        if i + 1 >= len(buffer):
+                            escaped = True
+                            break
+                        pos = i + 2
+                    elif token == '"':
+                        in_string = False
+                    continue
+
+                if token == '"':
+                    in_string = True
+                elif token in '[{':
+                    if depth == 1:
+                        start = i
+                    depth += 1
+                elif token in ']}':
+                    depth -= 1
+                    if depth == 1 and start >= 0:
+                        yield json.loads(buffer[start:pos])
+                        start = -1
+                    elif depth == 0:
+                        finished = True
+                        break
+
+            if start >= 0:
+                buffer = buffer[start:]
+                pos -= start
+                start = 0
+            else:
+                buffer = buffer[pos:]
+                pos = 0
+
+        if not started or not finished:
+            raise ValueError('Truncated JSON array')
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+import atexit
+import configparser
+import importlib
+import logging
+import os
+import queue
+import socket
+import sys
+import time
+
+from src.classes.json_store import JsonStore
+from src.constants import constants
+
+
+def get_hostname() -> str:
+    hostname = socket.gethostname()
+    if not hostname:
+        return 'localhost'
+    return hostname
+
+
+def get_pid() -> int:
+    pid = os.getpid()
+    if pid > 0:
+        return pid
+    return -1
+
+
+class EventDate:
+    __slots__ = ('created',)
+    _cache = (-1, '')
+
+    def __init__(self, created: float) -> None:
+        self.created = created
+
+    def __str__(self) -> str:
+        second = int(self.created)
+        cached_second, formatted = EventDate._cache
+        if second != cached_second:
+            formatted = time.strftime(
+                constants.EVENT_DATE_FORMAT, time.localtime(second))
+            EventDate._cache = (second, formatted)
+        return formatted
+
+
+class RecordFactory:
+    def __init__(self, base=None) -> None:
+        base = base or logging.getLogRecordFactory()
+        while isinstance(base, RecordFactory):
+            base = base.base
+        self.base = base
+        self.hostname = get_hostname()
+        self.pid = get_pid()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self.refresh_pid)
+
+    def refresh_pid(self) -> None:
+        self.pid = get_pid()
+
+    def __call__(self, *args, **kwargs) -> logging.LogRecord:
+        record = self.base(*args, **kwargs)
+        record.event_date = EventDate(record.created)
+        record.hostname = self.hostname
+        record.program = constants.PROGRAM_NAME
+        record.pid = self.pid
+        return record
+
+    def install(self) -> None:
+        logging.setLogRecordFactory(self)
+
+
+class LoggingSetup:
+    SUPPORTED_FORMATTERS = ['logging.Formatter']
+
+    def __init__(
+            self,
+            config_file: str,
+            cache_file: str = constants.LOGGING_CACHE_FILE,
+            use_queue: bool = constants.LOGGING_USE_QUEUE) -> None:
+        self.config_file = config_file
+        self.store = JsonStore(cache_file)
+        self.use_queue = use_queue
+
+    def _source(self) -> dict:
+        stat = os.stat(self.config_file)
+        return {
+            'file': self.config_file,
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'path': sys.path[0]
+        }
+
+    def configure(self) -> bool:
+        self.stop()
+        source = self._source()
+        cached = self.store.load()
+        if cached.get('source') == source:
+            try:
+                self._apply(cached['spec'])
+                self._enqueue()
+                return True
+            except (AttributeError, KeyError, TypeError, ValueError, OSError):
+                pass
+
+        importlib.import_module('logging.config').fileConfig(self.config_file)
+        spec = self._translate()
+        if spec:
+            self.store.save({'source': source, 'spec': spec})
+        self._enqueue()
+        return False
+
+    @staticmethod
+    def _loggers() -> list:
+        loggers = [logging.getLogger()]
+        for logger in list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(logger, logging.Logger):
+                loggers.append(logger)
+        return loggers
+
+    def _enqueue(self) -> None:
+        if not self.use_queue:
+            return
+
+        handlers = importlib.import_module('logging.handlers')
+        queued = {}
+        for logger in self._loggers():
+            for handler in logger.handlers[:]:
+                if isinstance(handler, handlers.QueueHandler):
+                    continue
+                if handler not in queued:
+                    records = queue.SimpleQueue()
+                    queue_handler = handlers.QueueHandler(records)
+                    queue_handler.listener = handlers.QueueListener(
+                        records, handler, respect_handler_level=True)
+                    queue_handler.listener.start()
+                    queued[handler] = queue_handler
+                logger.removeHandler(handler)
+                logger.addHandler(queued[handler])
+
+        if queued:
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        handlers = importlib.import_module('logging.handlers')
+        stopped = set()
+        for logger in self._loggers():
+            for handler in logger.handlers[:]:
+                if not isinstance(handler, handlers.QueueHandler):
+                    continue
+                listener = getattr(handler, 'listener', None)
+                if listener is None:
+                    continue
+                if listener not in stopped:
+                    if listener._thread is not None:
+                        listener.stop()
+                    stopped.add(listener)
+                logger.removeHandler(handler)
+                for target in listener.handlers:
+                    logger.addHandler(target)
+
+    def _translate(self) -> dict | None:
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(self.config_file)
+        spec = {'formatters': {}, 'handlers': {}, 'loggers': {}}
+        try:
+            for name in self._keys(parser, 'formatters'):
+                section = parser[f'formatter_{name}']
+                formatter_class = section.get('class', 'logging.Formatter')
+                if formatter_class not in self.SUPPORTED_FORMATTERS:
+                    return None
+                spec['formatters'][name] = {
+                    'format': section.get('format', None, raw=True),
+                    'datefmt': section.get('datefmt', None, raw=True)
+                }
+
+            for name in self._keys(parser, 'handlers'):
+                section = parser[f'handler_{name}']
+                args = eval(section.get('args', '()'), vars(logging))
+                kwargs = eval(section.get('kwargs', '{}'), vars(logging))
+                spec['handlers'][name] = {
+                    'class': section['class'],
+                    'level': section.get('level', 'NOTSET'),
+                    'formatter': section.get('formatter', ''),
+                    'args': list(args),
+                    'kwargs': kwargs
+                }
+
+            for name in self._keys(parser, 'loggers'):
+                section = parser[f'logger_{name}']
+                qualname = '' if name == 'root' else section['qualname']
+                spec['loggers'][qualname] = {
+                    'level': section.get('level', 'NOTSET'),
+                    'handlers': self._list(section.get('handlers', '')),
+                    'propagate': section.getint('propagate', 1)
+                }
+        except (KeyError, SyntaxError, NameError, ValueError):
+            return None
+        return spec
+
+    @staticmethod
+    def _list(value: str) -> list:
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def _keys(self, parser: configparser.ConfigParser, section: str) -> list:
+        return self._list(parser[section]['keys'])
+
+    @staticmethod
+    def _resolve(name: str):
+        if hasattr(logging, name):
+            return getattr(logging, name)
+        handlers = importlib.import_module('logging.handlers')
+        if hasattr(handlers, name):
+            return getattr(handlers, name)
+        module, _, attr = name.rpartition('.')
+        if module in ('logging', 'logging.handlers'):
+            return getattr(importlib.import_module(module), attr)
+        raise ValueError(f'Unsupported handler class {name}')
+
+    def _apply(self, spec: dict) -> None:
+        formatters = {
+            name: logging.Formatter(data['format'], data['datefmt'])
+            for name, data in spec['formatters'].items()
+        }
+
+        handlers = {}
+        for name, data in spec['handlers'].items():
+            handler = self._resolve(data['class'])(
+                *data['args'], **data['kwargs'])
+            handler.setLevel(data['level'])
+            if data['formatter']:
+                handler.setFormatter(formatters[data['formatter']])
+            handlers[name] = handler
+
+        for qualname, data in spec['loggers'].items():
+            logger = logging.getLogger(qualname or None)
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
+            logger.setLevel(data['level'])
+            logger.propagate = bool(data['propagate'])
+            logger.disabled = False
+            for name in data['handlers']:
+                logger.addHandler(handlers[name])
+
+        self._disable_existing(spec['loggers'])
+
+    @staticmethod
+    def _disable_existing(configured: dict) -> None:
+        parents = tuple(f'{name}.' for name in configured if name)
+        for name, logger in list(
+                logging.Logger.manager.loggerDict.items()):
+            if not isinstance(logger, logging.Logger):
+                continue
+            if name in configured or name.startswith(parents):
+                continue
+            logger.disabled = True
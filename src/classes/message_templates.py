@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import functools
+import html
+import logging
+import os
+from string import Template
+
+from src.classes.file_checker import FileChecker
+from src.constants import constants
+
+
+class MessageTemplates:
+    DEFAULTS = constants.MESSAGE_TEMPLATES
+    FIELDS = constants.MESSAGE_TEMPLATE_FIELDS
+
+    def __init__(
+            self,
+            file: str = constants.MESSAGE_TEMPLATES_FILE,
+            cache_size: int = constants.MESSAGE_RENDER_CACHE_SIZE) -> None:
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+        self.file = file
+        self.render = functools.lru_cache(maxsize=cache_size)(self._render)
+
+    @property
+    def file(self) -> str:
+        return self._file
+
+    @file.setter
+    def file(self, filepath: str) -> None:
+        self._file = ''
+        self.templates = self._compile(self.DEFAULTS)
+        if not filepath or not os.path.exists(os.path.expanduser(filepath)):
+            return
+
+        fc = FileChecker(filepath)
+        if not fc.is_file():
+            raise ValueError('Not a file')
+
+        if not fc.is_readable():
+            raise ValueError('Not readable')
+
+        data = fc.is_yaml()
+        if not data:
+            raise ValueError('Not YAML')
+
+        overrides = data.get('templates')  # type: ignore
+        if not isinstance(overrides, dict):
+            raise ValueError('Invalid templates file')
+
+        templates = dict(self.DEFAULTS)
+        for status, text in overrides.items():
+            if status not in self.DEFAULTS or not isinstance(text, str):
+                raise ValueError(f'Invalid template {status}')
+            templates[status] = text
+
+        self.templates = self._compile(templates)
+        self._file = fc.file
+        self.logger.info(f'Loaded message templates from {fc.file}')
+
+    def _compile(self, templates: dict) -> dict:
+        compiled = {}
+        fields = {field: '' for field in self.FIELDS}
+        for status, text in templates.items():
+            template = Template(text)
+            try:
+                template.substitute(fields)
+            except (KeyError, ValueError):
+                raise ValueError(f'Invalid template {status}')
+            compiled[status] = template
+        return compiled
+
+    def _render(
+            self,
+            status: str,
+            platform_name=None,
+            product_name=None,
+            since=None,
+            products=None,
+            platforms=None) -> str | bool:
+        template = self.templates.get(status.lower())
+        if not template:
+            return False
+
+        return template.substitute(
+            platform_name=html.escape(str(platform_name)),
+            product_name=html.escape(str(product_name)),
+            since=html.escape(str(since)),
+            products=html.escape(str(products)),
+            platforms=html.escape(str(platforms)))
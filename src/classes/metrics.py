@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+import bisect
+import functools
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from src.constants import constants
+
+
+class Metrics:
+    PREFIX = constants.METRICS_PREFIX
+    BUCKETS = {
+        'duration': constants.METRICS_DURATION_BUCKETS,
+        'bytes': constants.METRICS_BYTES_BUCKETS
+    }
+    DEFINITIONS = {
+        'request_duration_seconds': (
+            'histogram', 'duration',
+            'Latency of upstream HTTP requests.'),
+        'requests_total': (
+            'counter', None,
+            'Upstream HTTP requests by status code.'),
+        'retries_total': (
+            'counter', None,
+            'Upstream HTTP requests retried by reason.'),
+        'rate_limit_wait_seconds': (
+            'histogram', 'duration',
+            'Time spent waiting for the per-host rate limiter.'),
+        'response_bytes': (
+            'histogram', 'bytes',
+            'Size of upstream response bodies.'),
+        'payload_bytes': (
+            'histogram', 'bytes',
+            'Size of payloads pushed to Geckoboard.'),
+        'payload_truncated_total': (
+            'counter', None,
+            'Geckoboard messages shortened to fit the payload limit by view.'),
+        'pushes_coalesced_total': (
+            'counter', None,
+            'Queued Geckoboard pushes replaced by a newer message by widget.'),
+        'phase_duration_seconds': (
+            'histogram', 'duration',
+            'Time spent in each phase of a cycle.'),
+        'incidents': (
+            'gauge', None,
+            'Unresolved incidents on the page.'),
+        'stale_data': (
+            'gauge', None,
+            'Whether the page is served from the last known good snapshot.'),
+        'cycle_duration_seconds': (
+            'histogram', 'duration',
+            'Time spent in a full cycle.'),
+        'cycles_total': (
+            'counter', None,
+            'Cycles run by result.'),
+        'last_success_timestamp_seconds': (
+            'gauge', None,
+            'Unix time of the last successful cycle.')
+    }
+
+    def __init__(self, textfile: str | None = None) -> None:
+        self.textfile = textfile
+        self._lock = threading.Lock()
+        self._values = {}
+
+    @property
+    def textfile(self) -> str | None:
+        return self._textfile
+
+    @textfile.setter
+    def textfile(self, filepath: str | None) -> None:
+        self._textfile = None
+        if not filepath:
+            return
+        filepath = os.path.abspath(os.path.expanduser(filepath))
+        if not os.path.isdir(os.path.dirname(filepath)):
+            raise ValueError('Unable to locate directory')
+        self._textfile = filepath
+
+    def _definition(self, name: str, kind: str) -> tuple:
+        definition = self.DEFINITIONS.get(name)
+        if not definition or definition[0] != kind:
+            raise ValueError(f'Unknown {kind} {name}')
+        return definition
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return (name, tuple(sorted(labels.items())))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        self._definition(name, 'counter')
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        self._definition(name, 'gauge')
+        with self._lock:
+            self._values[self._key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        buckets = self.BUCKETS[self._definition(name, 'histogram')[1]]
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = [[0] * len(buckets), 0.0, 0]
+                self._values[key] = histogram
+            index = bisect.bisect_left(buckets, value)
+            if index < len(buckets):
+                histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def get(self, name: str, **labels):
+        with self._lock:
+            value = self._values.get(self._key(name, labels))
+            if isinstance(value, list):
+                return value[2]
+            return value
+
+    @contextmanager
+    def time(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def _labels(labels: tuple, extra: tuple = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return ''
+        escaped = []
+        for label, value in pairs:
+            value = str(value).replace('\\', r'\\').replace(
+                '"', r'\"').replace('\n', r'\n')
+            escaped.append(f'{label}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self) -> str:
+        with self._lock:
+            values = {
+                key: [list(value[0]), value[1], value[2]]
+                if isinstance(value, list) else value
+                for key, value in self._values.items()
+            }
+
+        lines = []
+        for name, (kind, buckets, help) in self.DEFINITIONS.items():
+            series = sorted(
+                (labels, value) for (metric, labels), value in values.items()
+                if metric == name)
+            if not series:
+                continue
+            metric = self.PREFIX + name
+            lines.append(f'# HELP {metric} {help}')
+            lines.append(f'# TYPE {metric} {kind}')
+            for labels, value in series:
+                if kind != 'histogram':
+                    lines.append(f'{metric}{self._labels(labels)} {value}')
+                    continue
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket in zip(self.BUCKETS[buckets], counts):
+                    cumulative += bucket
+                    le = self._labels(labels, (('le', bound),))
+                    lines.append(f'{metric}_bucket{le} {cumulative}')
+                le = self._labels(labels, (('le', '+Inf'),))
+                lines.append(f'{metric}_bucket{le} {count}')
+                lines.append(f'{metric}_sum{self._labels(labels)} {total}')
+                lines.append(f'{metric}_count{self._labels(labels)} {count}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def record_cycle(self, result: bool, seconds: float) -> None:
+        self.observe('cycle_duration_seconds', seconds)
+        self.inc('cycles_total', result='success' if result else 'failure')
+        if result:
+            self.set('last_success_timestamp_seconds', time.time())
+
+    def flush(self) -> bool:
+        if not self.textfile:
+            return True
+
+        dir = os.path.dirname(self.textfile)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=dir, suffix='.tmp')
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.render())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.textfile)
+        except OSError:
+            os.unlink(tmp)
+            return False
+        return True
+
+
+def timed(phase: str):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.time('phase_duration_seconds', phase=phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.classes.metrics import Metrics
+from src.constants import constants
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    server: 'MetricsServer'
+
+    def do_GET(self) -> None:
+        if self.path != constants.METRICS_PATH:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = self.server.metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', constants.METRICS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            metrics: Metrics,
+            host: str = constants.METRICS_DEFAULT_HOST,
+            port: int = constants.METRICS_DEFAULT_PORT) -> None:
+        self.metrics = metrics
+        self._thread = None
+        super().__init__((host, port), MetricsHandler)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='metrics', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import logging
+
+from src.classes.geckoboard import GeckboardApi
+from src.constants import constants
+
+
+class PayloadBudget:
+    def __init__(
+            self,
+            limit: int = constants.GECKOBOARD_PAYLOAD_LIMIT) -> None:
+        self.limit = limit
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @limit.setter
+    def limit(self, size: int) -> None:
+        self._limit = 0
+        if size < 1:
+            raise ValueError('Invalid limit')
+        self._limit = size
+
+    @staticmethod
+    def _count(count: int, name: str) -> str:
+        if count == 1:
+            return f'{count} {name}'
+        return f'{count} {name}s'
+
+    @staticmethod
+    def group(entries: list) -> dict:
+        groups = {}
+        for entry in entries:
+            products = groups.setdefault(entry.platform_name, set())
+            products.add(entry.product_name)
+        return dict(sorted(
+            groups.items(), key=lambda item: (-len(item[1]), str(item[0]))))
+
+    def _grouped(
+            self,
+            geckboard: GeckboardApi,
+            status: str,
+            entries: list) -> list:
+        return [
+            geckboard.build_msg(  # type: ignore
+                status,
+                platform_name=platform_name,
+                products=self._count(len(products), 'product'))
+            for platform_name, products in self.group(entries).items()
+        ]
+
+    def _summary(self, geckboard: GeckboardApi, outages: list) -> str:
+        if not outages:
+            return ''
+        groups = self.group(outages)
+        products = sum(len(products) for products in groups.values())
+        return geckboard.build_msg(  # type: ignore
+            'SUMMARY',
+            products=self._count(products, 'product'),
+            platforms=self._count(len(groups), 'platform'))
+
+    def fits(self, geckboard: GeckboardApi, msg: str) -> bool:
+        return geckboard.payload_size(msg) <= self.limit
+
+    def fit(
+            self,
+            geckboard: GeckboardApi,
+            head: str,
+            messages: list,
+            resolved: list,
+            outages: list,
+            recovered: list) -> str:
+        msg = head + ''.join(messages + resolved)
+        if self.fits(geckboard, msg):
+            return msg
+
+        self.logger.info(
+            f'Message is over {self.limit} bytes, grouping by platform...')
+        msg = head + ''.join(
+            self._grouped(geckboard, 'DOWN_GROUP', outages)
+            + self._grouped(geckboard, 'RESOLVED_GROUP', recovered))
+        if self.fits(geckboard, msg):
+            geckboard.metrics.inc('payload_truncated_total', view='grouped')
+            return msg
+
+        self.logger.info(
+            f'Grouped message is over {self.limit} bytes, summarizing...')
+        geckboard.metrics.inc('payload_truncated_total', view='summary')
+        return head + self._summary(geckboard, outages)
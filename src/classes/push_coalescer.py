@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import logging
+import threading
+import time
+
+from src.classes.metrics import Metrics
+from src.constants import constants
+
+
+class PushCoalescer:
+    def __init__(
+            self,
+            window: float = constants.PUSH_COALESCE_WINDOW,
+            max_delay: float = constants.PUSH_COALESCE_MAX_DELAY,
+            max_workers: int = constants.FAN_OUT_MAX_WORKERS,
+            metrics: Metrics | None = None) -> None:
+        self.window = window
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.metrics = metrics or Metrics()
+        self.pending = {}
+        self.sending = set()
+        self.first_at = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @window.setter
+    def window(self, seconds: float) -> None:
+        self._window = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid window')
+        self._window = float(seconds)
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, seconds: float) -> None:
+        self._max_delay = 0.0
+        if seconds < self.window:
+            raise ValueError('Invalid max_delay')
+        self._max_delay = float(seconds)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, workers: int) -> None:
+        self._max_workers = 0
+        if workers < 1:
+            raise ValueError('Invalid max_workers')
+        self._max_workers = workers
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _queue(self, geckboard, msg: str, delay: float) -> None:
+        widgetkey = geckboard.widgetkey
+        if widgetkey in self.pending:
+            self.metrics.inc('pushes_coalesced_total', widgetkey=widgetkey)
+        self.pending[widgetkey] = (geckboard, msg)
+        now = time.monotonic()
+        if self.first_at is None:
+            self.first_at = now
+        deadline = self.first_at + self.max_delay
+        self._schedule(max(0.0, min(delay, deadline - now)))
+
+    def queued(self, widgetkey: str) -> bool:
+        with self._lock:
+            return widgetkey in self.pending or widgetkey in self.sending
+
+    def submit(self, geckboard, msg: str) -> bool:
+        if self.window <= 0:
+            return geckboard.send(msg)
+        with self._lock:
+            self._queue(geckboard, msg, self.window)
+        self.logger.info(
+            f'Queued push to widget {geckboard.widgetkey} for '
+            f'{self.window}s...')
+        return True
+
+    def flush(self, retry: bool = True) -> bool:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._flush_lock:
+            with self._lock:
+                pending = self.pending
+                self.pending = {}
+                self.sending = set(pending)
+                self.first_at = None
+                if self._timer:
+                    self._timer.cancel()
+                    self._timer = None
+            if not pending:
+                return True
+
+            self.logger.info(f'Flushing {len(pending)} queued pushes...')
+            workers = min(self.max_workers, len(pending))
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = {
+                        widgetkey: executor.submit(geckboard.send, msg)
+                        for widgetkey, (geckboard, msg) in pending.items()
+                    }
+                    pushed = {
+                        widgetkey: result.result()
+                        for widgetkey, result in results.items()
+                    }
+            finally:
+                with self._lock:
+                    self.sending = set()
+
+            with self._lock:
+                for widgetkey, result in pushed.items():
+                    if result or not retry or widgetkey in self.pending:
+                        continue
+                    self.logger.info(
+                        f'ERROR: Push to widget {widgetkey} failed, '
+                        f'retrying in {self.max_delay}s...')
+                    geckboard, msg = pending[widgetkey]
+                    self._queue(geckboard, msg, self.max_delay)
+        return all(pushed.values())
+
+    def close(self) -> bool:
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        return self.flush(retry=False)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import hashlib
+import threading
+import time
+
+from src.classes.json_store import JsonStore
+from src.constants import constants
+
+
+class PushState:
+    def __init__(
+            self,
+            file: str = constants.PUSH_STATE_FILE,
+            refresh_interval: float = constants.PUSH_REFRESH_INTERVAL) -> None:
+        self.store = JsonStore(file)
+        self.refresh_interval = refresh_interval
+        self.entries = self.store.load()
+        self._lock = threading.Lock()
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval
+
+    @refresh_interval.setter
+    def refresh_interval(self, seconds: float) -> None:
+        self._refresh_interval = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid refresh_interval')
+        self._refresh_interval = float(seconds)
+
+    @staticmethod
+    def digest(msg: str) -> str:
+        return hashlib.sha256(msg.encode('utf-8')).hexdigest()
+
+    def refresh_due(self, widgetkey: str) -> bool:
+        entry = self.entries.get(widgetkey)
+        if not entry:
+            return True
+        elapsed = time.time() - entry.get('pushed_at', 0)
+        return elapsed >= self.refresh_interval
+
+    def is_unchanged(self, widgetkey: str, msg: str) -> bool:
+        entry = self.entries.get(widgetkey)
+        if not entry or entry.get('digest') != self.digest(msg):
+            return False
+        return not self.refresh_due(widgetkey)
+
+    def record(self, widgetkey: str, msg: str) -> bool:
+        with self._lock:
+            self.entries[widgetkey] = {
+                'digest': self.digest(msg),
+                'pushed_at': time.time()
+            }
+            return self.store.save(self.entries)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import threading
+import time
+
+from src.constants import constants
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @rate.setter
+    def rate(self, tokens: float) -> None:
+        self._rate = 0.0
+        if tokens <= 0:
+            raise ValueError('Invalid rate')
+        self._rate = float(tokens)
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, tokens: float) -> None:
+        self._capacity = 0.0
+        if tokens < 1:
+            raise ValueError('Invalid capacity')
+        self._capacity = float(tokens)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(
+            self,
+            max_wait: float | None = None,
+            now: float | None = None) -> float:
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            self._refill(now)
+            wait = max(
+                (1 - self.tokens) / self.rate, self.blocked_until - now, 0.0)
+            if max_wait is not None and wait > max_wait:
+                return -1.0
+            self.tokens -= 1
+            return wait
+
+    def block(self, seconds: float, now: float | None = None) -> None:
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    def __init__(
+            self,
+            limits: dict = constants.HTTP_RATE_LIMITS,
+            default: tuple | None = constants.HTTP_RATE_LIMIT_DEFAULT,
+            max_wait: float = constants.HTTP_RATE_LIMIT_MAX_WAIT) -> None:
+        self.limits = dict(limits)
+        self.default = default
+        self.max_wait = max_wait
+        self.buckets = {}
+        self._lock = threading.Lock()
+        self.sleep = time.sleep
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        with self._lock:
+            if host not in self.buckets:
+                limit = self.limits.get(host, self.default)
+                self.buckets[host] = TokenBucket(*limit) if limit else None
+            return self.buckets[host]
+
+    def acquire(self, host: str) -> float:
+        bucket = self.bucket(host)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve(self.max_wait)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def block(self, host: str, seconds: float) -> None:
+        bucket = self.bucket(host)
+        if bucket is not None:
+            bucket.block(seconds)
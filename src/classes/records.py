@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import sys
+from dataclasses import dataclass
+
+
+def _intern(value: str | None) -> str | None:
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Platform:
+    id: str
+    name: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Platform':
+        return cls(id=_intern(data['id']), name=_intern(data['name']))
+
+
+@dataclass(frozen=True, slots=True)
+class Component:
+    name: str
+    group_id: str | None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Component':
+        return cls(
+            name=_intern(data['name']),
+            group_id=_intern(data.get('group_id')))
+
+
+@dataclass(frozen=True, slots=True)
+class Incident:
+    id: str
+    status: str | None
+    impact: str
+    updated_at: str | None
+    components: tuple
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Incident':
+        return cls(
+            id=data['id'],
+            status=_intern(data.get('status')),
+            impact=_intern(data.get('impact') or 'none'),
+            updated_at=data.get('updated_at'),
+            components=tuple(
+                Component.from_dict(component)
+                for component in data.get('components') or []))
+
+
+@dataclass(frozen=True, slots=True)
+class IncidentEntry:
+    updated_at: str | None
+    impact: str
+    platform_name: str
+    product_name: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'IncidentEntry':
+        return cls(
+            updated_at=data.get('updated_at'),
+            impact=_intern(data.get('impact') or 'none'),
+            platform_name=_intern(data.get('platform_name') or ''),
+            product_name=_intern(data.get('product_name') or ''))
+
+    def to_dict(self) -> dict:
+        return {
+            'updated_at': self.updated_at,
+            'impact': self.impact,
+            'platform_name': self.platform_name,
+            'product_name': self.product_name
+        }
+
+    @classmethod
+    def load(cls, data: dict) -> dict:
+        return {id: cls.from_dict(entry) for id, entry in data.items()}
+
+    @staticmethod
+    def dump(snapshot: dict) -> dict:
+        return {id: entry.to_dict() for id, entry in snapshot.items()}
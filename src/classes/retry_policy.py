@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+import random
+import time
+
+from src.constants import constants
+
+
+class RetryPolicy:
+    RETRY_AFTER_HEADERS = ['Retry-After']
+    REMAINING_HEADERS = ['X-RateLimit-Remaining', 'RateLimit-Remaining']
+    RESET_HEADERS = ['X-RateLimit-Reset', 'RateLimit-Reset']
+
+    def __init__(
+            self,
+            max_retries: int = constants.HTTP_RETRY_MAX_RETRIES,
+            backoff: float = constants.HTTP_RETRY_BACKOFF,
+            max_delay: float = constants.HTTP_RETRY_MAX_DELAY,
+            statuses: list = constants.HTTP_RETRY_STATUSES) -> None:
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self._random = random.Random()
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, retries: int) -> None:
+        self._max_retries = 0
+        if retries < 0:
+            raise ValueError('Invalid max_retries')
+        self._max_retries = retries
+
+    @property
+    def backoff(self) -> float:
+        return self._backoff
+
+    @backoff.setter
+    def backoff(self, seconds: float) -> None:
+        self._backoff = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid backoff')
+        self._backoff = float(seconds)
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, seconds: float) -> None:
+        self._max_delay = 0.0
+        if seconds < 0:
+            raise ValueError('Invalid max_delay')
+        self._max_delay = float(seconds)
+
+    def should_retry(self, attempt: int, status: int | None = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return status is None or status in self.statuses
+
+    def backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.backoff * (2 ** attempt))
+        return self._random.uniform(ceiling / 2, ceiling)
+
+    @staticmethod
+    def _header(headers, names: list) -> str | None:
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                return value
+        return None
+
+    @staticmethod
+    def _seconds(value: str | None, now: float) -> float | None:
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            from email.utils import parsedate_to_datetime
+
+            try:
+                return parsedate_to_datetime(value).timestamp() - now
+            except (TypeError, ValueError):
+                return None
+        if seconds > constants.HTTP_RATE_LIMIT_EPOCH:
+            return seconds - now
+        return seconds
+
+    def server_delay(self, headers, now: float | None = None) -> float | None:
+        if now is None:
+            now = time.time()
+        delay = self._seconds(
+            self._header(headers, self.RETRY_AFTER_HEADERS), now)
+        if delay is not None:
+            return max(0.0, delay)
+
+        remaining = self._header(headers, self.REMAINING_HEADERS)
+        try:
+            exhausted = remaining is not None and float(remaining) <= 0
+        except ValueError:
+            exhausted = False
+        if not exhausted:
+            return None
+        delay = self._seconds(self._header(headers, self.RESET_HEADERS), now)
+        if delay is None:
+            return None
+        return max(0.0, delay)
+
+    def delay(self, attempt: int, headers=None) -> float | None:
+        if headers is not None:
+            delay = self.server_delay(headers)
+            if delay is not None:
+                if delay > self.max_delay:
+                    return None
+                return delay
+        return self.backoff_delay(attempt)
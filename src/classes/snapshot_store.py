@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+import threading
+import time
+
+from src.classes.json_store import JsonStore
+from src.classes.records import IncidentEntry
+from src.constants import constants
+
+
+class SnapshotStore:
+    def __init__(self, file: str = constants.SNAPSHOT_FILE) -> None:
+        self.store = JsonStore(file)
+        self.entries = self.store.load()
+        self._lock = threading.Lock()
+
+    def get(self, pageid: str) -> dict | None:
+        entry = self.entries.get(pageid)
+        if not entry:
+            return None
+        return IncidentEntry.load(entry['incidents'])
+
+    def fetched_at(self, pageid: str) -> float | None:
+        entry = self.entries.get(pageid)
+        if not entry:
+            return None
+        return entry['fetched_at']
+
+    def put(self, pageid: str, snapshot: dict) -> bool:
+        with self._lock:
+            self.entries[pageid] = {
+                'incidents': IncidentEntry.dump(snapshot),
+                'fetched_at': time.time()
+            }
+            return self.store.save(self.entries)
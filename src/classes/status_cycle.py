@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+import logging
+import time
+
+from src.classes.circuit_breaker import CircuitBreaker
+from src.classes.config_loader import ConfigLoader
+from src.classes.geckoboard import GeckboardApi
+from src.classes.incident_state import IncidentDiff, IncidentState
+from src.classes.payload_budget import PayloadBudget
+from src.classes.records import Incident, IncidentEntry
+from src.classes.snapshot_store import SnapshotStore
+from src.classes.statuspage_api import StatusPageApi
+from src.constants import constants
+
+
+class StatusCycle:
+    def __init__(
+            self,
+            statuspage: StatusPageApi,
+            geckboard: GeckboardApi,
+            concurrent: bool = constants.STATUSPAGE_CONCURRENT_FETCH,
+            incident_state: IncidentState | None = None,
+            breaker: CircuitBreaker | None = None,
+            last_good: SnapshotStore | None = None,
+            budget: PayloadBudget | None = None) -> None:
+        self.statuspage = statuspage
+        self.geckboard = geckboard
+        self.concurrent = concurrent
+        self.incident_state = incident_state
+        self.breaker = breaker
+        self.last_good = last_good
+        self.budget = budget or PayloadBudget()
+        self.snapshot = {}
+        self.diff = None
+        self.stale_since = None
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+
+    def apply_config(self, config: ConfigLoader) -> None:
+        self.statuspage.apply_config(config.statuspage)
+        self.geckboard.apply_config(config.geckoboard)
+
+    def fetch(self) -> bool:
+        pageid = self.statuspage.pageid
+        if self.breaker and not self.breaker.allow(pageid):
+            self.logger.info('ERROR: StatusPage circuit is open, skipping...')
+            return self.fallback()
+
+        if self.concurrent:
+            self.logger.info('Getting unresolved incidents and Platforms...')
+            result = self.statuspage.get_incidents_with_platforms()
+        else:
+            self.logger.info('Getting unresolved incidents...')
+            result = self.statuspage.get_unresolved_incidents()
+            if result and len(self.statuspage.incidents) > 0:
+                self.logger.info('Getting all Platforms...')
+                result = self.statuspage.get_component_groups()
+        if not result:
+            if self.breaker:
+                self.breaker.record_failure(pageid)
+            return self.fallback()
+
+        if self.breaker:
+            self.breaker.record_success(pageid)
+        self.refresh_diff()
+        if self.last_good and not self.last_good.put(pageid, self.snapshot):
+            self.logger.info(
+                'ERROR: Unable to save last known good incidents!')
+        return True
+
+    def fallback(self) -> bool:
+        if not self.last_good:
+            return False
+        pageid = self.statuspage.pageid
+        snapshot = self.last_good.get(pageid)
+        if snapshot is None:
+            return False
+
+        self.logger.info('Serving last known good incidents...')
+        self.snapshot = snapshot
+        self.diff = None
+        self.stale_since = self.last_good.fetched_at(pageid)
+        self.statuspage.metrics.set('stale_data', 1, pageid=pageid)
+        return True
+
+    def refresh_diff(self) -> None:
+        self.snapshot = self._build_snapshot()
+        self.diff = None
+        self.stale_since = None
+        self.statuspage.metrics.set(
+            'stale_data', 0, pageid=self.statuspage.pageid)
+        if self.incident_state:
+            self.diff = self.incident_state.diff(
+                self.statuspage.pageid, self.snapshot)
+
+    def _names(self, incident: Incident) -> tuple:
+        product_name = ''
+        platform_name = ''
+        for component in incident.components:
+            product_name = component.name
+            platform_name = self.statuspage.platform_name(
+                component.group_id)
+        return (platform_name, product_name)
+
+    def _build_snapshot(self) -> dict:
+        snapshot = {}
+        for incident in self.statuspage.incidents:
+            platform_name, product_name = self._names(incident)
+            snapshot[incident.id] = IncidentEntry(
+                updated_at=incident.updated_at,
+                impact=incident.impact,
+                platform_name=platform_name,
+                product_name=product_name)
+        return snapshot
+
+    def has_changes(self) -> bool:
+        if not self.diff:
+            return True
+        return not self.diff.is_empty()
+
+    def is_active(self) -> bool:
+        for entry in self.snapshot.values():
+            if entry.impact != 'maintenance':
+                return True
+        if isinstance(self.diff, IncidentDiff):
+            for entry in self.diff.resolved.values():
+                if entry.impact != 'maintenance':
+                    return True
+        return False
+
+    def outages(self) -> list:
+        return [
+            entry for entry in self.snapshot.values()
+            if entry.impact != 'maintenance'
+        ]
+
+    def recovered(self) -> list:
+        if not isinstance(self.diff, IncidentDiff):
+            return []
+        return [
+            entry for entry in self.diff.resolved.values()
+            if entry.impact != 'maintenance'
+        ]
+
+    def commit(self) -> bool:
+        if not self.incident_state or self.stale_since is not None:
+            return True
+        pageid = self.statuspage.pageid
+        if not self.incident_state.save(pageid, self.snapshot):
+            self.logger.info('ERROR: Unable to save incident state!')
+            return False
+        return True
+
+    def build_messages(self) -> list:
+        messages = []
+        status = 'DOWN'
+
+        for entry in self.snapshot.values():
+            if entry.impact == 'maintenance':
+                self.logger.info(
+                    'This incident is a maintenace post, skipping...')
+                continue
+
+            self.logger.info('Found an outage incident!')
+            self.logger.info('Building message for Geckoboard...')
+            msg = self.geckboard.build_msg(
+                status,
+                platform_name=entry.platform_name,
+                product_name=entry.product_name)
+            if not msg:
+                continue
+
+            messages.append(msg)
+
+        return messages
+
+    def build_stale_message(self) -> str:
+        if self.stale_since is None:
+            return ''
+        since = time.strftime(
+            constants.STALE_DATE_FORMAT, time.gmtime(self.stale_since))
+        return self.geckboard.build_msg('STALE', since=since)  # type: ignore
+
+    def build_resolved_messages(self) -> list:
+        messages = []
+        if not isinstance(self.diff, IncidentDiff):
+            return messages
+
+        for entry in self.diff.resolved.values():
+            if entry.impact == 'maintenance':
+                continue
+
+            self.logger.info('Found a resolved incident!')
+            msg = self.geckboard.build_msg(
+                'RESOLVED',
+                platform_name=entry.platform_name,
+                product_name=entry.product_name)
+            if not msg:
+                continue
+
+            messages.append(msg)
+
+        return messages
+
+    def run(self) -> bool:
+        result = self.fetch()
+        if not result:
+            return False
+
+        return self.publish()
+
+    def publish(self) -> bool:
+        if not self.has_changes() and not self.geckboard.refresh_due():
+            self.logger.info('No incident changes since last run, skipping...')
+            return True
+
+        resolved = self.build_resolved_messages()
+        stale = self.build_stale_message()
+        if stale:
+            self.logger.info('Incidents are stale, adding a banner...')
+
+        messages = []
+        if len(self.snapshot) > 0:
+            self.logger.info(f'There are {len(self.snapshot)} to parse...')
+            messages = self.build_messages()
+
+        if len(messages) > 0:
+            self.logger.info('Formatting all outages into a single message...')
+            msg = self.budget.fit(
+                self.geckboard,
+                stale,
+                messages,
+                resolved,
+                self.outages(),
+                self.recovered())
+
+        else:
+            self.logger.info('There are no active outages!')
+            status = 'OK'
+
+            self.logger.info('Building message for Geckoboard...')
+            msg = self.geckboard.build_msg(status)
+            if not msg:
+                return False
+
+            msg = self.budget.fit(
+                self.geckboard,
+                stale + msg,  # type: ignore
+                [],
+                resolved,
+                [],
+                self.recovered())
+
+        self.logger.info('Pushing message to Geckoboard widget...')
+        result = self.geckboard.push_to_widget(msg)
+        if not result:
+            return False
+
+        self.commit()
+        return True
@@ -1,26 +1,47 @@
 #!/usr/bin/env python3
+import dataclasses
 import logging
-import logging.config
-
-import requests
 
+from src.classes.component_group_cache import ComponentGroupCache
+from src.classes.config_loader import StatusPageConfig
 from src.classes.file_checker import FileChecker
+from src.classes.http_transport import HttpTransport, TransportError
+from src.classes.json_stream import JsonArrayStream
+from src.classes.metrics import Metrics, timed
+from src.classes.records import Incident, Platform
 from src.constants import constants
 
 
 class StatusPageApi:
     CREDENTIAL_KEYS = constants.STATUSPAGE_CREDENTIALS_KEYS
     SCHEME = constants.STATUSPAGE_API_SCHEME
-
-    def __init__(self, credentials_file: str) -> None:
-        self.credentials_file = credentials_file
+    CLOSED_STATUSES = constants.STATUSPAGE_CLOSED_STATUSES
+
+    def __init__(
+            self,
+            credentials_file: str = '',
+            transport: HttpTransport | None = None,
+            cache: ComponentGroupCache | None = None,
+            pageid: str | None = None,
+            stream: bool = constants.STATUSPAGE_STREAM_INCIDENTS,
+            config: StatusPageConfig | None = None,
+            metrics: Metrics | None = None) -> None:
+        self.pageid_override = pageid
         self.pageid = ''
         self.headers = {
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
-        self._auth()
-        self.platforms = []
+        if config:
+            self.apply_config(config)
+        else:
+            self.credentials_file = credentials_file
+            self._auth()
+        self.transport = transport or HttpTransport()
+        self.metrics = metrics or self.transport.metrics
+        self.cache = cache
+        self.stream = stream
+        self.platforms = {}
         self.incidents = []
         self.logger = logging.getLogger(constants.PROGRAM_NAME)
 
@@ -70,34 +91,142 @@ class StatusPageApi:
         apikey = self.credentials['apikey']
         self.headers['Host'] = host
         self.headers['Authorization'] = f'OAuth {apikey}'
-        self.pageid = self.credentials['pageid']
+        self.pageid = self.pageid_override or self.credentials['pageid']
+
+    def apply_config(self, config: StatusPageConfig) -> None:
+        self.credentials = config.as_dict()
+        self._credentials_file = config.credentials_file
+        self._auth()
+
+    def _set_platforms(self, platforms: list) -> None:
+        self.platforms = {}
+        for data in platforms:
+            platform = Platform.from_dict(data)
+            self.platforms[platform.id] = platform
 
+    def platform_name(self, group_id: str | None) -> str:
+        platform = self.platforms.get(group_id)
+        if not platform:
+            return ''
+        return platform.name
+
+    @timed('get_component_groups')
     def get_component_groups(self) -> bool:
+        headers = self.headers
+        if self.cache:
+            if self.cache.is_fresh(self.pageid):
+                self._set_platforms(self.cache.get(self.pageid))
+                self.logger.info('Platforms loaded from cache!')
+                return True
+            headers = {**self.headers, **self.cache.validators(self.pageid)}
+
         endpoint = f'/v1/pages/{self.pageid}/component-groups'
         url = self.SCHEME + self.headers['Host'] + endpoint
-        r = requests.get(url=url, headers=self.headers)
+        try:
+            r = self.transport.get(url=url, headers=headers)
+        except TransportError as e:
+            self.logger.info('ERROR: Unable to retrieve Platforms!')
+            self.logger.info(f'Error Details: {(url, repr(e))}')
+            return False
+        if r.status_code == 304 and self.cache:
+            self._set_platforms(self.cache.get(self.pageid))
+            self.cache.touch(self.pageid)
+            self.logger.info('Platforms not modified, using cache!')
+            return True
         if r.status_code != 200:
             self.logger.info('ERROR: Unable to retrieve Platforms!')
-            error = (url, r.status_code, r.json())
+            error = (url, r.status_code, self.transport.error_details(r))
             self.logger.info(f'Error Details: {error}')
             return False
-        platforms = r.json()
-        for platform in platforms:
-            id = platform['id']
-            name = platform['name']
-            self.platforms.append((id, name))
+        try:
+            platforms = [
+                {'id': platform['id'], 'name': platform['name']}
+                for platform in r.json()
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.info('ERROR: Unable to parse Platforms!')
+            self.logger.info(f'Error Details: {(url, repr(e))}')
+            return False
+        self._set_platforms(platforms)
+        if self.cache:
+            self.cache.put(
+                self.pageid,
+                platforms,
+                etag=r.headers.get('ETag'),
+                last_modified=r.headers.get('Last-Modified'))
         self.logger.info('Platforms retrieved successfully!')
         return True
 
+    @timed('get_unresolved_incidents')
     def get_unresolved_incidents(self) -> bool:
         endpoint = f'/v1/pages/{self.pageid}/incidents/unresolved'
         url = self.SCHEME + self.headers['Host'] + endpoint
-        r = requests.get(url=url, headers=self.headers)
-        if r.status_code != 200:
+        try:
+            r = self.transport.get(
+                url=url, headers=self.headers, stream=self.stream)
+        except TransportError as e:
             self.logger.info('ERROR: Unable to retrieve unresolved incidents!')
-            error = (url, r.status_code, r.json())
-            self.logger.info(f'Error Details: {error}')
+            self.logger.info(f'Error Details: {(url, repr(e))}')
             return False
-        self.incidents = r.json()
+        with r:
+            if r.status_code != 200:
+                self.logger.info(
+                    'ERROR: Unable to retrieve unresolved incidents!')
+                error = (
+                    url, r.status_code, self.transport.error_details(r))
+                self.logger.info(f'Error Details: {error}')
+                return False
+            try:
+                if self.stream:
+                    chunks = self.transport.iter_content(
+                        r, constants.STATUSPAGE_STREAM_CHUNK_SIZE)
+                    incidents = JsonArrayStream(chunks)
+                else:
+                    incidents = r.json()
+                self.incidents = [
+                    Incident.from_dict(incident) for incident in incidents
+                ]
+            except (
+                    TransportError,
+                    ValueError,
+                    KeyError,
+                    TypeError) as e:
+                self.incidents = []
+                self.logger.info(
+                    'ERROR: Unable to parse unresolved incidents!')
+                self.logger.info(f'Error Details: {(url, repr(e))}')
+                return False
+        self.metrics.set('incidents', len(self.incidents), pageid=self.pageid)
         self.logger.info('Unresolved Incidents retrieved successfully!')
         return True
+
+    def get_incidents_with_platforms(self) -> bool:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            platforms = executor.submit(self.get_component_groups)
+            incidents = executor.submit(self.get_unresolved_incidents)
+            if not incidents.result():
+                return False
+            if len(self.incidents) == 0:
+                return True
+            return platforms.result()
+
+    def apply_incident(self, incident: dict) -> bool:
+        try:
+            id = incident['id']
+            status = incident['status']
+        except (KeyError, TypeError):
+            return False
+
+        incidents = [i for i in self.incidents if i.id != id]
+        if status not in self.CLOSED_STATUSES:
+            record = Incident.from_dict(incident)
+            previous = [i for i in self.incidents if i.id == id]
+            if 'components' not in incident and previous:
+                record = dataclasses.replace(
+                    record, components=previous[0].components)
+            incidents.append(record)
+        self.incidents = incidents
+        self.metrics.set('incidents', len(self.incidents), pageid=self.pageid)
+        return True
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import json
+import logging
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.classes.config_loader import ConfigLoader
+from src.classes.instance_lock import InstanceLock
+from src.classes.metrics import Metrics
+from src.classes.status_cycle import StatusCycle
+from src.constants import constants
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    server: 'WebhookServer'
+
+    def _respond(self, code: int) -> None:
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        if self.path != self.server.webhook_path:
+            self._respond(404)
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            self._respond(400)
+            return
+        if length <= 0 or length > constants.WEBHOOK_MAX_BODY:
+            self._respond(413 if length > 0 else 400)
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            self._respond(400)
+            return
+        if not isinstance(payload, dict):
+            self._respond(400)
+            return
+
+        start = time.monotonic()
+        try:
+            code = self.server.handle_payload(payload)
+        except Exception as e:
+            self.server.logger.info(f'ERROR: Webhook handling failed: {e!r}')
+            code = 500
+        if code in (204, 500, 502):
+            self.server.metrics.record_cycle(
+                code == 204, time.monotonic() - start)
+        if not self.server.metrics.flush():
+            self.server.logger.info('ERROR: Unable to write metrics textfile!')
+        self._respond(code)
+
+    def log_message(self, format: str, *args) -> None:
+        self.server.logger.info(
+            f'Webhook request from {self.address_string()}: {format % args}')
+
+
+class WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            cycle: StatusCycle,
+            host: str = constants.WEBHOOK_DEFAULT_HOST,
+            port: int = constants.WEBHOOK_DEFAULT_PORT,
+            token: str | None = None,
+            config: ConfigLoader | None = None,
+            metrics: Metrics | None = None,
+            lock: InstanceLock | None = None) -> None:
+        if not token and not self.is_loopback(host):
+            raise ValueError('A token is required off the loopback address')
+        self.cycle = cycle
+        self.config = config
+        self.lock = lock
+        self.metrics = metrics or cycle.statuspage.metrics
+        self.webhook_path = constants.WEBHOOK_PATH
+        if token:
+            self.webhook_path += f'/{token}'
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(constants.PROGRAM_NAME)
+        super().__init__((host, port), WebhookHandler)
+
+    @staticmethod
+    def is_loopback(host: str) -> bool:
+        import ipaddress
+
+        if host == 'localhost':
+            return True
+        try:
+            return ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            return False
+
+    def handle_payload(self, payload: dict) -> int:
+        statuspage = self.cycle.statuspage
+        page = payload.get('page') or {}
+        if not isinstance(page, dict):
+            return 400
+        if page.get('id') and page['id'] != statuspage.pageid:
+            self.logger.info(f'Ignoring webhook for page {page["id"]}...')
+            return 202
+
+        with self._lock:
+            if self.config and self.config.reload_if_changed():
+                self.cycle.apply_config(self.config)
+            if 'incident' in payload:
+                self.logger.info('Received incident webhook!')
+                if not statuspage.apply_incident(payload['incident']):
+                    return 400
+                if not statuspage.platforms:
+                    statuspage.get_component_groups()
+                self.cycle.refresh_diff()
+                result = self.cycle.publish()
+            elif 'component' in payload:
+                self.logger.info('Received component webhook, resyncing...')
+                result = self.cycle.run()
+            else:
+                return 400
+
+        if not result:
+            return 502
+        return 204
+
+    def service_actions(self) -> None:
+        super().service_actions()
+        if self.lock:
+            self.lock.heartbeat()
+
+    def _handle_signal(self, signum, frame) -> None:
+        name = signal.Signals(signum).name
+        self.logger.info(f'Received {name}, shutting down...')
+        threading.Thread(target=self.shutdown).start()
+
+    def run(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_signal)
+            signal.signal(signal.SIGINT, self._handle_signal)
+
+        self.logger.info('Seeding incidents before accepting webhooks...')
+        if not self.cycle.run():
+            self.logger.info('ERROR: Initial sync failed!')
+
+        host, port = self.server_address[:2]
+        self.logger.info(f'Listening for webhooks on {host}:{port}...')
+        self.serve_forever()
+        self.server_close()
+        self.logger.info('Webhook server stopped.')
@@ -3,11 +3,132 @@
 # STATUSPAGE API
 STATUSPAGE_CREDENTIALS_KEYS = ['apikey', 'host', 'pageid']
 STATUSPAGE_API_SCHEME = 'https://'
+STATUSPAGE_CONCURRENT_FETCH = True
+STATUSPAGE_STREAM_INCIDENTS = True
+STATUSPAGE_STREAM_CHUNK_SIZE = 65536
+STATUSPAGE_CLOSED_STATUSES = ['resolved', 'postmortem', 'completed']
 
 # GECKOBOARD API
 GECKOBOARD_CREDENTIALS_KEYS = ['apikey', 'host', 'widgetkey']
 GECKOBOARD_API_SCHEME = 'https://'
 
+# MESSAGE TEMPLATES
+MESSAGE_TEMPLATES_FILE = './data/templates.yaml'
+MESSAGE_RENDER_CACHE_SIZE = 1024
+MESSAGE_TEMPLATE_FIELDS = [
+    'platform_name', 'product_name', 'since', 'products', 'platforms']
+MESSAGE_TEMPLATES = {
+    'ok': (
+        '<center style="background-color: green;">'
+        '<strong>OK</strong></center>'),
+    'down': (
+        '<span style="background-color: red;">'
+        '$platform_name - $product_name is <strong>DOWN!'
+        '</strong></span>\n\n'),
+    'resolved': (
+        '<span style="background-color: green;">'
+        '$platform_name - $product_name is <strong>RESOLVED'
+        '</strong></span>\n\n'),
+    'stale': (
+        '<center style="background-color: orange;">'
+        '<strong>DATA STALE</strong> since $since</center>'),
+    'down_group': (
+        '<span style="background-color: red;">'
+        '$platform_name: $products <strong>DOWN!'
+        '</strong></span>\n\n'),
+    'resolved_group': (
+        '<span style="background-color: green;">'
+        '$platform_name: $products <strong>RESOLVED'
+        '</strong></span>\n\n'),
+    'summary': (
+        '<center style="background-color: red;">'
+        '<strong>$products DOWN</strong> across $platforms</center>')
+}
+
+# PAYLOAD BUDGET
+GECKOBOARD_PAYLOAD_LIMIT = 16384
+
+# FILE CHECKER
+FILE_CHECKER_SEPARATOR = ','
+FILE_CHECKER_CHUNK_SIZE = 65536
+
 # LOGGING
 EVENT_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 PROGRAM_NAME = 'statustogeckod'
+LOGGING_CACHE_FILE = './data/logging_conf.json'
+LOGGING_USE_QUEUE = True
+
+# DAEMON
+DAEMON_DEFAULT_INTERVAL = 60
+DAEMON_MIN_INTERVAL = 1
+
+# INSTANCE LOCK
+LOCK_FILE = './data/statustogeckod.lock'
+LOCK_MODES = ['skip', 'wait', 'kill-stale', 'none']
+LOCK_DEFAULT_MODE = 'skip'
+LOCK_WAIT_TIMEOUT = 50
+LOCK_STALE_AFTER = 300
+LOCK_HEARTBEAT_INTERVAL = 30
+LOCK_KILL_GRACE = 5
+LOCK_POLL_INTERVAL = 0.25
+
+# SCHEDULER
+SCHEDULER_IDLE_INTERVAL = 300
+SCHEDULER_ACTIVE_INTERVAL = 5
+SCHEDULER_COOLDOWN = 900
+SCHEDULER_JITTER = 0.1
+
+# HTTP TRANSPORT
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 15
+HTTP_RETRY_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 1
+HTTP_RETRY_MAX_DELAY = 30
+HTTP_RETRY_STATUSES = [429, 500, 502, 503, 504]
+HTTP_RATE_LIMITS = {
+    'api.statuspage.io': (1, 5),
+    'push.geckoboard.com': (2, 10)
+}
+HTTP_RATE_LIMIT_DEFAULT = None
+HTTP_RATE_LIMIT_MAX_WAIT = 30
+HTTP_RATE_LIMIT_EPOCH = 1000000000
+HTTP_ERROR_BODY_LIMIT = 512
+
+# CACHE
+COMPONENT_GROUP_CACHE_FILE = './data/component_groups.json'
+COMPONENT_GROUP_CACHE_TTL = 3600
+PUSH_STATE_FILE = './data/push_state.json'
+PUSH_REFRESH_INTERVAL = 900
+PUSH_COALESCE_WINDOW = 2
+PUSH_COALESCE_MAX_DELAY = 10
+INCIDENT_STATE_FILE = './data/incident_state.json'
+SNAPSHOT_FILE = './data/last_known_good.json'
+
+# CIRCUIT BREAKER
+CIRCUIT_BREAKER_FILE = './data/circuit_breaker.json'
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_TIMEOUT = 120
+STALE_DATE_FORMAT = '%Y-%m-%d %H:%M UTC'
+
+# FAN OUT
+FAN_OUT_MAX_WORKERS = 8
+
+# WEBHOOK
+WEBHOOK_DEFAULT_HOST = '127.0.0.1'
+WEBHOOK_DEFAULT_PORT = 8080
+WEBHOOK_PATH = '/webhook'
+WEBHOOK_MAX_BODY = 1048576
+
+# METRICS
+METRICS_PREFIX = 'statustogeckod_'
+METRICS_TEXTFILE = './data/statustogeckod.prom'
+METRICS_DEFAULT_HOST = '127.0.0.1'
+METRICS_DEFAULT_PORT = 9464
+METRICS_PATH = '/metrics'
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+METRICS_DURATION_BUCKETS = [
+    0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+METRICS_BYTES_BUCKETS = [
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.adaptive_scheduler import AdaptiveScheduler
+
+
+class TestAdaptiveScheduler:
+    def setUp(self):
+        self.scheduler = AdaptiveScheduler(
+            idle_interval=300, active_interval=5, cooldown=600, jitter=0)
+
+    def tearDown(self):
+        del self.scheduler
+
+    def test_invalid_intervals(self):
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(idle_interval=0)
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(active_interval=0)
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(idle_interval=10, active_interval=20)
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(cooldown=-1)
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(jitter=1)
+
+    def test_idle(self):
+        self.setUp()
+        assert self.scheduler.next_interval(False, now=0) == 300
+        assert self.scheduler.is_fast(now=0) is False
+        self.tearDown()
+
+    def test_active_then_cooldown(self):
+        self.setUp()
+        assert self.scheduler.next_interval(True, now=1000) == 5
+        assert self.scheduler.next_interval(False, now=1300) == 5
+        assert self.scheduler.is_fast(now=1599) is True
+        assert self.scheduler.next_interval(False, now=1600) == 300
+        self.tearDown()
+
+    def test_jitter(self):
+        scheduler = AdaptiveScheduler(
+            idle_interval=100, active_interval=10, jitter=0.2)
+        intervals = [scheduler.next_interval(False) for _ in range(50)]
+        assert all(80 <= interval <= 120 for interval in intervals)
+        assert len(set(intervals)) > 1
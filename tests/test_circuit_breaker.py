@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'circuit_breaker.json')
+        self.breaker = CircuitBreaker(
+            self.file, failure_threshold=2, reset_timeout=60)
+        self.key = 'kctbh9vrtdwd'
+
+    def tearDown(self):
+        del self.breaker
+        del self.file
+
+    def test_invalid_values(self, tmp_path):
+        file = str(tmp_path / 'breaker.json')
+        with pytest.raises(ValueError):
+            CircuitBreaker(file, failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(file, reset_timeout=-1)
+
+    def test_opens_after_threshold(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.breaker.allow(self.key, now=0) is True
+        self.breaker.record_failure(self.key, now=0)
+        assert self.breaker.state(self.key, now=1) == CircuitBreaker.CLOSED
+        self.breaker.record_failure(self.key, now=1)
+        assert self.breaker.state(self.key, now=2) == CircuitBreaker.OPEN
+        assert self.breaker.allow(self.key, now=2) is False
+        self.tearDown()
+
+    def test_half_open_single_trial(self, tmp_path):
+        self.setUp(tmp_path)
+        self.breaker.record_failure(self.key, now=0)
+        self.breaker.record_failure(self.key, now=0)
+        assert self.breaker.state(self.key, now=60) == CircuitBreaker.HALF_OPEN
+        assert self.breaker.allow(self.key, now=60) is True
+        assert self.breaker.allow(self.key, now=61) is False
+        self.breaker.record_failure(self.key, now=61)
+        assert self.breaker.allow(self.key, now=119) is False
+        assert self.breaker.allow(self.key, now=120) is True
+        self.breaker.record_success(self.key)
+        assert self.breaker.state(self.key) == CircuitBreaker.CLOSED
+        self.tearDown()
+
+    def test_state_survives_restart(self, tmp_path):
+        self.setUp(tmp_path)
+        self.breaker.record_failure(self.key, now=0)
+        self.breaker.record_failure(self.key, now=0)
+        breaker = CircuitBreaker(
+            self.file, failure_threshold=2, reset_timeout=60)
+        assert breaker.allow(self.key, now=30) is False
+        self.tearDown()
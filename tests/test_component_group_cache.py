@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+import time
+
+import pytest
+
+from src.classes.component_group_cache import ComponentGroupCache
+
+
+class TestComponentGroupCache:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'component_groups.json')
+        self.cache = ComponentGroupCache(self.file, ttl=60)
+        self.groups = [{'id': '401j1885m96y', 'name': 'US Platform 1'}]
+
+    def tearDown(self):
+        del self.cache
+        del self.file
+
+    def test_invalid_ttl(self, tmp_path):
+        with pytest.raises(ValueError):
+            ComponentGroupCache(str(tmp_path / 'cache.json'), ttl=-1)
+
+    def test_empty(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.cache.is_fresh('ra5h7xd8knxz') is False
+        assert self.cache.get('ra5h7xd8knxz') is None
+        assert self.cache.validators('ra5h7xd8knxz') == {}
+        assert self.cache.touch('ra5h7xd8knxz') is False
+        self.tearDown()
+
+    def test_put_survives_restart(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.cache.put(
+            'ra5h7xd8knxz', self.groups, etag='"abc"',
+            last_modified='Wed, 19 Jun 2024 09:00:00 GMT') is True
+        cache = ComponentGroupCache(self.file, ttl=60)
+        assert cache.is_fresh('ra5h7xd8knxz') is True
+        assert cache.get('ra5h7xd8knxz') == self.groups
+        headers = cache.validators('ra5h7xd8knxz')
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == 'Wed, 19 Jun 2024 09:00:00 GMT'
+        self.tearDown()
+
+    def test_expired_and_touch(self, tmp_path):
+        self.setUp(tmp_path)
+        self.cache.put('ra5h7xd8knxz', self.groups)
+        self.cache.entries['ra5h7xd8knxz']['fetched_at'] = time.time() - 120
+        assert self.cache.is_fresh('ra5h7xd8knxz') is False
+        assert self.cache.touch('ra5h7xd8knxz') is True
+        assert self.cache.is_fresh('ra5h7xd8knxz') is True
+        self.tearDown()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import os
+import shutil
+
+import pytest
+
+from src.classes.config_loader import (ConfigLoader, GeckoboardConfig,
+                                       StatusPageConfig)
+
+
+class TestConfigLoader:
+    def setUp(self):
+        self.credentials_file = 'tests/data/credentials.yaml'
+        self.config = ConfigLoader(self.credentials_file)
+
+    def tearDown(self):
+        del self.config
+        del self.credentials_file
+
+    def test_missing_credentials_file(self):
+        with pytest.raises(ValueError):
+            ConfigLoader('/some/fake/file')
+
+    def test_invalid_credentials_file_not_yaml(self):
+        with pytest.raises(ValueError):
+            ConfigLoader('tests/data/not_yaml.yaml')
+
+    def test_invalid_credentials_file_invalid_file(self):
+        with pytest.raises(ValueError):
+            ConfigLoader('tests/data/invalid_credentials.yaml')
+
+    def test_invalid_credentials_file_missing_key(self):
+        with pytest.raises(ValueError):
+            ConfigLoader('tests/data/missing_credentials.yaml')
+
+    def test_invalid_credentials_file_additional_data(self):
+        with pytest.raises(ValueError):
+            ConfigLoader('tests/data/additional_credentials.yaml')
+
+    def test_sections(self):
+        self.setUp()
+        path = os.path.realpath(self.credentials_file)
+        assert self.config.credentials_file == path
+        assert self.config.statuspage == StatusPageConfig(
+            path, 'some-api-key-goes-here', 'api.statuspage.io',
+            'ra5h7xd8knxz')
+        assert self.config.geckoboard == GeckoboardConfig(
+            path, 'apikeygoeshere', 'push.geckoboard.com',
+            'some-widget-key-goes-here')
+        assert self.config.routes == {}
+        self.tearDown()
+
+    def test_routes(self):
+        config = ConfigLoader('tests/data/routes_credentials.yaml')
+        assert config.routes == {
+            'office-tv-1': ['ra5h7xd8knxz', '10ycvtr1341m'],
+            'office-tv-2': ['10ycvtr1341m']
+        }
+
+    def test_routes_pages_not_a_list(self, tmp_path):
+        routes = 'tests/data/routes_credentials.yaml'
+        with open(routes, 'r') as f:
+            data = f.read()
+        invalid = [
+            '  - widgetkey: office-tv-3\n    pages: pageid-one\n',
+            '  - widgetkey: office-tv-3\n    pages: []\n',
+            '  - widgetkey: office-tv-3\n    pages:\n      - [nested]\n'
+        ]
+        for route in invalid:
+            file = tmp_path / 'credentials.yaml'
+            file.write_text(data + route)
+            with pytest.raises(ValueError):
+                ConfigLoader(str(file))
+
+    def test_reload_if_changed(self, tmp_path):
+        file = tmp_path / 'credentials.yaml'
+        shutil.copy('tests/data/credentials.yaml', file)
+        config = ConfigLoader(str(file))
+        assert config.reload_if_changed() is False
+
+        data = file.read_text().replace('ra5h7xd8knxz', 'rotatedpage1')
+        file.write_text(data)
+        os.utime(file, ns=(config.mtime + 10**9, config.mtime + 10**9))
+        assert config.changed() is True
+        assert config.reload_if_changed() is True
+        assert config.statuspage.pageid == 'rotatedpage1'
+
+    def test_reload_invalid_keeps_previous(self, tmp_path):
+        file = tmp_path / 'credentials.yaml'
+        shutil.copy('tests/data/credentials.yaml', file)
+        config = ConfigLoader(str(file))
+        shutil.copy('tests/data/missing_credentials.yaml', file)
+        assert config.reload() is False
+        assert config.statuspage.pageid == 'ra5h7xd8knxz'
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.adaptive_scheduler import AdaptiveScheduler
+from src.classes.daemon import Daemon
+from src.classes.instance_lock import InstanceLock
+
+
+class FakeCycle:
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    def run(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestDaemon:
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            Daemon(FakeCycle([]), interval=0)
+
+    def test_run_once_exception(self):
+        daemon = Daemon(FakeCycle([RuntimeError('boom')]), interval=1)
+        assert daemon.run_once() is False
+
+    def test_run_until_stopped(self):
+        cycle = FakeCycle([True, False, True])
+        daemon = Daemon(cycle, interval=1)
+        original = cycle.run
+
+        def run():
+            result = original()
+            if cycle.calls == 3:
+                daemon.stop()
+            return result
+        cycle.run = run
+        daemon._stop_event.wait = lambda timeout: None
+        daemon.run()
+        assert cycle.calls == 3
+        assert daemon.running is False
+        assert daemon.metrics.get('cycles_total', result='success') == 2
+        assert daemon.metrics.get('cycles_total', result='failure') == 1
+
+    def test_heartbeat_while_waiting(self, tmp_path):
+        lock = InstanceLock(str(tmp_path / 'statustogeckod.lock'))
+        assert lock.acquire() is True
+        lock.heartbeat_every = 0.01
+        cycle = FakeCycle([True])
+        daemon = Daemon(cycle, interval=1, lock=lock)
+        beats = []
+        original = lock.heartbeat
+
+        def heartbeat():
+            beats.append(original())
+            if len(beats) == 3:
+                daemon.stop()
+        lock.heartbeat = heartbeat
+        daemon.run()
+        lock.release()
+        assert cycle.calls == 1
+        assert len(beats) == 3
+        assert True in beats
+
+    def test_adaptive_interval(self):
+        cycle = FakeCycle([True, True])
+        cycle.active = True
+        cycle.is_active = lambda: cycle.active
+        scheduler = AdaptiveScheduler(
+            idle_interval=300, active_interval=5, cooldown=0, jitter=0)
+        daemon = Daemon(cycle, interval=60, scheduler=scheduler)
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            cycle.active = False
+            if len(waits) == 2:
+                daemon.stop()
+        daemon._stop_event.wait = wait
+        daemon.run()
+        assert len(waits) == 2
+        assert 4 < waits[0] <= 5
+        assert 299 < waits[1] <= 300
+        assert Daemon(FakeCycle([]), interval=60).next_interval() == 60
+
+    def test_reload_config_on_sighup(self):
+        class FakeConfig:
+            def __init__(self):
+                self.reloads = 0
+
+            def reload(self):
+                self.reloads += 1
+                return True
+
+            def reload_if_changed(self):
+                return False
+
+        cycle = FakeCycle([True])
+        cycle.configs = []
+        cycle.apply_config = cycle.configs.append
+        config = FakeConfig()
+        daemon = Daemon(cycle, interval=1, config=config)
+        assert daemon.reload_config() is False
+        daemon._handle_reload(None, None)
+        assert daemon.reload_config() is True
+        assert config.reloads == 1
+        assert cycle.configs == [config]
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from src.classes.config_loader import ConfigLoader
+from src.classes.fan_out import FanOut
+
+
+class TestFanOut:
+    def setUp(self):
+        self.credentials_file = 'tests/data/routes_credentials.yaml'
+        self.config = ConfigLoader(self.credentials_file)
+        self.fan_out = FanOut(self.config)
+
+    def tearDown(self):
+        del self.fan_out
+        del self.config
+        del self.credentials_file
+
+    def _register_page(self, requests_mock, pageid, incidents):
+        host = 'https://api.statuspage.io'
+        with open('tests/data/component_groups.json', 'r') as file:
+            groups = file.read()
+        requests_mock.register_uri(
+            'GET',
+            f'{host}/v1/pages/{pageid}/incidents/unresolved',
+            text=incidents,
+            status_code=200)
+        return requests_mock.register_uri(
+            'GET',
+            f'{host}/v1/pages/{pageid}/component-groups',
+            text=groups,
+            status_code=200)
+
+    def _register_widget(self, requests_mock, widgetkey):
+        with open('tests/data/push_to_widget.json', 'r') as file:
+            data = file.read()
+        return requests_mock.register_uri(
+            'POST',
+            f'https://push.geckoboard.com/v1/send/{widgetkey}',
+            text=data,
+            status_code=200)
+
+    def test_routes(self):
+        self.setUp()
+        assert self.fan_out.routes == {
+            'office-tv-1': ['ra5h7xd8knxz', '10ycvtr1341m'],
+            'office-tv-2': ['10ycvtr1341m']
+        }
+        self.tearDown()
+
+    def test_missing_routes(self):
+        with pytest.raises(ValueError):
+            FanOut(ConfigLoader('tests/data/credentials.yaml'))
+
+    def test_clients(self):
+        self.setUp()
+        assert self.fan_out.pageids == ['ra5h7xd8knxz', '10ycvtr1341m']
+        assert len(self.fan_out.cycles) == 2
+        statuspage = self.fan_out.cycles['10ycvtr1341m'].statuspage
+        assert statuspage.pageid == '10ycvtr1341m'
+        geckboard = self.fan_out.geckboards['office-tv-2']
+        assert geckboard.widgetkey == 'office-tv-2'
+        assert geckboard.transport is self.fan_out.transport
+        self.tearDown()
+
+    def test_run(self, requests_mock):
+        self.setUp()
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            outage = file.read()
+        self._register_page(requests_mock, 'ra5h7xd8knxz', outage)
+        shared = self._register_page(requests_mock, '10ycvtr1341m', '[]')
+        tv1 = self._register_widget(requests_mock, 'office-tv-1')
+        tv2 = self._register_widget(requests_mock, 'office-tv-2')
+        assert self.fan_out.run() is True
+        assert shared.call_count <= 1
+        assert tv1.call_count == 1
+        assert tv2.call_count == 1
+        text = json.loads(tv1.last_request.text)['data']['item'][0]['text']
+        assert 'DOWN!' in text
+        text = json.loads(tv2.last_request.text)['data']['item'][0]['text']
+        assert 'OK' in text
+        self.tearDown()
+
+    def test_run_maintenance_only(self, requests_mock):
+        self.setUp()
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            maintenance = file.read()
+        self._register_page(requests_mock, 'ra5h7xd8knxz', maintenance)
+        self._register_page(requests_mock, '10ycvtr1341m', '[]')
+        tv1 = self._register_widget(requests_mock, 'office-tv-1')
+        self._register_widget(requests_mock, 'office-tv-2')
+        assert self.fan_out.run() is True
+        assert tv1.call_count == 1
+        text = json.loads(tv1.last_request.text)['data']['item'][0]['text']
+        assert 'OK' in text
+        self.tearDown()
+
+    def test_run_page_failed(self, requests_mock):
+        self.setUp()
+        host = 'https://api.statuspage.io'
+        self._register_page(requests_mock, '10ycvtr1341m', '[]')
+        with open('tests/data/401_response.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET',
+            f'{host}/v1/pages/ra5h7xd8knxz/incidents/unresolved',
+            text=data,
+            status_code=401)
+        tv1 = self._register_widget(requests_mock, 'office-tv-1')
+        tv2 = self._register_widget(requests_mock, 'office-tv-2')
+        assert self.fan_out.run() is False
+        assert tv1.call_count == 0
+        assert tv2.call_count == 1
+        self.tearDown()
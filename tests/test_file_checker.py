@@ -133,3 +133,18 @@ class TestFileChecker:
         assert len(result) == 4
         assert 'bowen@qualys.com' in result
         assert 'kjones@qualys.com' in result
+
+    def test_iter_text_across_chunks(self, tmp_path):
+        file = tmp_path / 'entries.txt'
+        file.write_text('a, b,,c\n\n  d  \ne,f')
+        fc = FileChecker(str(file))
+        result = fc.iter_text(chunk_size=3)
+        assert next(result) == 'a'
+        assert list(result) == ['b', 'c', 'd', 'e', 'f']
+
+    def test_is_text_missing_file(self, tmp_path):
+        file = tmp_path / 'entries.txt'
+        file.write_text('a')
+        fc = FileChecker(str(file))
+        file.unlink()
+        assert fc.is_text() is False
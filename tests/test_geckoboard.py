@@ -3,7 +3,9 @@ import os
 
 import pytest
 
+from src.classes.config_loader import ConfigLoader
 from src.classes.geckoboard import GeckboardApi
+from src.classes.push_state import PushState
 
 
 class TestStatusPageApi:
@@ -115,6 +117,28 @@ class TestStatusPageApi:
         assert result == msg
         self.tearDown()
 
+    def test_build_msg_resolved(self):
+        self.setUp()
+        status = 'RESOLVED'
+        platform_name = 'US Platform 1'
+        product_name = 'VMDR'
+        result = self.geckoboard.build_msg(
+            status, platform_name, product_name)
+        msg = '<span style="background-color: green;">'
+        msg += f'{platform_name} - {product_name} is <strong>RESOLVED'
+        msg += '</strong></span>\n\n'
+        assert result == msg
+        self.tearDown()
+
+    def test_build_msg_stale(self):
+        self.setUp()
+        result = self.geckoboard.build_msg(
+            'STALE', since='2026-01-01 00:00 UTC')
+        msg = '<center style="background-color: orange;"><strong>'
+        msg += 'DATA STALE</strong> since 2026-01-01 00:00 UTC</center>'
+        assert result == msg
+        self.tearDown()
+
     def test_push_to_widget_failed_unauthenticated(self, requests_mock):
         self.setUp()
         widgetkey = self.geckoboard.widgetkey
@@ -191,4 +215,49 @@ class TestStatusPageApi:
         requests_mock.register_uri('POST', url, text=data, status_code=code)
         result = self.geckoboard.push_to_widget(msg)
         assert result is True
+        metrics = self.geckoboard.metrics
+        assert metrics.get(
+            'requests_total', host=host, method='POST', code='200') == 1
+        assert metrics.get('payload_bytes') == 1
+        assert metrics.get(
+            'phase_duration_seconds', phase='push_to_widget') == 1
         self.tearDown()
+
+    def test_push_to_widget_unchanged_skipped(self, requests_mock, tmp_path):
+        self.setUp()
+        self.geckoboard.push_state = PushState(
+            str(tmp_path / 'push_state.json'), refresh_interval=60)
+        widgetkey = self.geckoboard.widgetkey
+        host = self.geckoboard.headers['Host']
+        url = f'https://{host}/v1/send/{widgetkey}'
+        with open('tests/data/push_to_widget.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri('POST', url, text=data, status_code=200)
+        assert self.geckoboard.push_to_widget('msg') is True
+        assert self.geckoboard.push_to_widget('msg') is True
+        assert requests_mock.call_count == 1
+        assert self.geckoboard.push_to_widget('msg', force=True) is True
+        assert self.geckoboard.push_to_widget('other') is True
+        assert requests_mock.call_count == 3
+        self.tearDown()
+
+    def test_push_to_widget_failed_not_recorded(self, requests_mock, tmp_path):
+        self.setUp()
+        self.geckoboard.push_state = PushState(
+            str(tmp_path / 'push_state.json'), refresh_interval=60)
+        widgetkey = self.geckoboard.widgetkey
+        host = self.geckoboard.headers['Host']
+        url = f'https://{host}/v1/send/{widgetkey}'
+        with open('tests/data/geckoboard_401_response.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri('POST', url, text=data, status_code=401)
+        assert self.geckoboard.push_to_widget('msg') is False
+        assert self.geckoboard.push_state.entries == {}
+        self.tearDown()
+
+    def test_config(self):
+        config = ConfigLoader('tests/data/credentials.yaml')
+        geckoboard = GeckboardApi(config=config.geckoboard)
+        assert geckoboard.credentials_file == config.credentials_file
+        assert geckoboard.widgetkey == 'some-widget-key-goes-here'
+        assert geckoboard.apikey == 'apikeygoeshere'
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+import threading
+import time
+
+import pytest
+import requests
+
+from src.classes.http_transport import HttpTransport, TransportError
+from src.classes.rate_limiter import RateLimiter
+from src.classes.retry_policy import RetryPolicy
+
+
+class TestHttpTransport:
+    def setUp(self):
+        self.transport = HttpTransport(
+            pool_connections=2,
+            pool_maxsize=5,
+            connect_timeout=1,
+            read_timeout=2)
+
+    def tearDown(self):
+        self.transport.close()
+        del self.transport
+
+    def test_invalid_pool_connections(self):
+        with pytest.raises(ValueError):
+            HttpTransport(pool_connections=0)
+
+    def test_invalid_pool_maxsize(self):
+        with pytest.raises(ValueError):
+            HttpTransport(pool_maxsize=0)
+
+    def test_invalid_timeouts(self):
+        with pytest.raises(ValueError):
+            HttpTransport(connect_timeout=0)
+        with pytest.raises(ValueError):
+            HttpTransport(read_timeout=-1)
+
+    def test_timeout(self):
+        self.setUp()
+        assert self.transport.timeout == (1.0, 2.0)
+        self.tearDown()
+
+    def test_adapter_pool_size(self):
+        self.setUp()
+        adapter = self.transport.session.get_adapter('https://example.com')
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+        self.tearDown()
+
+    def test_session_built_once(self, monkeypatch):
+        self.setUp()
+        build = self.transport._build_session
+        built = []
+
+        def slow_build():
+            time.sleep(0.05)
+            built.append(build())
+            return built[-1]
+        monkeypatch.setattr(self.transport, '_build_session', slow_build)
+        threads = [
+            threading.Thread(target=lambda: self.transport.session)
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(built) == 1
+        assert self.transport.session is built[0]
+        self.tearDown()
+
+    def test_request_applies_default_timeout(self, requests_mock):
+        self.setUp()
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri('GET', url, text='{}', status_code=200)
+        r = self.transport.get(url)
+        assert r.status_code == 200
+        assert requests_mock.last_request.timeout == (1.0, 2.0)
+        self.tearDown()
+
+    def test_retry_on_429_honors_retry_after(self, requests_mock):
+        self.setUp()
+        delays = []
+        waits = []
+        self.transport.sleep = delays.append
+        self.transport.limiter.sleep = waits.append
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri('GET', url, [
+            {'text': 'slow down', 'status_code': 429,
+             'headers': {'Retry-After': '2'}},
+            {'text': '{}', 'status_code': 200}
+        ])
+        r = self.transport.get(url)
+        assert r.status_code == 200
+        assert requests_mock.call_count == 2
+        assert delays == [2.0]
+        assert len(waits) == 1
+        assert 1.9 < waits[0] <= 2
+        assert self.transport.metrics.get(
+            'retries_total', host='api.statuspage.io', reason='429') == 1
+        self.tearDown()
+
+    def test_retry_gives_up(self, requests_mock):
+        self.setUp()
+        delays = []
+        self.transport.sleep = delays.append
+        self.transport.retry = RetryPolicy(max_retries=2, backoff=1)
+        url = 'https://push.geckoboard.com/v1/send/key'
+        requests_mock.register_uri('POST', url, text='bad', status_code=502)
+        r = self.transport.post(url)
+        assert r.status_code == 502
+        assert requests_mock.call_count == 3
+        assert 0.5 <= delays[0] <= 1
+        assert 1 <= delays[1] <= 2
+        self.tearDown()
+
+    def test_no_retry_when_retry_after_too_long(self, requests_mock):
+        self.setUp()
+        self.transport.sleep = lambda seconds: None
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri(
+            'GET', url, text='', status_code=503,
+            headers={'Retry-After': '3600'})
+        r = self.transport.get(url)
+        assert r.status_code == 503
+        assert requests_mock.call_count == 1
+        self.tearDown()
+
+    def test_no_retry_on_client_error(self, requests_mock):
+        self.setUp()
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri('GET', url, text='', status_code=401)
+        assert self.transport.get(url).status_code == 401
+        assert requests_mock.call_count == 1
+        self.tearDown()
+
+    def test_read_timeout_not_retried(self, requests_mock):
+        self.setUp()
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri(
+            'GET', url, exc=requests.exceptions.ReadTimeout)
+        with pytest.raises(TransportError):
+            self.transport.get(url)
+        assert requests_mock.call_count == 1
+        self.tearDown()
+
+    def test_rate_limiter_waits(self, requests_mock):
+        self.setUp()
+        waits = []
+        self.transport.limiter = RateLimiter(
+            limits={'api.statuspage.io': (1, 2)})
+        self.transport.limiter.sleep = waits.append
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri('GET', url, text='{}', status_code=200)
+        for _ in range(3):
+            self.transport.get(url)
+        assert len(waits) == 1
+        assert 0.9 < waits[0] <= 1
+        self.tearDown()
+
+    def test_error_details(self, requests_mock):
+        self.setUp()
+        url = 'https://api.statuspage.io/v1/ping'
+        requests_mock.register_uri(
+            'GET', url, text='<html>oops</html>', status_code=401)
+        r = self.transport.get(url)
+        assert HttpTransport.error_details(r) == '<html>oops</html>'
+        requests_mock.register_uri(
+            'GET', url, text='{"error": "nope"}', status_code=401)
+        r = self.transport.get(url)
+        assert HttpTransport.error_details(r) == {'error': 'nope'}
+        self.tearDown()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+from src.classes.incident_state import IncidentState
+from src.classes.records import IncidentEntry
+
+
+class TestIncidentState:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'incident_state.json')
+        self.state = IncidentState(self.file)
+        self.pageid = 'ra5h7xd8knxz'
+        self.snapshot = {
+            'p1x8v2k3m4n5': IncidentEntry(
+                updated_at='2024-06-19T09:12:44Z',
+                impact='major',
+                platform_name='US Platform 1',
+                product_name='VMDR')
+        }
+
+    def tearDown(self):
+        del self.state
+        del self.file
+
+    def test_diff_initial(self, tmp_path):
+        self.setUp(tmp_path)
+        diff = self.state.diff(self.pageid, {})
+        assert diff.initial is True
+        assert diff.is_empty() is False
+        self.tearDown()
+
+    def test_diff_unchanged(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.state.save(self.pageid, self.snapshot) is True
+        state = IncidentState(self.file)
+        diff = state.diff(self.pageid, self.snapshot)
+        assert diff.is_empty() is True
+        self.tearDown()
+
+    def test_diff_new_changed_resolved(self, tmp_path):
+        self.setUp(tmp_path)
+        self.state.save(self.pageid, self.snapshot)
+        changed = {
+            'p1x8v2k3m4n5': IncidentEntry(
+                updated_at='2024-06-19T09:30:00Z',
+                impact='major',
+                platform_name='US Platform 1',
+                product_name='VMDR'),
+            'z9y8x7w6v5u4': IncidentEntry.from_dict(
+                {'updated_at': '2024-06-19T09:31:00Z'})
+        }
+        diff = self.state.diff(self.pageid, changed)
+        assert list(diff.new) == ['z9y8x7w6v5u4']
+        assert list(diff.changed) == ['p1x8v2k3m4n5']
+        assert diff.resolved == {}
+
+        diff = IncidentState(self.file).diff(self.pageid, {})
+        assert diff.resolved == self.snapshot
+        assert diff.is_empty() is False
+        self.tearDown()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from src.classes.instance_lock import InstanceLock
+
+
+class TestInstanceLock:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'statustogeckod.lock')
+        self.first = InstanceLock(self.file, mode='skip')
+        self.second = InstanceLock(self.file, mode='skip', timeout=1)
+        self.second.sleep = lambda seconds: None
+
+    def tearDown(self):
+        self.second.release()
+        self.first.release()
+        del self.first
+        del self.second
+
+    def test_invalid_values(self, tmp_path):
+        file = str(tmp_path / 'lock')
+        with pytest.raises(ValueError):
+            InstanceLock('/some/fake/dir/lock')
+        with pytest.raises(ValueError):
+            InstanceLock(file, mode='steal')
+        with pytest.raises(ValueError):
+            InstanceLock(file, timeout=-1)
+        with pytest.raises(ValueError):
+            InstanceLock(file, stale_after=0)
+
+    def test_skip(self, tmp_path, caplog):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        with caplog.at_level(logging.INFO, logger='statustogeckod'):
+            assert self.second.acquire() is False
+        assert 'has held the lock for' in caplog.text
+        assert self.second.locked is False
+        self.tearDown()
+
+    def test_none(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        self.second.mode = 'none'
+        assert self.second.acquire() is True
+        assert self.second.locked is False
+        self.tearDown()
+
+    def test_wait(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        self.second.mode = 'wait'
+        self.second.sleep = lambda seconds: self.first.release()
+        assert self.second.acquire() is True
+        assert self.second.locked is True
+        self.tearDown()
+
+    def test_wait_timeout(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        self.second.mode = 'wait'
+        self.second.timeout = 0.05
+        assert self.second.acquire() is False
+        self.tearDown()
+
+    def test_previous_hold_logged(self, tmp_path, caplog):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        self.first.release()
+        holder = self.second.holder()
+        assert holder[2] is not None
+        with caplog.at_level(logging.INFO, logger='statustogeckod'):
+            assert self.second.acquire() is True
+        assert 'held the lock for' in caplog.text
+        self.tearDown()
+
+    def test_kill_stale(self, tmp_path):
+        self.setUp(tmp_path)
+        script = (
+            'import fcntl, os, sys, time\n'
+            'fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)\n'
+            'fcntl.flock(fd, fcntl.LOCK_EX)\n'
+            'os.write(fd, b"%d 0\\n" % os.getpid())\n'
+            'print("locked", flush=True)\n'
+            'time.sleep(60)\n')
+        child = subprocess.Popen(
+            [sys.executable, '-c', script, self.file],
+            stdout=subprocess.PIPE)
+        try:
+            assert child.stdout.readline() == b'locked\n'
+            assert self.first.acquire() is False
+            self.first.mode = 'kill-stale'
+            self.first.stale_after = 60
+            self.first.sleep = lambda seconds: child.poll()
+            assert self.first.acquire() is True
+            assert child.wait(timeout=5) != 0
+        finally:
+            if child.poll() is None:
+                child.kill()
+            child.wait()
+            child.stdout.close()
+        self.tearDown()
+
+    def test_heartbeat_keeps_holder_fresh(self, tmp_path, caplog):
+        self.setUp(tmp_path)
+        assert self.first.acquire() is True
+        self.first.acquired_at -= 600
+        self.first.heartbeat_every = 0
+        assert self.first.heartbeat() is True
+        holder = self.second.holder()
+        assert holder[2] is None
+        assert holder[1] == self.first.acquired_at
+        self.second.mode = 'kill-stale'
+        self.second.stale_after = 300
+        with caplog.at_level(logging.INFO, logger='statustogeckod'):
+            assert self.second.acquire() is False
+        assert 'not stale' in caplog.text
+        assert self.first.locked is True
+        self.tearDown()
+
+    def test_heartbeat_throttled(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.second.heartbeat() is False
+        assert self.first.acquire() is True
+        assert self.first.heartbeat() is False
+        self.tearDown()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.json_store import JsonStore
+
+
+class TestJsonStore:
+    def test_missing_directory(self):
+        with pytest.raises(ValueError):
+            JsonStore('/some/fake/dir/store.json')
+
+    def test_load_missing_file(self, tmp_path):
+        store = JsonStore(str(tmp_path / 'store.json'))
+        assert store.load() == {}
+
+    def test_load_not_json(self):
+        store = JsonStore('tests/data/not_yaml.yaml')
+        assert store.load() == {}
+
+    def test_load_not_a_dict(self, tmp_path):
+        file = tmp_path / 'store.json'
+        file.write_text('[1, 2, 3]')
+        store = JsonStore(str(file))
+        assert store.load() == {}
+
+    def test_save_and_load(self, tmp_path):
+        store = JsonStore(str(tmp_path / 'store.json'))
+        assert store.save({'a': 1}) is True
+        assert store.load() == {'a': 1}
+        assert [p.name for p in tmp_path.iterdir()] == ['store.json']
+
+    def test_save_not_serializable(self, tmp_path):
+        store = JsonStore(str(tmp_path / 'store.json'))
+        assert store.save({'a': object()}) is False
+        assert list(tmp_path.iterdir()) == []
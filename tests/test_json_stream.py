@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from src.classes.json_stream import JsonArrayStream
+
+
+class TestJsonArrayStream:
+    def setUp(self):
+        with open('tests/data/unresolved_incidents.json', 'rb') as file:
+            self.raw = file.read()
+        self.data = json.loads(self.raw)
+
+    def tearDown(self):
+        del self.raw
+        del self.data
+
+    def _chunks(self, raw, size):
+        return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+    def test_whole_body(self):
+        self.setUp()
+        assert list(JsonArrayStream([self.raw])) == self.data
+        self.tearDown()
+
+    def test_small_chunks(self):
+        self.setUp()
+        for size in (1, 7, 64):
+            chunks = self._chunks(self.raw, size)
+            assert list(JsonArrayStream(chunks)) == self.data
+        self.tearDown()
+
+    def test_strings_with_brackets_and_escapes(self):
+        data = [{'body': 'a \\"quoted\\" [bracket] {brace}', 'name': '☃'}]
+        raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        for size in (1, 3):
+            chunks = self._chunks(raw, size)
+            assert list(JsonArrayStream(chunks)) == data
+
+    def test_empty_array(self):
+        assert list(JsonArrayStream([b' [', b' ] '])) == []
+
+    def test_not_an_array(self):
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([b'{"error": "Invalid"}']))
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([b'[{"id": 1}, {"id"']))
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([]))
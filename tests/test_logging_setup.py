@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+import logging
+import logging.handlers
+import os
+import time
+
+from src.classes.logging_setup import (
+    EventDate, LoggingSetup, RecordFactory, get_hostname)
+
+
+class TestLoggingSetup:
+    def setUp(self, tmp_path):
+        self.log_file = tmp_path / 'test.log'
+        self.config_file = tmp_path / 'logging.conf'
+        self.config_file.write_text(f'''[loggers]
+keys=root,statustogeckod_test,urllib3
+
+[handlers]
+keys=fileHandler
+
+[formatters]
+keys=testFormatter
+
+[logger_root]
+level=NOTSET
+handlers=
+
+[logger_statustogeckod_test]
+level=INFO
+handlers=fileHandler
+qualname=statustogeckod_test
+propagate=0
+
+[logger_urllib3]
+level=WARNING
+handlers=
+qualname=urllib3
+propagate=1
+
+[handler_fileHandler]
+class=FileHandler
+formatter=testFormatter
+args=('{self.log_file}', 'a+')
+
+[formatter_testFormatter]
+format=%(levelname)s %(message)s
+class=logging.Formatter
+''')
+        self.cache_file = str(tmp_path / 'logging_conf.json')
+        self.setup = LoggingSetup(
+            str(self.config_file), self.cache_file, use_queue=False)
+        self.disabled = {
+            name: logger.disabled
+            for name, logger in logging.Logger.manager.loggerDict.items()
+            if isinstance(logger, logging.Logger)
+        }
+
+    def tearDown(self):
+        self.setup.stop()
+        for name, disabled in self.disabled.items():
+            logging.getLogger(name).disabled = disabled
+        logging.getLogger('urllib3').setLevel(logging.NOTSET)
+        logger = logging.getLogger('statustogeckod_test')
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+        del self.setup
+
+    def test_cold_then_cached(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.setup.configure() is False
+        cached = LoggingSetup(
+            str(self.config_file), self.cache_file, use_queue=False)
+        assert cached.configure()
+        logger = logging.getLogger('statustogeckod_test')
+        assert len(logger.handlers) == 1
+        assert logger.propagate is False
+        assert logger.level == logging.INFO
+        logger.info('hello')
+        logger.handlers[0].flush()
+        assert self.log_file.read_text() == 'INFO hello\n'
+        self.tearDown()
+
+    def test_lazy_urllib3_logger_is_quiet(self, tmp_path):
+        self.setUp(tmp_path)
+        for cold in (True, False):
+            logging.Logger.manager.loggerDict.pop(
+                'urllib3.lazy_test', None)
+            assert self.setup.configure() is not cold
+            logger = logging.getLogger('urllib3.lazy_test')
+            assert logger.isEnabledFor(logging.DEBUG) is False
+            assert logger.isEnabledFor(logging.WARNING) is True
+        self.tearDown()
+
+    def test_shipped_config_quiets_urllib3(self, tmp_path):
+        setup = LoggingSetup(
+            'src/configs/logging.conf', str(tmp_path / 'logging_conf.json'))
+        spec = setup._translate()
+        assert spec['loggers']['urllib3']['level'] == 'WARNING'
+
+    def test_cached_disables_existing_loggers(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.setup.configure() is False
+        stray = logging.getLogger('statustogeckod_stray')
+        child = logging.getLogger('statustogeckod_test.child')
+        assert self.setup.configure() is True
+        assert stray.disabled is True
+        assert child.disabled is False
+        self.tearDown()
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.setup.configure() is False
+        self.config_file.write_text(
+            self.config_file.read_text().replace('level=INFO', 'level=DEBUG'))
+        assert self.setup.configure() is False
+        logger = logging.getLogger('statustogeckod_test')
+        assert logger.level == logging.DEBUG
+        self.tearDown()
+
+    def test_corrupt_cache_falls_back(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.setup.configure() is False
+        cached = self.setup.store.load()
+        cached['spec']['handlers']['fileHandler']['class'] = 'NoSuchHandler'
+        self.setup.store.save(cached)
+        assert self.setup.configure() is False
+        logger = logging.getLogger('statustogeckod_test')
+        assert len(logger.handlers) == 1
+        self.tearDown()
+
+    def test_queue_handler(self, tmp_path):
+        self.setUp(tmp_path)
+        self.setup.use_queue = True
+        self.setup.configure()
+        logger = logging.getLogger('statustogeckod_test')
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        logger.info('queued')
+        logger.debug('dropped')
+        self.setup.stop()
+        assert self.log_file.read_text() == 'INFO queued\n'
+        assert isinstance(logger.handlers[0], logging.FileHandler)
+        self.tearDown()
+
+    def test_queue_reconfigure_stops_listener(self, tmp_path):
+        self.setUp(tmp_path)
+        self.setup.use_queue = True
+        self.setup.configure()
+        logger = logging.getLogger('statustogeckod_test')
+        listener = logger.handlers[0].listener
+        assert self.setup.configure()
+        assert listener._thread is None
+        assert logger.handlers[0].listener is not listener
+        assert len(logger.handlers) == 1
+        self.tearDown()
+
+    def test_rotating_handler_cached(self, tmp_path):
+        self.setUp(tmp_path)
+        self.config_file.write_text(self.config_file.read_text().replace(
+            'class=FileHandler',
+            'class=logging.handlers.RotatingFileHandler').replace(
+            "'a+')", "'a', 64, 2)"))
+        assert self.setup.configure() is False
+        cached = LoggingSetup(
+            str(self.config_file), self.cache_file, use_queue=False)
+        assert cached.configure()
+        logger = logging.getLogger('statustogeckod_test')
+        handler = logger.handlers[0]
+        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        assert handler.maxBytes == 64
+        assert handler.backupCount == 2
+        for _ in range(10):
+            logger.info('rotate me please')
+        assert (tmp_path / 'test.log.1').exists()
+        assert not (tmp_path / 'test.log.3').exists()
+        self.tearDown()
+
+
+class TestRecordFactory:
+    def setUp(self):
+        self.factory = RecordFactory(logging.LogRecord)
+
+    def tearDown(self):
+        del self.factory
+
+    def _record(self):
+        return self.factory(
+            'statustogeckod', logging.INFO, __file__, 1, 'hello', (), None)
+
+    def test_fields(self):
+        self.setUp()
+        record = self._record()
+        assert record.hostname == get_hostname()
+        assert record.pid == os.getpid()
+        assert record.program == 'statustogeckod'
+        expected = time.strftime(
+            '%Y-%m-%dT%H:%M:%SZ', time.localtime(record.created))
+        assert str(record.event_date) == expected
+        self.tearDown()
+
+    def test_event_date_formatted_lazily(self, monkeypatch):
+        self.setUp()
+        calls = []
+
+        def strftime(*args):
+            calls.append(args)
+            return 'formatted'
+        monkeypatch.setattr(time, 'strftime', strftime)
+        monkeypatch.setattr(EventDate, '_cache', (-1, ''))
+        record = self._record()
+        assert calls == []
+        formatter = logging.Formatter('%(event_date)s %(message)s')
+        assert formatter.format(record) == 'formatted hello'
+        assert len(calls) == 1
+        record.event_date = EventDate(1000.2)
+        assert formatter.format(record) == 'formatted hello'
+        record.event_date = EventDate(1000.7)
+        assert formatter.format(record) == 'formatted hello'
+        assert len(calls) == 2
+        self.tearDown()
+
+    def test_refresh_pid(self):
+        self.setUp()
+        self.factory.pid = -1
+        self.factory.refresh_pid()
+        assert self._record().pid == os.getpid()
+        self.tearDown()
+
+    def test_install_does_not_nest(self):
+        self.setUp()
+        original = logging.getLogRecordFactory()
+        try:
+            self.factory.install()
+            for _ in range(3):
+                RecordFactory().install()
+            assert logging.getLogRecordFactory().base is logging.LogRecord
+        finally:
+            logging.setLogRecordFactory(original)
+        self.tearDown()
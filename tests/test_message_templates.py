@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.message_templates import MessageTemplates
+
+
+class TestMessageTemplates:
+    def setUp(self):
+        self.templates = MessageTemplates('/some/fake/templates.yaml')
+
+    def tearDown(self):
+        del self.templates
+
+    def write(self, tmp_path, text):
+        file = tmp_path / 'templates.yaml'
+        file.write_text(text)
+        return str(file)
+
+    def test_missing_file_uses_defaults(self):
+        self.setUp()
+        assert self.templates.file == ''
+        assert self.templates.render('ok') == (
+            '<center style="background-color: green;">'
+            '<strong>OK</strong></center>')
+        self.tearDown()
+
+    def test_shipped_file_matches_defaults(self):
+        templates = MessageTemplates('src/configs/templates.yaml')
+        defaults = MessageTemplates('')
+        for status in defaults.templates:
+            assert templates.render(status, 'US Platform 1', 'VMDR', 'now') \
+                == defaults.render(status, 'US Platform 1', 'VMDR', 'now')
+
+    def test_unknown_status(self):
+        self.setUp()
+        assert self.templates.render('up', 'US Platform 1', 'VMDR') is False
+        self.tearDown()
+
+    def test_escaped(self):
+        self.setUp()
+        result = self.templates.render('down', 'EU <Platform>', 'A & B')
+        assert 'EU &lt;Platform&gt; - A &amp; B is' in result
+        self.tearDown()
+
+    def test_render_cached(self):
+        self.setUp()
+        first = self.templates.render('down', 'US Platform 1', 'VMDR')
+        second = self.templates.render('down', 'US Platform 1', 'VMDR')
+        assert first is second
+        info = self.templates.render.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        self.tearDown()
+
+    def test_override(self, tmp_path):
+        file = self.write(
+            tmp_path,
+            'templates:\n'
+            '  down: "<b>$product_name</b> on $platform_name"\n')
+        templates = MessageTemplates(file)
+        assert templates.file == file
+        assert templates.render('down', 'US Platform 1', 'VMDR') == (
+            '<b>VMDR</b> on US Platform 1')
+        assert templates.render('ok').startswith('<center')
+
+    def test_unknown_field(self, tmp_path):
+        file = self.write(tmp_path, 'templates:\n  down: "$incident"\n')
+        with pytest.raises(ValueError):
+            MessageTemplates(file)
+
+    def test_unknown_template(self, tmp_path):
+        file = self.write(tmp_path, 'templates:\n  up: "UP"\n')
+        with pytest.raises(ValueError):
+            MessageTemplates(file)
+
+    def test_invalid_file(self, tmp_path):
+        file = self.write(tmp_path, 'templates: some text\n')
+        with pytest.raises(ValueError):
+            MessageTemplates(file)
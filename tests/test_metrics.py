@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.metrics import Metrics, timed
+
+
+class Timed:
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    @timed('work')
+    def work(self, value):
+        return value * 2
+
+
+class TestMetrics:
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def tearDown(self):
+        del self.metrics
+
+    def test_unknown_metric(self):
+        self.setUp()
+        with pytest.raises(ValueError):
+            self.metrics.inc('no_such_metric')
+        with pytest.raises(ValueError):
+            self.metrics.inc('incidents')
+        self.tearDown()
+
+    def test_missing_textfile_directory(self):
+        with pytest.raises(ValueError):
+            Metrics(textfile='/some/fake/dir/metrics.prom')
+
+    def test_counter_and_gauge(self):
+        self.setUp()
+        self.metrics.inc('requests_total', host='a', code='200')
+        self.metrics.inc('requests_total', host='a', code='200')
+        self.metrics.set('incidents', 3, pageid='p1')
+        self.metrics.set('incidents', 1, pageid='p1')
+        assert self.metrics.get('requests_total', host='a', code='200') == 2
+        assert self.metrics.get('incidents', pageid='p1') == 1
+        text = self.metrics.render()
+        assert '# TYPE statustogeckod_requests_total counter' in text
+        assert 'statustogeckod_requests_total{code="200",host="a"} 2' in text
+        assert 'statustogeckod_incidents{pageid="p1"} 1' in text
+        self.tearDown()
+
+    def test_histogram(self):
+        self.setUp()
+        self.metrics.observe('payload_bytes', 100)
+        self.metrics.observe('payload_bytes', 2000)
+        self.metrics.observe('payload_bytes', 10 ** 9)
+        text = self.metrics.render()
+        assert 'statustogeckod_payload_bytes_bucket{le="256"} 1' in text
+        assert 'statustogeckod_payload_bytes_bucket{le="4096"} 2' in text
+        assert 'statustogeckod_payload_bytes_bucket{le="4194304"} 2' in text
+        assert 'statustogeckod_payload_bytes_bucket{le="+Inf"} 3' in text
+        assert 'statustogeckod_payload_bytes_count 3' in text
+        self.tearDown()
+
+    def test_label_escaping(self):
+        self.setUp()
+        self.metrics.set('incidents', 1, pageid='a"b\\c')
+        assert 'pageid="a\\"b\\\\c"' in self.metrics.render()
+        self.tearDown()
+
+    def test_timed(self):
+        self.setUp()
+        assert Timed(self.metrics).work(2) == 4
+        assert self.metrics.get('phase_duration_seconds', phase='work') == 1
+        self.tearDown()
+
+    def test_record_cycle(self):
+        self.setUp()
+        self.metrics.record_cycle(True, 0.2)
+        self.metrics.record_cycle(False, 0.3)
+        assert self.metrics.get('cycles_total', result='success') == 1
+        assert self.metrics.get('cycles_total', result='failure') == 1
+        assert self.metrics.get('cycle_duration_seconds') == 2
+        assert self.metrics.get('last_success_timestamp_seconds') > 0
+        self.tearDown()
+
+    def test_flush(self, tmp_path):
+        textfile = tmp_path / 'metrics.prom'
+        metrics = Metrics(textfile=str(textfile))
+        metrics.inc('cycles_total', result='success')
+        assert metrics.flush() is True
+        assert 'statustogeckod_cycles_total{result="success"} 1' in (
+            textfile.read_text())
+        assert Metrics().flush() is True
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import urllib.error
+import urllib.request
+
+from src.classes.metrics import Metrics
+from src.classes.metrics_server import MetricsServer
+
+
+class TestMetricsServer:
+    def setUp(self):
+        self.metrics = Metrics()
+        self.server = MetricsServer(self.metrics, host='127.0.0.1', port=0)
+        self.server.start()
+        host, port = self.server.server_address[:2]
+        self.url = f'http://{host}:{port}'
+
+    def tearDown(self):
+        self.server.stop()
+        del self.server
+
+    def test_metrics(self):
+        self.setUp()
+        self.metrics.inc('cycles_total', result='success')
+        with urllib.request.urlopen(f'{self.url}/metrics', timeout=5) as r:
+            assert r.status == 200
+            assert r.headers['Content-Type'].startswith('text/plain')
+            body = r.read().decode('utf-8')
+        assert 'statustogeckod_cycles_total{result="success"} 1' in body
+        self.tearDown()
+
+    def test_not_found(self):
+        self.setUp()
+        try:
+            urllib.request.urlopen(f'{self.url}/other', timeout=5)
+            code = 200
+        except urllib.error.HTTPError as e:
+            code = e.code
+        assert code == 404
+        self.tearDown()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.geckoboard import GeckboardApi
+from src.classes.payload_budget import PayloadBudget
+from src.classes.records import IncidentEntry
+
+
+class TestPayloadBudget:
+    def setUp(self, limit=16384):
+        self.geckoboard = GeckboardApi('tests/data/credentials.yaml')
+        self.budget = PayloadBudget(limit=limit)
+        self.outages = [
+            IncidentEntry(
+                None, 'major', f'US Platform {index % 3 + 1}',
+                f'Product {index}')
+            for index in range(300)
+        ]
+        self.recovered = [
+            IncidentEntry(None, 'major', 'EU Platform 1', 'VMDR')
+        ]
+
+    def tearDown(self):
+        del self.geckoboard
+        del self.budget
+        del self.outages
+        del self.recovered
+
+    def _messages(self, status, entries):
+        return [
+            self.geckoboard.build_msg(
+                status,
+                platform_name=entry.platform_name,
+                product_name=entry.product_name)
+            for entry in entries
+        ]
+
+    def _fit(self):
+        return self.budget.fit(
+            self.geckoboard,
+            '',
+            self._messages('DOWN', self.outages),
+            self._messages('RESOLVED', self.recovered),
+            self.outages,
+            self.recovered)
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            PayloadBudget(limit=0)
+
+    def test_group(self):
+        groups = PayloadBudget.group([
+            IncidentEntry(None, 'major', 'B', 'VMDR'),
+            IncidentEntry(None, 'major', 'A', 'VMDR'),
+            IncidentEntry(None, 'major', 'B', 'PC'),
+            IncidentEntry(None, 'major', 'B', 'PC')
+        ])
+        assert groups == {'B': {'VMDR', 'PC'}, 'A': {'VMDR'}}
+
+    def test_fits(self):
+        self.setUp(limit=1048576)
+        msg = self._fit()
+        assert msg.count('DOWN!') == 300
+        assert 'EU Platform 1 - VMDR is <strong>RESOLVED' in msg
+        assert self.geckoboard.metrics.get(
+            'payload_truncated_total', view='grouped') is None
+        self.tearDown()
+
+    def test_grouped(self):
+        self.setUp(limit=1024)
+        msg = self._fit()
+        assert 'US Platform 1: 100 products <strong>DOWN!' in msg
+        assert 'EU Platform 1: 1 product <strong>RESOLVED' in msg
+        assert self.geckoboard.payload_size(msg) <= 1024
+        assert self.geckoboard.metrics.get(
+            'payload_truncated_total', view='grouped') == 1
+        self.tearDown()
+
+    def test_summary(self):
+        self.setUp(limit=300)
+        msg = self._fit()
+        assert msg == (
+            '<center style="background-color: red;">'
+            '<strong>300 products DOWN</strong> across 3 platforms</center>')
+        assert self.geckoboard.metrics.get(
+            'payload_truncated_total', view='summary') == 1
+        self.tearDown()
+
+    def test_summary_without_outages(self):
+        self.setUp(limit=1)
+        head = self.geckoboard.build_msg('OK')
+        msg = self.budget.fit(
+            self.geckoboard,
+            head,
+            [],
+            self._messages('RESOLVED', self.recovered),
+            [],
+            self.recovered)
+        assert msg == head
+        self.tearDown()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+import time
+
+import pytest
+
+from src.classes.geckoboard import GeckboardApi
+from src.classes.push_coalescer import PushCoalescer
+from src.classes.push_state import PushState
+
+
+class TestPushCoalescer:
+    def setUp(self, requests_mock, window=60, code=200):
+        self.coalescer = PushCoalescer(window=window, max_delay=120)
+        self.geckoboards = [
+            GeckboardApi(
+                'tests/data/credentials.yaml',
+                widgetkey=widgetkey,
+                coalescer=self.coalescer)
+            for widgetkey in ['widget-a', 'widget-b']
+        ]
+        host = self.geckoboards[0].headers['Host']
+        self.urls = [
+            f'https://{host}/v1/send/{geckboard.widgetkey}'
+            for geckboard in self.geckoboards
+        ]
+        file = 'tests/data/push_to_widget.json'
+        if code != 200:
+            file = 'tests/data/geckoboard_401_response.json'
+        with open(file, 'r') as f:
+            data = f.read()
+        self.mocks = [
+            requests_mock.register_uri(
+                'POST', url, text=data, status_code=code)
+            for url in self.urls
+        ]
+
+    def tearDown(self):
+        self.coalescer.close()
+        del self.coalescer
+        del self.geckoboards
+        del self.urls
+        del self.mocks
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            PushCoalescer(window=-1)
+
+    def test_invalid_max_delay(self):
+        with pytest.raises(ValueError):
+            PushCoalescer(window=5, max_delay=1)
+
+    def test_burst_is_one_push(self, requests_mock):
+        self.setUp(requests_mock)
+        geckboard = self.geckoboards[0]
+        for index in range(20):
+            assert geckboard.push_to_widget(f'update {index}') is True
+        assert requests_mock.call_count == 0
+        assert self.coalescer.flush() is True
+        assert requests_mock.call_count == 1
+        payload = self.mocks[0].last_request.json()
+        assert payload['data']['item'][0]['text'] == 'update 19'
+        assert self.coalescer.metrics.get(
+            'pushes_coalesced_total', widgetkey='widget-a') == 19
+        self.tearDown()
+
+    def test_widgets_flushed_together(self, requests_mock):
+        self.setUp(requests_mock)
+        for geckboard in self.geckoboards:
+            geckboard.push_to_widget('first')
+            geckboard.push_to_widget('second')
+        assert self.coalescer.flush() is True
+        assert [mock.call_count for mock in self.mocks] == [1, 1]
+        assert self.coalescer.pending == {}
+        self.tearDown()
+
+    def test_window_elapsed(self, requests_mock):
+        self.setUp(requests_mock, window=0.05)
+        self.geckoboards[0].push_to_widget('msg')
+        deadline = time.monotonic() + 5
+        while self.mocks[0].call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.mocks[0].call_count == 1
+        self.tearDown()
+
+    def test_max_delay_caps_debounce(self, requests_mock):
+        self.setUp(requests_mock)
+        self.coalescer.window = 10
+        self.coalescer.max_delay = 10
+        self.geckoboards[0].push_to_widget('first')
+        self.coalescer.first_at -= 10
+        self.geckoboards[0].push_to_widget('second')
+        deadline = time.monotonic() + 5
+        while self.mocks[0].call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.mocks[0].call_count == 1
+        self.tearDown()
+
+    def test_no_window_pushes_immediately(self, requests_mock):
+        self.setUp(requests_mock, window=0)
+        assert self.geckoboards[0].push_to_widget('msg') is True
+        assert self.mocks[0].call_count == 1
+        assert self.coalescer.pending == {}
+        self.tearDown()
+
+    def test_failed_push_requeued(self, requests_mock):
+        self.setUp(requests_mock, code=401)
+        self.geckoboards[0].push_to_widget('msg')
+        assert self.coalescer.flush() is False
+        assert 'widget-a' in self.coalescer.pending
+        self.geckoboards[0].push_to_widget('newer')
+        assert self.coalescer.close() is False
+        assert self.coalescer.pending == {}
+        payload = self.mocks[0].last_request.json()
+        assert payload['data']['item'][0]['text'] == 'newer'
+        self.tearDown()
+
+    def test_change_back_while_queued(self, requests_mock, tmp_path):
+        self.setUp(requests_mock)
+        geckboard = self.geckoboards[0]
+        geckboard.push_state = PushState(
+            str(tmp_path / 'push_state.json'), refresh_interval=900)
+        geckboard.push_to_widget('B')
+        assert self.coalescer.flush() is True
+        geckboard.push_to_widget('A')
+        assert geckboard.push_to_widget('B') is True
+        assert self.coalescer.flush() is True
+        payload = self.mocks[0].last_request.json()
+        assert payload['data']['item'][0]['text'] == 'B'
+        assert geckboard.push_to_widget('B') is True
+        assert self.coalescer.pending == {}
+        assert self.mocks[0].call_count == 2
+        self.tearDown()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+import time
+
+import pytest
+
+from src.classes.push_state import PushState
+
+
+class TestPushState:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'push_state.json')
+        self.state = PushState(self.file, refresh_interval=60)
+        self.widgetkey = 'some-widget-key-goes-here'
+
+    def tearDown(self):
+        del self.state
+        del self.file
+
+    def test_invalid_refresh_interval(self, tmp_path):
+        with pytest.raises(ValueError):
+            PushState(str(tmp_path / 'state.json'), refresh_interval=-1)
+
+    def test_never_pushed(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.state.refresh_due(self.widgetkey) is True
+        assert self.state.is_unchanged(self.widgetkey, 'msg') is False
+        self.tearDown()
+
+    def test_record_survives_restart(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.state.record(self.widgetkey, 'msg') is True
+        state = PushState(self.file, refresh_interval=60)
+        assert state.is_unchanged(self.widgetkey, 'msg') is True
+        assert state.is_unchanged(self.widgetkey, 'other') is False
+        self.tearDown()
+
+    def test_forced_refresh(self, tmp_path):
+        self.setUp(tmp_path)
+        self.state.record(self.widgetkey, 'msg')
+        self.state.entries[self.widgetkey]['pushed_at'] = time.time() - 120
+        assert self.state.refresh_due(self.widgetkey) is True
+        assert self.state.is_unchanged(self.widgetkey, 'msg') is False
+        self.tearDown()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def setUp(self):
+        self.bucket = TokenBucket(rate=2, capacity=2)
+        self.bucket.updated = 0.0
+
+    def tearDown(self):
+        del self.bucket
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+    def test_burst_then_wait(self):
+        self.setUp()
+        assert self.bucket.reserve(now=0.0) == 0
+        assert self.bucket.reserve(now=0.0) == 0
+        assert self.bucket.reserve(now=0.0) == 0.5
+        assert self.bucket.reserve(now=0.0) == 1.0
+        assert self.bucket.reserve(max_wait=1, now=0.0) == -1
+        self.tearDown()
+
+    def test_refill(self):
+        self.setUp()
+        self.bucket.reserve(now=0.0)
+        self.bucket.reserve(now=0.0)
+        assert self.bucket.reserve(now=0.5) == 0
+        assert self.bucket.reserve(now=10.0) == 0
+        assert self.bucket.tokens == 1
+        self.tearDown()
+
+    def test_block(self):
+        self.setUp()
+        self.bucket.block(5, now=0.0)
+        assert self.bucket.reserve(now=1.0) == 4
+        self.tearDown()
+
+
+class TestRateLimiter:
+    def test_unlimited_host(self):
+        limiter = RateLimiter(limits={}, default=None)
+        assert limiter.acquire('example.com') == 0
+        assert limiter.bucket('example.com') is None
+
+    def test_shared_bucket_per_host(self):
+        limiter = RateLimiter(limits={'a': (1, 1)}, max_wait=5)
+        waits = []
+        limiter.sleep = waits.append
+        assert limiter.bucket('a') is limiter.bucket('a')
+        assert limiter.acquire('a') == 0
+        assert limiter.acquire('a') > 0
+        assert len(waits) == 1
+
+    def test_max_wait_exceeded(self):
+        limiter = RateLimiter(limits={'a': (1, 1)}, max_wait=0.1)
+        limiter.sleep = lambda seconds: None
+        assert limiter.acquire('a') == 0
+        assert limiter.acquire('a') == -1
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+import dataclasses
+import json
+
+import pytest
+
+from src.classes.records import Component, Incident, IncidentEntry, Platform
+
+
+class TestRecords:
+    def setUp(self):
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            self.data = json.load(file)[0]
+
+    def tearDown(self):
+        del self.data
+
+    def test_incident_from_dict(self):
+        self.setUp()
+        incident = Incident.from_dict(self.data)
+        assert incident.id == 'p1x8v2k3m4n5'
+        assert incident.status == 'investigating'
+        assert incident.impact == 'major'
+        assert incident.updated_at == '2024-06-19T09:12:44Z'
+        assert incident.components == (Component(
+            'Vulnerability Management, Detection and Response (VMDR)',
+            '401j1885m96y'),)
+        self.tearDown()
+
+    def test_incident_defaults(self):
+        incident = Incident.from_dict({'id': 'abc'})
+        assert incident.impact == 'none'
+        assert incident.components == ()
+
+    def test_names_are_interned(self):
+        self.setUp()
+        first = Incident.from_dict(self.data)
+        second = Incident.from_dict(json.loads(json.dumps(self.data)))
+        assert first.components[0].name is second.components[0].name
+        assert first.components[0].group_id is second.components[0].group_id
+        self.tearDown()
+
+    def test_slotted_and_frozen(self):
+        platform = Platform.from_dict({'id': '401j1885m96y', 'name': 'US 1'})
+        assert not hasattr(platform, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            platform.name = 'US 2'  # type: ignore
+
+    def test_incident_entry_round_trip(self):
+        snapshot = {
+            'p1x8v2k3m4n5': IncidentEntry(
+                '2024-06-19T09:12:44Z', 'major', 'US Platform 1', 'VMDR')
+        }
+        data = json.loads(json.dumps(IncidentEntry.dump(snapshot)))
+        assert data['p1x8v2k3m4n5']['platform_name'] == 'US Platform 1'
+        assert IncidentEntry.load(data) == snapshot
+        assert not hasattr(snapshot['p1x8v2k3m4n5'], '__dict__')
+
+    def test_incident_entry_defaults(self):
+        entry = IncidentEntry.from_dict({})
+        assert entry.updated_at is None
+        assert entry.impact == 'none'
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.classes.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy:
+    def setUp(self):
+        self.policy = RetryPolicy(max_retries=3, backoff=1, max_delay=10)
+
+    def tearDown(self):
+        del self.policy
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_retries=-1)
+        with pytest.raises(ValueError):
+            RetryPolicy(backoff=-1)
+        with pytest.raises(ValueError):
+            RetryPolicy(max_delay=-1)
+
+    def test_should_retry(self):
+        self.setUp()
+        assert self.policy.should_retry(0) is True
+        assert self.policy.should_retry(0, 429) is True
+        assert self.policy.should_retry(0, 404) is False
+        assert self.policy.should_retry(3, 503) is False
+        self.tearDown()
+
+    def test_backoff_capped(self):
+        self.setUp()
+        for attempt in range(10):
+            delay = self.policy.backoff_delay(attempt)
+            ceiling = min(10, 2 ** attempt)
+            assert ceiling / 2 <= delay <= ceiling
+        self.tearDown()
+
+    def test_retry_after_seconds_and_date(self):
+        self.setUp()
+        assert self.policy.server_delay({'Retry-After': '4'}) == 4
+        headers = {'Retry-After': 'Thu, 01 Jan 2026 00:00:10 GMT'}
+        assert self.policy.server_delay(headers, now=1767225600) == 10
+        assert self.policy.server_delay({'Retry-After': 'soon'}) is None
+        self.tearDown()
+
+    def test_rate_limit_headers(self):
+        self.setUp()
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '7'}
+        assert self.policy.server_delay(headers) == 7
+        headers = {
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': '1767225605'
+        }
+        assert self.policy.server_delay(headers, now=1767225600) == 5
+        headers = {'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': '7'}
+        assert self.policy.server_delay(headers) is None
+        self.tearDown()
+
+    def test_delay(self):
+        self.setUp()
+        assert self.policy.delay(0, {'Retry-After': '2'}) == 2
+        assert self.policy.delay(0, {'Retry-After': '60'}) is None
+        assert 0.5 <= self.policy.delay(0, {}) <= 1
+        self.tearDown()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+import time
+
+from src.classes.records import IncidentEntry
+from src.classes.snapshot_store import SnapshotStore
+
+
+class TestSnapshotStore:
+    def setUp(self, tmp_path):
+        self.file = str(tmp_path / 'last_known_good.json')
+        self.store = SnapshotStore(self.file)
+        self.pageid = 'kctbh9vrtdwd'
+        self.snapshot = {
+            'p1x8v2k3m4n5': IncidentEntry(
+                updated_at='2024-06-01T12:00:00Z',
+                impact='major',
+                platform_name='US Platform 1',
+                product_name='VMDR')
+        }
+
+    def tearDown(self):
+        del self.store
+        del self.file
+
+    def test_empty(self, tmp_path):
+        self.setUp(tmp_path)
+        assert self.store.get(self.pageid) is None
+        assert self.store.fetched_at(self.pageid) is None
+        self.tearDown()
+
+    def test_put_survives_restart(self, tmp_path):
+        self.setUp(tmp_path)
+        before = time.time()
+        assert self.store.put(self.pageid, self.snapshot) is True
+        store = SnapshotStore(self.file)
+        assert store.get(self.pageid) == self.snapshot
+        assert store.fetched_at(self.pageid) >= before
+        self.tearDown()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+import json
+
+from src.classes.circuit_breaker import CircuitBreaker
+from src.classes.geckoboard import GeckboardApi
+from src.classes.incident_state import IncidentState
+from src.classes.payload_budget import PayloadBudget
+from src.classes.status_cycle import StatusCycle
+from src.classes.snapshot_store import SnapshotStore
+from src.classes.statuspage_api import StatusPageApi
+
+
+class TestStatusCycle:
+    def setUp(self):
+        self.credentials_file = 'tests/data/credentials.yaml'
+        self.statuspage = StatusPageApi(self.credentials_file)
+        self.geckoboard = GeckboardApi(self.credentials_file)
+        self.cycle = StatusCycle(self.statuspage, self.geckoboard)
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        self.incidents_url = (
+            f'https://{host}/v1/pages/{pageid}/incidents/unresolved')
+        self.groups_url = f'https://{host}/v1/pages/{pageid}/component-groups'
+        widgetkey = self.geckoboard.widgetkey
+        host = self.geckoboard.headers['Host']
+        self.widget_url = f'https://{host}/v1/send/{widgetkey}'
+
+    def tearDown(self):
+        del self.cycle
+        del self.geckoboard
+        del self.statuspage
+        del self.credentials_file
+
+    def _register(self, requests_mock, incidents):
+        with open('tests/data/component_groups.json', 'r') as file:
+            groups = file.read()
+        with open('tests/data/push_to_widget.json', 'r') as file:
+            pushed = file.read()
+        requests_mock.register_uri(
+            'GET', self.incidents_url, text=incidents, status_code=200)
+        requests_mock.register_uri(
+            'GET', self.groups_url, text=groups, status_code=200)
+        return requests_mock.register_uri(
+            'POST', self.widget_url, text=pushed, status_code=200)
+
+    def test_run_failed_incidents(self, requests_mock):
+        self.setUp()
+        with open('tests/data/401_response.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET', self.incidents_url, text=data, status_code=401)
+        assert self.cycle.run() is False
+        self.tearDown()
+
+    def test_run_no_incidents(self, requests_mock):
+        self.setUp()
+        push = self._register(requests_mock, '[]')
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        payload = json.loads(push.last_request.text)
+        assert 'OK' in payload['data']['item'][0]['text']
+        self.tearDown()
+
+    def test_run_outage(self, requests_mock):
+        self.setUp()
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        payload = json.loads(push.last_request.text)
+        text = payload['data']['item'][0]['text']
+        assert 'US Platform 1 - Vulnerability Management' in text
+        assert 'DOWN!' in text
+        assert self.cycle.is_active() is True
+        self.tearDown()
+
+    def test_run_outage_over_budget(self, requests_mock):
+        self.setUp()
+        self.cycle.budget = PayloadBudget(limit=200)
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        payload = json.loads(push.last_request.text)
+        text = payload['data']['item'][0]['text']
+        assert text == (
+            '<span style="background-color: red;">US Platform 1: 1 product '
+            '<strong>DOWN!</strong></span>\n\n')
+        self.tearDown()
+
+    def test_run_maintenance_only(self, requests_mock):
+        self.setUp()
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        payload = json.loads(push.last_request.text)
+        assert 'OK' in payload['data']['item'][0]['text']
+        assert self.cycle.is_active() is False
+        self.tearDown()
+
+    def test_run_resolved_to_maintenance_only(self, requests_mock, tmp_path):
+        self.setUp()
+        self.cycle.incident_state = IncidentState(
+            str(tmp_path / 'incident_state.json'))
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            outage = file.read()
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            maintenance = file.read()
+        self._register(requests_mock, outage)
+        assert self.cycle.run() is True
+        push = self._register(requests_mock, maintenance)
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        text = json.loads(push.last_request.text)['data']['item'][0]['text']
+        assert 'OK' in text
+        assert 'US Platform 1 - Vulnerability Management' in text
+        assert 'RESOLVED' in text
+        assert 'DOWN!' not in text
+        self.tearDown()
+
+    def test_run_sequential(self, requests_mock):
+        self.setUp()
+        self.cycle.concurrent = False
+        push = self._register(requests_mock, '[]')
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        assert requests_mock.call_count == 2
+        self.tearDown()
+
+    def test_run_skips_unchanged(self, requests_mock, tmp_path):
+        self.setUp()
+        self.cycle.incident_state = IncidentState(
+            str(tmp_path / 'incident_state.json'))
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        self.tearDown()
+
+    def test_run_just_resolved(self, requests_mock, tmp_path):
+        self.setUp()
+        self.cycle.incident_state = IncidentState(
+            str(tmp_path / 'incident_state.json'))
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        push = self._register(requests_mock, '[]')
+        assert self.cycle.run() is True
+        assert push.call_count == 1
+        payload = json.loads(push.last_request.text)
+        text = payload['data']['item'][0]['text']
+        assert 'OK' in text
+        assert 'US Platform 1 - Vulnerability Management' in text
+        assert 'RESOLVED' in text
+        assert self.cycle.is_active() is True
+        assert self.cycle.run() is True
+        assert self.cycle.is_active() is False
+        self.tearDown()
+
+    def test_run_serves_last_known_good(self, requests_mock, tmp_path):
+        self.setUp()
+        self.cycle.breaker = CircuitBreaker(
+            str(tmp_path / 'circuit_breaker.json'),
+            failure_threshold=2,
+            reset_timeout=60)
+        self.cycle.last_good = SnapshotStore(
+            str(tmp_path / 'last_known_good.json'))
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incidents = file.read()
+        push = self._register(requests_mock, incidents)
+        assert self.cycle.run() is True
+        assert self.cycle.stale_since is None
+
+        with open('tests/data/401_response.json', 'r') as file:
+            data = file.read()
+        failed = requests_mock.register_uri(
+            'GET', self.incidents_url, text=data, status_code=401)
+        assert self.cycle.run() is True
+        assert self.cycle.stale_since is not None
+        assert push.call_count == 2
+        text = json.loads(push.last_request.text)['data']['item'][0]['text']
+        assert text.startswith('<center style="background-color: orange;">')
+        assert 'DATA STALE' in text
+        assert 'US Platform 1 - Vulnerability Management' in text
+        assert 'DOWN!' in text
+
+        assert self.cycle.run() is True
+        assert failed.call_count == 2
+        assert self.cycle.run() is True
+        assert failed.call_count == 2
+        self.tearDown()
+
+    def test_run_failed_without_last_known_good(
+            self, requests_mock, tmp_path):
+        self.setUp()
+        self.cycle.last_good = SnapshotStore(
+            str(tmp_path / 'last_known_good.json'))
+        with open('tests/data/401_response.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET', self.incidents_url, text=data, status_code=401)
+        assert self.cycle.run() is False
+        self.tearDown()
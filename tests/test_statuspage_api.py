@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
+import json
 import os
 
 import pytest
+import requests
 
+from src.classes.component_group_cache import ComponentGroupCache
+from src.classes.config_loader import ConfigLoader
+from src.classes.http_transport import HttpTransport
+from src.classes.records import Component, Incident, Platform
 from src.classes.statuspage_api import StatusPageApi
 
 
@@ -76,6 +82,12 @@ class TestStatusPageApi:
         assert self.statuspage.headers['Authorization'] == 'OAuth some-api-key-goes-here'
         self.tearDown()
 
+    def test_shared_transport(self):
+        transport = HttpTransport()
+        statuspage = StatusPageApi(
+            'tests/data/credentials.yaml', transport=transport)
+        assert statuspage.transport is transport
+
     def test_pageid(self):
         self.setUp()
         assert self.statuspage.pageid == 'ra5h7xd8knxz'
@@ -124,10 +136,57 @@ class TestStatusPageApi:
         result = self.statuspage.get_component_groups()
         assert result is True
         assert len(self.statuspage.platforms) == 2
-        platform = self.statuspage.platforms[0]
-        assert isinstance(platform, tuple)
-        assert platform[0] == '401j1885m96y'
-        assert platform[1] == 'US Platform 1'
+        assert isinstance(self.statuspage.platforms, dict)
+        platform = self.statuspage.platforms['401j1885m96y']
+        assert isinstance(platform, Platform)
+        assert platform.name == 'US Platform 1'
+        self.tearDown()
+
+    def test_platform_name(self):
+        self.setUp()
+        self.statuspage.platforms = {
+            '401j1885m96y': Platform('401j1885m96y', 'US Platform 1')
+        }
+        assert self.statuspage.platform_name('401j1885m96y') == 'US Platform 1'
+        assert self.statuspage.platform_name('unknown') == ''
+        assert self.statuspage.platform_name(None) == ''
+        self.tearDown()
+
+    def test_get_component_groups_from_cache(self, requests_mock, tmp_path):
+        self.setUp()
+        cache = ComponentGroupCache(str(tmp_path / 'groups.json'), ttl=60)
+        self.statuspage.cache = cache
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/component-groups'
+        url = f'https://{host}{endpoint}'
+        with open('tests/data/component_groups.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET', url, text=data, status_code=200, headers={'ETag': '"v1"'})
+        assert self.statuspage.get_component_groups() is True
+        assert self.statuspage.get_component_groups() is True
+        assert requests_mock.call_count == 1
+        assert len(self.statuspage.platforms) == 2
+        assert cache.validators(pageid) == {'If-None-Match': '"v1"'}
+        self.tearDown()
+
+    def test_get_component_groups_not_modified(self, requests_mock, tmp_path):
+        self.setUp()
+        cache = ComponentGroupCache(str(tmp_path / 'groups.json'), ttl=0)
+        pageid = self.statuspage.pageid
+        cache.put(
+            pageid,
+            [{'id': '401j1885m96y', 'name': 'US Platform 1'}],
+            etag='"v1"')
+        self.statuspage.cache = cache
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/component-groups'
+        url = f'https://{host}{endpoint}'
+        requests_mock.register_uri('GET', url, status_code=304)
+        assert self.statuspage.get_component_groups() is True
+        assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+        assert self.statuspage.platform_name('401j1885m96y') == 'US Platform 1'
         self.tearDown()
 
     def test_get_unresolved_incidents_failed_unauthenticated(
@@ -161,6 +220,37 @@ class TestStatusPageApi:
         assert len(self.statuspage.incidents) == 0
         self.tearDown()
 
+    def test_get_unresolved_incidents_failed_timeout(self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        url = f'https://{host}{endpoint}'
+        requests_mock.register_uri(
+            'GET', url, exc=requests.exceptions.ConnectTimeout)
+        delays = []
+        self.statuspage.transport.sleep = delays.append
+        result = self.statuspage.get_unresolved_incidents()
+        assert result is False
+        assert len(self.statuspage.incidents) == 0
+        assert requests_mock.call_count == 4
+        assert len(delays) == 3
+        self.tearDown()
+
+    def test_get_unresolved_incidents_error_body_not_json(
+            self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        url = f'https://{host}{endpoint}'
+        requests_mock.register_uri(
+            'GET', url, text='<html>Forbidden</html>', status_code=403)
+        result = self.statuspage.get_unresolved_incidents()
+        assert result is False
+        assert requests_mock.call_count == 1
+        self.tearDown()
+
     def test_get_unresolved_incidents(self, requests_mock):
         self.setUp()
         pageid = self.statuspage.pageid
@@ -175,7 +265,138 @@ class TestStatusPageApi:
         assert result is True
         assert len(self.statuspage.incidents) == 2
         incident = self.statuspage.incidents[0]
-        assert isinstance(incident, dict)
-        assert 'id' in incident.keys()
-        assert incident['id'] == 'ccjn0q5gtl8h'
+        assert isinstance(incident, Incident)
+        assert incident.id == 'ccjn0q5gtl8h'
+        metrics = self.statuspage.metrics
+        assert metrics.get('incidents', pageid=pageid) == 2
+        assert metrics.get(
+            'requests_total', host=host, method='GET', code='200') == 1
+        assert metrics.get('response_bytes', host=host) == 1
+        assert metrics.get(
+            'phase_duration_seconds', phase='get_unresolved_incidents') == 1
+        self.tearDown()
+
+    def test_get_unresolved_incidents_compact(self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        url = f'https://{host}{endpoint}'
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri('GET', url, text=data, status_code=200)
+        assert self.statuspage.get_unresolved_incidents() is True
+        incident = self.statuspage.incidents[1]
+        assert incident == Incident(
+            id='k6417c105wsb',
+            status='in_progress',
+            impact='maintenance',
+            updated_at='2024-06-18T15:00:02Z',
+            components=(
+                Component('Container Security (CS)', 'p56bnmtf4b8y'),
+            ))
         self.tearDown()
+
+    def test_get_unresolved_incidents_not_streamed(self, requests_mock):
+        self.setUp()
+        self.statuspage.stream = False
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        url = f'https://{host}{endpoint}'
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri('GET', url, text=data, status_code=200)
+        assert self.statuspage.get_unresolved_incidents() is True
+        assert self.statuspage.incidents[0].id == 'ccjn0q5gtl8h'
+        self.tearDown()
+
+    def test_get_unresolved_incidents_truncated(self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        url = f'https://{host}{endpoint}'
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET', url, text=data[:-10], status_code=200)
+        assert self.statuspage.get_unresolved_incidents() is False
+        assert len(self.statuspage.incidents) == 0
+        self.tearDown()
+
+    def test_get_incidents_with_platforms(self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        incidents_url = f'https://{host}{endpoint}'
+        groups_url = f'https://{host}/v1/pages/{pageid}/component-groups'
+        with open('tests/data/unresolved_incidents.json', 'r') as file:
+            incidents = file.read()
+        with open('tests/data/component_groups.json', 'r') as file:
+            groups = file.read()
+        requests_mock.register_uri(
+            'GET', incidents_url, text=incidents, status_code=200)
+        requests_mock.register_uri(
+            'GET', groups_url, text=groups, status_code=200)
+        result = self.statuspage.get_incidents_with_platforms()
+        assert result is True
+        assert len(self.statuspage.incidents) == 2
+        assert len(self.statuspage.platforms) == 2
+        assert requests_mock.call_count == 2
+        self.tearDown()
+
+    def test_get_incidents_with_platforms_no_incidents(self, requests_mock):
+        self.setUp()
+        pageid = self.statuspage.pageid
+        host = self.statuspage.headers['Host']
+        endpoint = f'/v1/pages/{pageid}/incidents/unresolved'
+        incidents_url = f'https://{host}{endpoint}'
+        groups_url = f'https://{host}/v1/pages/{pageid}/component-groups'
+        with open('tests/data/401_response.json', 'r') as file:
+            data = file.read()
+        requests_mock.register_uri(
+            'GET', incidents_url, text='[]', status_code=200)
+        requests_mock.register_uri(
+            'GET', groups_url, text=data, status_code=401)
+        result = self.statuspage.get_incidents_with_platforms()
+        assert result is True
+        assert len(self.statuspage.incidents) == 0
+        self.tearDown()
+
+    def test_apply_incident(self):
+        self.setUp()
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incident = json.load(file)[0]
+        assert self.statuspage.apply_incident(incident) is True
+        assert len(self.statuspage.incidents) == 1
+
+        update = {'id': incident['id'], 'status': 'identified'}
+        assert self.statuspage.apply_incident(update) is True
+        assert len(self.statuspage.incidents) == 1
+        applied = self.statuspage.incidents[0]
+        assert applied.status == 'identified'
+        assert applied.components == (Component(
+            'Vulnerability Management, Detection and Response (VMDR)',
+            '401j1885m96y'),)
+
+        update = {'id': incident['id'], 'status': 'resolved'}
+        assert self.statuspage.apply_incident(update) is True
+        assert len(self.statuspage.incidents) == 0
+        assert self.statuspage.apply_incident({'status': 'resolved'}) is False
+        self.tearDown()
+
+    def test_config(self):
+        config = ConfigLoader('tests/data/credentials.yaml')
+        statuspage = StatusPageApi(config=config.statuspage)
+        assert statuspage.credentials_file == config.credentials_file
+        assert statuspage.pageid == 'ra5h7xd8knxz'
+        assert statuspage.headers['Host'] == 'api.statuspage.io'
+
+    def test_apply_config_keeps_pageid_override(self):
+        config = ConfigLoader('tests/data/credentials.yaml')
+        statuspage = StatusPageApi(
+            config=config.statuspage, pageid='10ycvtr1341m')
+        statuspage.apply_config(config.statuspage)
+        assert statuspage.pageid == '10ycvtr1341m'
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.classes.geckoboard import GeckboardApi
+from src.classes.records import Platform
+from src.classes.status_cycle import StatusCycle
+from src.classes.statuspage_api import StatusPageApi
+from src.classes.webhook_server import WebhookServer
+
+
+class TestWebhookServer:
+    def setUp(self, requests_mock):
+        self.credentials_file = 'tests/data/credentials.yaml'
+        self.statuspage = StatusPageApi(self.credentials_file)
+        self.geckoboard = GeckboardApi(self.credentials_file)
+        self.statuspage.platforms = {
+            '401j1885m96y': Platform('401j1885m96y', 'US Platform 1')
+        }
+        cycle = StatusCycle(self.statuspage, self.geckoboard)
+        self.server = WebhookServer(
+            cycle, host='127.0.0.1', port=0, token='secret')
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address[:2]
+        self.url = f'http://{host}:{port}/webhook/secret'
+        widgetkey = self.geckoboard.widgetkey
+        with open('tests/data/push_to_widget.json', 'r') as file:
+            data = file.read()
+        self.push = requests_mock.register_uri(
+            'POST',
+            f'https://push.geckoboard.com/v1/send/{widgetkey}',
+            text=data,
+            status_code=200)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        del self.server
+
+    def _send(self, payload, url=None) -> int:
+        data = payload if isinstance(payload, bytes) else json.dumps(
+            payload).encode('utf-8')
+        request = urllib.request.Request(
+            url or self.url,
+            data=data,
+            headers={'Content-Type': 'application/json'},
+            method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def _incident(self, status):
+        with open('tests/data/outage_incidents.json', 'r') as file:
+            incident = json.load(file)[0]
+        incident['status'] = status
+        return {'page': {'id': self.statuspage.pageid}, 'incident': incident}
+
+    def test_wrong_path(self, requests_mock):
+        self.setUp(requests_mock)
+        url = self.url.replace('/secret', '/wrong')
+        assert self._send(self._incident('investigating'), url) == 404
+        assert self.push.call_count == 0
+        self.tearDown()
+
+    def test_not_json(self, requests_mock):
+        self.setUp(requests_mock)
+        assert self._send(b'not json') == 400
+        assert self._send({'meta': {}}) == 400
+        self.tearDown()
+
+    def test_malformed_page(self, requests_mock):
+        self.setUp(requests_mock)
+        for page in ('somepage', ['somepage']):
+            payload = self._incident('investigating')
+            payload['page'] = page
+            assert self._send(payload) == 400
+        assert self.push.call_count == 0
+        self.tearDown()
+
+    def test_other_page_ignored(self, requests_mock):
+        self.setUp(requests_mock)
+        payload = self._incident('investigating')
+        payload['page']['id'] = 'someotherpage'
+        assert self._send(payload) == 202
+        assert self.push.call_count == 0
+        self.tearDown()
+
+    def test_incident_pushed_then_resolved(self, requests_mock):
+        self.setUp(requests_mock)
+        assert self._send(self._incident('investigating')) == 204
+        assert len(self.statuspage.incidents) == 1
+        text = json.loads(self.push.last_request.text)
+        text = text['data']['item'][0]['text']
+        assert 'US Platform 1 - Vulnerability Management' in text
+        assert 'DOWN!' in text
+
+        assert self._send(self._incident('resolved')) == 204
+        assert len(self.statuspage.incidents) == 0
+        text = json.loads(self.push.last_request.text)
+        assert 'OK' in text['data']['item'][0]['text']
+        assert self.push.call_count == 2
+        self.tearDown()
+
+    def test_token_required_off_loopback(self):
+        statuspage = StatusPageApi('tests/data/credentials.yaml')
+        geckoboard = GeckboardApi('tests/data/credentials.yaml')
+        cycle = StatusCycle(statuspage, geckoboard)
+        with pytest.raises(ValueError):
+            WebhookServer(cycle, host='0.0.0.0', port=0)
+        server = WebhookServer(cycle, host='127.0.0.1', port=0)
+        assert server.webhook_path == '/webhook'
+        server.server_close()
+
+    def test_is_loopback(self):
+        assert WebhookServer.is_loopback('127.0.0.1') is True
+        assert WebhookServer.is_loopback('::1') is True
+        assert WebhookServer.is_loopback('localhost') is True
+        assert WebhookServer.is_loopback('0.0.0.0') is False
+        assert WebhookServer.is_loopback('office.example.com') is False